@@ -0,0 +1,229 @@
+"""
+분석 API 승인 제어 (과부하 시 앞단에서 429 + Retry-After로 거절)
+
+업로드 저장 / AI 호출 / 영상 분석 큐까지 들어간 뒤 타임아웃으로 실패하지 않도록
+인증 직후, 본문 파싱 전에 다음을 확인한다.
+    1. 엔드포인트 종류(admission_scope)별 사용자 토큰 버킷
+    2. 뒤쪽 대기열(AI 호출 레인, 영상 분석 큐)이 밀려 있는지
+    3. 사용자별 / 전체 동시 처리 요청 수
+
+ASGI에서는 Django가 요청 본문을 다 받은 뒤 뷰를 호출하므로 본문 수신 비용은 줄지 않는다.
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache as default_cache
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import BaseThrottle
+
+from config.metrics import ADMISSION_IN_FLIGHT, ADMISSION_REJECTIONS
+from detection.dispatch import get_ai_dispatcher
+
+
+class AdmissionRejected(Throttled):
+    """429 + Retry-After (DRF 예외 처리기가 wait로 헤더를 붙임)"""
+
+    default_detail = '요청이 많습니다. 잠시 후 다시 시도해주세요.'
+    extra_detail_singular = '{wait}초 후 다시 시도할 수 있습니다.'
+    extra_detail_plural = '{wait}초 후 다시 시도할 수 있습니다.'
+
+
+# 같은 버킷을 프로세스 안에서 동시에 갱신하지 않도록 (키 해시로 나눈 잠금)
+_bucket_locks = [threading.Lock() for _ in range(64)]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    엔드포인트 종류(view.admission_scope)별 사용자 토큰 버킷
+
+    ADMISSION_RATE_LIMITS[scope] = {'rate': 초당 보충 토큰 수, 'burst': 최대 토큰 수}
+    요청마다 토큰 1개를 쓰고, 토큰이 없으면 다음 토큰이 찰 때까지의 시간을 Retry-After로 돌려준다.
+
+    버킷 상태(남은 토큰, 갱신 시각)는 Django 캐시에 저장하고, 읽고 쓰는 동안
+    프로세스 안에서는 threading.Lock, 프로세스 간에는 cache.add로 잡는 키별 잠금을 건다.
+    전체 워커에 하나의 제한을 적용하려면 CACHES에 Redis / Memcached 같은 공유 캐시가 필요하다
+    (기본 LocMemCache는 프로세스마다 따로라서 워커별 제한이 된다).
+    """
+
+    cache = default_cache
+    cache_format = 'admission:bucket:%(scope)s:%(ident)s'
+    lock_timeout = 2  # 잠금을 잡은 프로세스가 죽어도 풀리는 시간 (초)
+    lock_wait = 0.5  # 잠금을 기다리는 최대 시간 (초, 넘기면 잠금 없이 진행)
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, 'admission_scope', None)
+        limits = settings.ADMISSION_RATE_LIMITS.get(self.scope)
+        if limits is None:
+            return True
+
+        self.rate = limits['rate']
+        burst = limits['burst']
+        ident = request.user.pk if request.user.is_authenticated else self.get_ident(request)
+        key = self.cache_format % {'scope': self.scope, 'ident': ident}
+
+        with self._locked(key):
+            now = time.time()
+            tokens, updated_at = self.cache.get(key, (burst, now))
+            tokens = min(burst, tokens + max(now - updated_at, 0) * self.rate)
+
+            if tokens < 1:
+                self.missing = 1 - tokens
+                ADMISSION_REJECTIONS.labels(scope=self.scope, reason='rate_limit').inc()
+                return False
+
+            # 버킷이 가득 찰 시간이 지나면 만료 (가득 찬 버킷과 같음)
+            self.cache.set(key, (tokens - 1, now), math.ceil(burst / self.rate))
+        return True
+
+    def wait(self):
+        return self.missing / self.rate
+
+    @contextmanager
+    def _locked(self, key):
+        lock_key = f'{key}:lock'
+        with _bucket_locks[hash(key) % len(_bucket_locks)]:
+            deadline = time.monotonic() + self.lock_wait
+            acquired = self.cache.add(lock_key, 1, self.lock_timeout)
+            while not acquired and time.monotonic() < deadline:
+                time.sleep(0.005)
+                acquired = self.cache.add(lock_key, 1, self.lock_timeout)
+            try:
+                yield
+            finally:
+                if acquired:
+                    self.cache.delete(lock_key)
+
+
+class AdmissionController:
+    """사용자별 / 전체 동시 처리 중인 분석 요청 수 (프로세스 내)"""
+
+    def __init__(self, max_in_flight=None, max_in_flight_per_user=None):
+        self.max_in_flight = max_in_flight or settings.ADMISSION_MAX_IN_FLIGHT
+        self.max_in_flight_per_user = max_in_flight_per_user or settings.ADMISSION_MAX_IN_FLIGHT_PER_USER
+
+        self._lock = threading.Lock()
+        self._per_user = {}
+        self.in_flight = 0
+
+    def try_acquire(self, user_id):
+        """
+        처리 자리 1개 점유
+
+        Returns:
+            str: 거절 사유 ('global_concurrency' / 'user_concurrency'), 점유했으면 None
+        """
+        with self._lock:
+            if self.in_flight >= self.max_in_flight:
+                return 'global_concurrency'
+            if self._per_user.get(user_id, 0) >= self.max_in_flight_per_user:
+                return 'user_concurrency'
+
+            self.in_flight += 1
+            self._per_user[user_id] = self._per_user.get(user_id, 0) + 1
+
+        ADMISSION_IN_FLIGHT.inc()
+        return None
+
+    def release(self, user_id):
+        with self._lock:
+            self.in_flight -= 1
+            remaining = self._per_user.pop(user_id) - 1
+            if remaining:
+                self._per_user[user_id] = remaining
+
+        ADMISSION_IN_FLIGHT.dec()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'max_in_flight': self.max_in_flight,
+                'max_in_flight_per_user': self.max_in_flight_per_user,
+                'in_flight': self.in_flight,
+                'users': len(self._per_user),
+            }
+
+
+_controller = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller():
+    """프로세스 전역 승인 제어 반환"""
+    global _controller
+
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                _controller = AdmissionController()
+    return _controller
+
+
+class AdmissionControlMixin:
+    """
+    분석 APIView 승인 제어 Mixin (StreamingUploadMixin보다 앞에 둔다)
+
+    admission_scope: 토큰 버킷 종류 (ADMISSION_RATE_LIMITS 키)
+    admission_lane: 대기열 확인에 쓰는 AI 호출 레인 (AI_DISPATCH_LANES 키)
+
+    대기열 기준이 다른 뷰(영상 분석 큐 등)는 is_saturated / estimate_wait를 재정의한다.
+    """
+
+    admission_scope = None
+    admission_lane = None
+    throttle_classes = [TokenBucketThrottle]
+
+    def initial(self, request, *args, **kwargs):
+        self.admission_user_id = None
+        super().initial(request, *args, **kwargs)
+        self.check_admission(request)
+
+    def check_admission(self, request):
+        """대기열 / 동시 처리 수 확인 후 자리 점유 (거절 시 AdmissionRejected)"""
+        if self.is_saturated():
+            self.reject('saturated')
+
+        reason = get_admission_controller().try_acquire(request.user.pk)
+        if reason is not None:
+            self.reject(reason)
+        self.admission_user_id = request.user.pk
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        self.release_admission()
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def cancel_request(self, request):
+        self.release_admission()
+        super().cancel_request(request)
+
+    def release_admission(self):
+        """점유한 처리 자리 반납 (응답 마무리 / 요청 취소 중 먼저 오는 쪽에서 한 번만)"""
+        if getattr(self, 'admission_user_id', None) is not None:
+            get_admission_controller().release(self.admission_user_id)
+            self.admission_user_id = None
+
+    def throttled(self, request, wait):
+        raise AdmissionRejected(wait=wait)
+
+    def reject(self, reason):
+        ADMISSION_REJECTIONS.labels(scope=self.admission_scope, reason=reason).inc()
+        wait = self.estimate_wait() or 1
+        raise AdmissionRejected(wait=min(max(wait, 1), settings.ADMISSION_MAX_RETRY_AFTER))
+
+    def is_saturated(self):
+        """AI 호출 레인 대기 요청이 레인 동시 호출 상한의 ADMISSION_QUEUE_FACTOR배 이상이면 포화"""
+        if self.admission_lane is None:
+            return False
+
+        dispatcher = get_ai_dispatcher()
+        limit = dispatcher.lanes[self.admission_lane].max_concurrency * settings.ADMISSION_QUEUE_FACTOR
+        return dispatcher.queued(self.admission_lane) >= limit
+
+    def estimate_wait(self):
+        """Retry-After로 쓸 예상 대기 시간 (초, 모르면 None)"""
+        if self.admission_lane is None:
+            return None
+        return get_ai_dispatcher().estimated_wait(self.admission_lane)
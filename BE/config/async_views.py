@@ -0,0 +1,67 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    async 핸들러(async def post ...)를 쓰는 APIView
+
+    DRF APIView.dispatch는 동기 함수라서 핸들러를 await 할 수 없으므로 dispatch만 async로 바꾼다.
+    인증·권한 확인(initial)과 응답 마무리(finalize_response)는 DB/파일을 다루므로 스레드에서 실행하고,
+    핸들러는 AI 서버 응답을 기다리는 동안 이벤트 루프를 양보한다.
+
+    ASGI(config.asgi)로 실행해야 효과가 있다. WSGI에서는 Django가 요청마다 이벤트 루프를 만들어 실행한다.
+    핸들러 안의 ORM / 파일 작업은 sync_to_async로 감싼다 (request.data 파싱 포함).
+
+    ASGI에서는 Django가 요청 본문 전체를 임시 파일로 먼저 받아 둔 뒤 뷰를 실행하므로
+    StreamingUploadMixin의 단일 패스 저장이 유지되지 않는다 (uploadhandlers 참고).
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if hasattr(response, '__await__'):
+                response = await response
+
+        except asyncio.CancelledError:
+            # ✅ 클라이언트 연결이 끊겨 취소되면 finalize_response를 거치지 않으므로 정리 후 다시 전달
+            self.cancel_request(request)
+            raise
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = await sync_to_async(self.finalize_response)(
+            request, response, *args, **kwargs
+        )
+        return self.response
+
+    def cancel_request(self, request):
+        """
+        취소된 요청 정리 (승인 자리 반납, 임시 업로드 삭제 등은 Mixin에서 재정의)
+
+        이벤트 루프에서 바로 실행되므로 DB 조회처럼 오래 걸리는 작업은 하지 않는다.
+        """
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+    @staticmethod
+    async def get_request_data(request):
+        """request.data (본문 파싱·업로드 핸들러 실행은 스레드에서)"""
+        return await sync_to_async(lambda: request.data)()
@@ -0,0 +1,204 @@
+"""
+Prometheus 지표
+
+gunicorn처럼 워커 프로세스가 여러 개면 PROMETHEUS_MULTIPROC_DIR 환경변수를 지정해야 한다
+(gunicorn.conf.py가 설정). 각 프로세스가 그 디렉토리의 mmap 파일에 기록하고, /metrics는
+모든 프로세스 값을 합쳐서 보여준다. 환경변수가 없으면 현재 프로세스 값만 보여준다.
+"""
+
+import hmac
+import os
+import time
+from contextlib import contextmanager
+
+import httpx
+import requests
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# AI 추론은 수백 ms ~ 수 분 (영상/보호)
+AI_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+AI_REQUEST_SECONDS = Histogram(
+    'imreal_ai_request_seconds',
+    'AI 서버 호출 지연 시간 (초)',
+    ['service', 'route', 'model_version', 'outcome'],
+    buckets=AI_LATENCY_BUCKETS
+)
+AI_ERRORS = Counter(
+    'imreal_ai_errors_total',
+    'AI 서버 호출 실패 수',
+    ['service', 'route', 'reason']
+)
+AI_MOCK_FALLBACKS = Counter(
+    'imreal_ai_mock_fallbacks_total',
+    'AI 서버를 쓸 수 없어 Mock 응답을 반환한 수',
+    ['service', 'kind']
+)
+AI_IN_FLIGHT = Gauge(
+    'imreal_ai_requests_in_flight',
+    '응답을 기다리는 AI 서버 호출 수',
+    ['service'],
+    multiprocess_mode='livesum'
+)
+AI_HEDGED_REQUESTS = Counter(
+    'imreal_ai_hedged_requests_total',
+    '헤지 요청 수 (sent: 보냄, won: 헤지 응답을 사용함)',
+    ['route', 'result']
+)
+AI_LANE_QUEUE_DEPTH = Gauge(
+    'imreal_ai_lane_queue_depth',
+    'AI 호출 차례를 기다리는 요청 수 (우선순위 레인별)',
+    ['lane'],
+    multiprocess_mode='livesum'
+)
+AI_LANE_IN_FLIGHT = Gauge(
+    'imreal_ai_lane_in_flight',
+    '차례를 받아 AI 서버를 호출 중인 요청 수 (우선순위 레인별)',
+    ['lane'],
+    multiprocess_mode='livesum'
+)
+AI_LANE_WAIT_SECONDS = Histogram(
+    'imreal_ai_lane_wait_seconds',
+    'AI 호출 차례를 기다린 시간 (초)',
+    ['lane'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+)
+AI_LANE_SLO_MISSES = Counter(
+    'imreal_ai_lane_slo_misses_total',
+    '대기 시간이 레인 SLO를 넘긴 요청 수',
+    ['lane']
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    'imreal_admission_in_flight',
+    '승인되어 처리 중인 분석 요청 수',
+    multiprocess_mode='livesum'
+)
+ADMISSION_REJECTIONS = Counter(
+    'imreal_admission_rejections_total',
+    '429로 거절한 분석 요청 수',
+    ['scope', 'reason']
+)
+VIDEO_QUEUE_JOBS = Gauge(
+    'imreal_video_analysis_queue_jobs',
+    '영상 분석 큐의 대기 + 처리 중 작업 수',
+    multiprocess_mode='livesum'
+)
+UPLOAD_BYTES = Counter(
+    'imreal_upload_bytes_total',
+    '저장한 업로드 파일 크기 (bytes)',
+    ['purpose', 'file_type']
+)
+SYSTEM_LOG_DROPPED = Counter(
+    'imreal_system_log_dropped_total',
+    '버퍼가 가득 찼거나 저장에 실패해 버린 SystemLog 수'
+)
+
+
+def _error_reason(exc):
+    """실패 사유 라벨 (HTTP 상태 코드 / timeout / 예외 이름)"""
+    response = getattr(exc, 'response', None)
+    if response is not None:
+        return str(response.status_code)
+    if isinstance(exc, (requests.exceptions.Timeout, httpx.TimeoutException)):
+        return 'timeout'
+    return type(exc).__name__
+
+
+class _AICall:
+    model_version = None
+
+
+@contextmanager
+def observe_ai_call(service, route):
+    """
+    AI 서버 호출 1회의 지연 / 실패 / 동시 호출 수 기록
+
+    with observe_ai_call('detection', '/api/analyze/image') as call:
+        response = ...
+        response.raise_for_status()
+        call.model_version = response.json().get('model_version')
+
+    블록 안에서 예외가 나면 실패로 기록하고 예외는 그대로 전달한다.
+    sync / async 코드 모두 사용 가능 (async에서는 await를 블록 안에 둔다).
+    """
+    call = _AICall()
+    in_flight = AI_IN_FLIGHT.labels(service=service)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield call
+    except Exception as e:
+        AI_ERRORS.labels(service=service, route=route, reason=_error_reason(e)).inc()
+        AI_REQUEST_SECONDS.labels(
+            service=service, route=route, model_version='unknown', outcome='error'
+        ).observe(time.perf_counter() - start)
+        raise
+    else:
+        AI_REQUEST_SECONDS.labels(
+            service=service, route=route, model_version=call.model_version or 'unknown', outcome='success'
+        ).observe(time.perf_counter() - start)
+    finally:
+        in_flight.dec()
+
+
+def record_mock_fallback(service, kind, count=1):
+    AI_MOCK_FALLBACKS.labels(service=service, kind=kind).inc(count)
+
+
+def record_upload(purpose, file_type, size):
+    UPLOAD_BYTES.labels(purpose=purpose, file_type=file_type).inc(size)
+
+
+# ============================================
+# /metrics
+# ============================================
+def get_metrics_registry():
+    """멀티프로세스 모드면 모든 워커 값을 합치는 레지스트리, 아니면 기본 레지스트리"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def _can_view_metrics(request):
+    token = settings.METRICS_AUTH_TOKEN
+    if token:
+        provided = request.headers.get('Authorization', '').removeprefix('Bearer ')
+        if hmac.compare_digest(provided, token):
+            return True
+
+    # 프록시 뒤라면 REMOTE_ADDR은 프록시 주소이므로 허용 목록에 프록시를 넣지 않는다
+    if request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS:
+        return True
+
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_active and user.is_staff)
+
+
+def metrics_view(request):
+    """
+    Prometheus 텍스트 형식 지표
+
+    기본은 관리자(스태프) 로그인 세션만 조회할 수 있다. 스크레이퍼는
+    METRICS_AUTH_TOKEN(Authorization: Bearer <token>) 또는 METRICS_ALLOWED_IPS로 허용한다.
+    """
+    if not _can_view_metrics(request):
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        generate_latest(get_metrics_registry()),
+        content_type=CONTENT_TYPE_LATEST
+    )
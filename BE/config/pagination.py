@@ -0,0 +1,159 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError as APIValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    키셋(커서) 페이지네이션
+
+    OFFSET 대신 마지막으로 본 행의 (정렬 필드, PK) 값을 커서로 넘겨
+    `정렬 필드 < 값 OR (정렬 필드 = 값 AND PK < pk)` 조건으로 다음 페이지를 찾는다.
+    (user, -created_at) 같은 기존 인덱스를 그대로 타므로 몇 번째 페이지든 비용이 같다.
+    (InnoDB 보조 인덱스에는 PK가 포함되어 있어 PK 동률 처리도 인덱스 안에서 끝남)
+
+    - 정렬 필드: 뷰의 keyset_field, 없으면 모델 Meta.ordering의 첫 필드 (내림차순)
+    - ?cursor=...: next / previous 링크의 커서
+    - ?count=false: 전체 개수(COUNT(*)) 계산 생략 (count는 null)
+    - ?page=N: 더 이상 지원하지 않음 (400, next / previous 링크의 cursor 사용)
+
+    응답 형식은 PageNumberPagination과 같다 (count, next, previous, results).
+    """
+
+    cursor_query_param = 'cursor'
+    page_query_param = 'page'
+    count_query_param = 'count'
+    page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self._reject_page_number(request)
+        self.base_url = request.build_absolute_uri()
+
+        field = getattr(view, 'keyset_field', None) or queryset.model._meta.ordering[0]
+        self.field = field.lstrip('-')
+        self.pk_name = queryset.model._meta.pk.name
+        self.model_field = queryset.model._meta.get_field(self.field)
+
+        # 전체 개수는 필터만 적용한 쿼리로 (커서 조건 적용 전)
+        self.count = queryset.count() if self._include_count(request) else None
+
+        cursor = self._decode_cursor(request)
+        reverse = cursor is not None and cursor['reverse']
+
+        if cursor is not None:
+            value, pk = cursor['value'], cursor['pk']
+            if reverse:
+                # 이전 페이지: 커서보다 최신인 행을 오래된 순으로 가져와 뒤집음
+                queryset = queryset.filter(
+                    Q(**{f'{self.field}__gt': value}) |
+                    Q(**{self.field: value, f'{self.pk_name}__gt': pk})
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(**{f'{self.field}__lt': value}) |
+                    Q(**{self.field: value, f'{self.pk_name}__lt': pk})
+                )
+
+        if reverse:
+            queryset = queryset.order_by(self.field, self.pk_name)
+        else:
+            queryset = queryset.order_by(f'-{self.field}', f'-{self.pk_name}')
+
+        # 한 개 더 읽어 다음 페이지 존재 여부 확인
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'nullable': True},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # 마지막 페이지 뒤로 넘어온 경우 첫 페이지로
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._build_link(self.page[0], reverse=True)
+
+    def _reject_page_number(self, request):
+        # ✅ 예전 PageNumberPagination 요청이 조용히 첫 페이지만 받지 않도록
+        if self.page_query_param in request.query_params:
+            raise APIValidationError({
+                self.page_query_param: [
+                    f'page 파라미터는 더 이상 지원하지 않습니다. '
+                    f'응답의 next / previous 링크({self.cursor_query_param} 파라미터)를 사용하세요.'
+                ]
+            })
+
+    def _include_count(self, request):
+        value = request.query_params.get(self.count_query_param, 'true')
+        return value.lower() not in ('false', '0', 'no')
+
+    def _build_link(self, row, reverse):
+        value = getattr(row, self.field)
+        payload = {
+            'v': value.isoformat() if hasattr(value, 'isoformat') else value,
+            'pk': getattr(row, self.pk_name),
+            'r': int(reverse),
+        }
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(',', ':')).encode()
+        ).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            return {
+                'value': self.model_field.to_python(payload['v']),
+                'pk': int(payload['pk']),
+                'reverse': bool(payload.get('r')),
+            }
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound('잘못된 커서입니다.')
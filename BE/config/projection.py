@@ -0,0 +1,89 @@
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsetMixin:
+    """
+    ?fields= 로 응답 필드를 고르는 Serializer Mixin
+
+    예: ?fields=record_id,analysis_result,created_at
+    요청에 fields가 없으면 선언된 필드를 모두 반환한다.
+    """
+
+    fields_query_param = 'fields'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        if request is None:
+            return
+
+        requested = request.query_params.get(self.fields_query_param)
+        if not requested:
+            return
+
+        names = {name.strip() for name in requested.split(',') if name.strip()}
+        unknown = names - set(self.fields)
+        if unknown:
+            raise ValidationError({
+                self.fields_query_param: f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"
+            })
+
+        for name in list(self.fields):
+            if name not in names:
+                self.fields.pop(name)
+
+
+def get_projection_columns(serializer, model):
+    """
+    Serializer가 실제로 읽는 모델 컬럼 목록
+
+    - source가 모델 필드면 그 컬럼 (FK는 *_id 컬럼)
+    - get_<필드>_display 는 <필드>
+    - property 등 컬럼을 알 수 없는 source는 Meta.projection_dependencies 에서 찾음
+
+    Returns:
+        set: 컬럼 이름 집합, 판단할 수 없는 필드가 있으면 None (전체 로드)
+    """
+
+    concrete = {f.name: f for f in model._meta.concrete_fields}
+    dependencies = getattr(getattr(serializer, 'Meta', None), 'projection_dependencies', {})
+
+    columns = {model._meta.pk.name}
+    for name, field in serializer.fields.items():
+        if name in dependencies:
+            columns.update(dependencies[name])
+            continue
+
+        source = field.source.split('.')[0]
+        if source.startswith('get_') and source.endswith('_display'):
+            source = source[len('get_'):-len('_display')]
+
+        if source not in concrete:
+            return None
+        columns.add(source)
+
+    return columns
+
+
+class ProjectedListMixin:
+    """
+    목록 API에서 Serializer가 쓰는 컬럼만 조회하는 View Mixin
+
+    detection_details, evidence_files 같은 큰 JSON/TEXT 컬럼을 목록에서 읽지 않도록
+    filter_queryset 단계에서 .only()를 적용한다 (뷰마다 재정의하는 get_queryset은 그대로 둠).
+    ?fields= 로 필드를 줄이면 조회 컬럼도 함께 줄어든다.
+    정렬 필드는 페이지네이션 커서에 쓰이므로 항상 포함한다.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        model = queryset.model
+
+        columns = get_projection_columns(self.get_serializer(), model)
+        if columns is None:
+            return queryset
+
+        ordering = getattr(self, 'keyset_field', None) or model._meta.ordering[0]
+        columns.add(ordering.lstrip('-'))
+        return queryset.only(*columns)
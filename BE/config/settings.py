@@ -3,6 +3,7 @@ Django settings for deepfake backend project.
 """
 
 from pathlib import Path
+import json
 import os
 from dotenv import load_dotenv
 import pymysql
@@ -51,6 +52,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.timing.RequestTimingMiddleware',  # 요청 단계별 소요 시간 (맨 앞 유지)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # CORS 설정
@@ -167,9 +169,9 @@ REST_FRAMEWORK = {
         'rest_framework.renderers.JSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
-        'rest_framework.parsers.MultiPartParser',
-        'rest_framework.parsers.FormParser',
+        'config.timing.TimedJSONParser',
+        'config.timing.TimedMultiPartParser',
+        'config.timing.TimedFormParser',
     ],
     'DATETIME_FORMAT': '%Y-%m-%d %H:%M:%S',
     'DATE_FORMAT': '%Y-%m-%d',
@@ -202,6 +204,11 @@ CORS_ALLOW_HEADERS = [
 # 파일 업로드 설정
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
+STREAMING_UPLOAD_ENABLED = os.getenv('STREAMING_UPLOAD_ENABLED', 'True') == 'True'  # 분석/보호 업로드를 최종 위치에 바로 기록
+
+# 분할(재개 가능) 업로드 설정
+UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', str(5 * 1024 * 1024)))  # 조각 크기 (기본 5MB)
+UPLOAD_SESSION_TTL = 24 * 60 * 60  # 마지막 조각 이후 세션 유지 시간 (초)
 
 # 이미지 파일 설정
 IMAGE_MAX_SIZE = 10 * 1024 * 1024  # 10MB
@@ -212,10 +219,121 @@ VIDEO_MAX_SIZE = 500 * 1024 * 1024  # 500MB
 VIDEO_MAX_DURATION = 30 * 60  # 30분 (초 단위)
 VIDEO_ALLOWED_EXTENSIONS = ['mp4', 'mov', 'avi']
 
+# 영상 분석 작업 큐 설정
+VIDEO_ANALYSIS_WORKERS = int(os.getenv('VIDEO_ANALYSIS_WORKERS', '2'))  # 프로세스당 분석 워커 수
+VIDEO_ANALYSIS_QUEUE_SIZE = int(os.getenv('VIDEO_ANALYSIS_QUEUE_SIZE', '20'))  # 프로세스당 최대 대기 작업 수
+VIDEO_ANALYSIS_RECOVERY_INTERVAL = int(os.getenv('VIDEO_ANALYSIS_RECOVERY_INTERVAL', '60'))  # 주인을 잃은 작업 정리 주기 (초, 0이면 끔)
+VIDEO_ANALYSIS_STALE_AFTER = int(os.getenv('VIDEO_ANALYSIS_STALE_AFTER', '900'))  # 이보다 오래 처리 중이면 중단된 작업으로 실패 처리 (초, AI_REQUEST_TIMEOUT보다 길게)
+VIDEO_ANALYSIS_REQUEUE_AFTER = int(os.getenv('VIDEO_ANALYSIS_REQUEUE_AFTER', '120'))  # 이보다 오래 대기 중이면 유휴 워커가 있는 프로세스가 가져감 (초)
+
+# Zoom 중복 프레임 건너뛰기 설정 (perceptual hash)
+ZOOM_DEDUP_ENABLED = os.getenv('ZOOM_DEDUP_ENABLED', 'True') == 'True'
+ZOOM_DEDUP_MAX_DISTANCE = int(os.getenv('ZOOM_DEDUP_MAX_DISTANCE', '5'))  # 64비트 dHash 해밍 거리 임계치
+ZOOM_DEDUP_WINDOW = 10  # 세션별로 비교할 최근 분석 프레임 수
+ZOOM_DEDUP_MAX_AGE = 60  # 이 시간(초)보다 오래된 판정은 재사용하지 않음
+ZOOM_DEDUP_MAX_SESSIONS = 1000  # 메모리에 유지할 최대 세션 수
+
 
 # FastAPI AI 서버 설정
 FASTAPI_URL = os.getenv('FASTAPI_URL', 'http://localhost:8001')
-AI_REQUEST_TIMEOUT = 300  # 5분
+# AI 서버 풀 (JSON 목록, 없으면 FASTAPI_URL 한 대)
+#   [{"url": "http://gpu1:8001", "weight": 2, "capabilities": ["image", "video"]},
+#    {"url": "http://gpu2:8001", "weight": 1, "capabilities": ["protect"]}]
+# 요청은 기능(image/video/protect)을 지원하는 서버 중 가중치 대비 처리 중 요청이 가장 적은 서버로 보낸다
+AI_BACKENDS = json.loads(os.getenv('AI_BACKENDS', '[]')) or [
+    {'url': FASTAPI_URL, 'weight': 1, 'capabilities': ['image', 'video', 'protect']}
+]
+AI_REQUEST_TIMEOUT = int(os.getenv('AI_REQUEST_TIMEOUT', '300'))  # 분석 읽기 타임아웃 상한 (초)
+PROTECTION_REQUEST_TIMEOUT = int(os.getenv('PROTECTION_REQUEST_TIMEOUT', '600'))  # 보호 처리 읽기 타임아웃 상한 (초)
+
+# 적응형 타임아웃 (라우트 / 요청 크기 구간별 최근 지연 시간 기준, 상한은 위 타임아웃)
+AI_LATENCY_WINDOW = 500  # 구간별로 보관하는 최근 성공 요청 수
+AI_LATENCY_MIN_SAMPLES = int(os.getenv('AI_LATENCY_MIN_SAMPLES', '20'))  # 이보다 적으면 상한 타임아웃 사용 / 헤지 안 함
+AI_ADAPTIVE_TIMEOUT_MULTIPLIER = float(os.getenv('AI_ADAPTIVE_TIMEOUT_MULTIPLIER', '3'))  # 타임아웃 = p99 × 배수
+AI_ADAPTIVE_TIMEOUT_MIN = int(os.getenv('AI_ADAPTIVE_TIMEOUT_MIN', '10'))  # 적응형 타임아웃 하한 (초)
+
+# 헤지 요청 (작은 이미지 / Zoom 캡처 분석이 p95를 넘기면 다른 AI 서버로 한 번 더 요청)
+AI_HEDGE_ENABLED = os.getenv('AI_HEDGE_ENABLED', 'True') == 'True'
+AI_HEDGE_MAX_BYTES = int(os.getenv('AI_HEDGE_MAX_BYTES', str(2 * 1024 * 1024)))  # 헤지 대상 최대 파일 크기
+AI_HEDGE_MAX_RATIO = float(os.getenv('AI_HEDGE_MAX_RATIO', '0.1'))  # 헤지 대상 요청 대비 최대 헤지 비율 (부하 증가 상한)
+AI_HEDGE_WORKERS = int(os.getenv('AI_HEDGE_WORKERS', '32'))  # sync 헤지 요청용 스레드 수
+
+# 분석 파일 전송 방식: multipart(파일 업로드) / path(공유 볼륨 경로 전달) / s3(S3 키 전달)
+AI_DETECTION_TRANSPORT = os.getenv('AI_DETECTION_TRANSPORT', 'multipart')
+AI_SHARED_MEDIA_ROOT = os.getenv('AI_SHARED_MEDIA_ROOT', str(MEDIA_ROOT))  # AI 서버에서 보이는 MEDIA_ROOT 경로
+
+# AI 호출 우선순위 레인 (프로세스당, 실시간 Zoom 캡처가 영상/보호 작업에 밀리지 않도록)
+AI_DISPATCH_MAX_CONCURRENCY = int(os.getenv('AI_DISPATCH_MAX_CONCURRENCY', '16'))  # 전체 동시 AI 호출 수
+AI_DISPATCH_LANES = {
+    # priority: 작을수록 먼저 / max_concurrency: 레인 동시 호출 상한 / slo: 대기 시간 목표 (초, 넘기면 우선순위와 관계없이 먼저 처리)
+    'zoom': {'priority': 0, 'max_concurrency': AI_DISPATCH_MAX_CONCURRENCY, 'slo': 1},
+    'image': {'priority': 1, 'max_concurrency': int(os.getenv('AI_DISPATCH_IMAGE_CONCURRENCY', '12')), 'slo': 5},
+    'bulk': {'priority': 2, 'max_concurrency': int(os.getenv('AI_DISPATCH_BULK_CONCURRENCY', '6')), 'slo': 60},  # 영상 분석 / 보호 처리
+}
+
+# AI 서버 HTTP 커넥션 풀 설정
+AI_HTTP_POOL_CONNECTIONS = int(os.getenv('AI_HTTP_POOL_CONNECTIONS', '4'))  # 호스트별 풀 개수
+AI_HTTP_POOL_MAXSIZE = int(os.getenv('AI_HTTP_POOL_MAXSIZE', '20'))  # 풀당 keep-alive 연결 수
+AI_HTTP_MAX_RETRIES = int(os.getenv('AI_HTTP_MAX_RETRIES', '3'))  # 멱등 요청(GET) 재시도 횟수
+AI_HTTP_BACKOFF_FACTOR = float(os.getenv('AI_HTTP_BACKOFF_FACTOR', '0.3'))  # 재시도 백오프 (초)
+AI_CONNECT_TIMEOUT = 3  # 연결 수립 타임아웃 (초)
+AI_ASYNC_MAX_CONNECTIONS = int(os.getenv('AI_ASYNC_MAX_CONNECTIONS', '200'))  # 비동기(ASGI) 클라이언트 최대 동시 연결 수
+
+# AI 서버 상태 모니터 / 서킷 브레이커 설정
+AI_HEALTH_CACHE_TTL = 30  # 이 시간 동안 요청/프로브 결과가 없으면 헬스체크 API에 stale로 표시 (초)
+AI_HEALTH_PROBE_INTERVAL = int(os.getenv('AI_HEALTH_PROBE_INTERVAL', '10'))  # 백그라운드 프로브 주기 (초, 0이면 끔)
+AI_HEALTH_PROBE_TIMEOUT = 2  # /health 프로브 타임아웃 (초)
+AI_HEALTH_WINDOW_SECONDS = 60  # 오류율 계산 구간 (초)
+AI_CIRCUIT_FAILURE_THRESHOLD = 5  # 연속 실패 시 서킷 열림
+AI_CIRCUIT_ERROR_RATE_THRESHOLD = 0.5  # 구간 오류율 이상이면 서킷 열림
+AI_CIRCUIT_MIN_REQUESTS = 10  # 오류율 판단에 필요한 최소 요청 수
+AI_CIRCUIT_RESET_TIMEOUT = 30  # 서킷이 열린 뒤 시험 요청까지 대기 (초)
+
+# 분석 결과 캐시 설정 (콘텐츠 해시 + 모델 버전 기준)
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', '10000'))  # 프로세스당 최대 항목 수
+ANALYSIS_CACHE_TTL = 24 * 60 * 60  # 캐시 유효 시간 (초)
+
+# 분석 결과 이미지(히트맵 / 탐지 이미지) 프록시 캐시
+ANALYSIS_ARTIFACT_FETCH_TIMEOUT = 30  # AI 서버에서 이미지 받기 타임아웃 (초)
+ANALYSIS_ARTIFACT_THUMBNAIL_SIZE = 256  # 목록용 썸네일 최대 변 길이 (px)
+ANALYSIS_ARTIFACT_CACHE_MAX_AGE = 365 * 24 * 60 * 60  # 브라우저 캐시 유효 시간 (초, 저장된 이미지는 바뀌지 않음)
+
+# 기간별 분석 통계 (일별 집계)
+ANALYSIS_TIMESERIES_DEFAULT_DAYS = 30  # 기간을 지정하지 않으면 최근 30일
+ANALYSIS_TIMESERIES_MAX_DAYS = 366  # 요청당 최대 조회 기간 (일)
+
+# 이미지 일괄 분석 설정
+BATCH_ANALYSIS_MAX_IMAGES = int(os.getenv('BATCH_ANALYSIS_MAX_IMAGES', '20'))  # 요청당 최대 이미지 수
+AI_BATCH_CONCURRENCY = int(os.getenv('AI_BATCH_CONCURRENCY', '4'))  # 요청당 AI 서버 동시 호출 수
+AI_BATCH_ROUTE_ENABLED = os.getenv('AI_BATCH_ROUTE_ENABLED', 'False') == 'True'  # AI 서버 일괄 분석 라우트 사용
+
+# 분석 API 승인 제어 (과부하 시 429 + Retry-After)
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv('ADMISSION_MAX_IN_FLIGHT', '64'))  # 프로세스당 동시 처리 분석 요청 수
+ADMISSION_MAX_IN_FLIGHT_PER_USER = int(os.getenv('ADMISSION_MAX_IN_FLIGHT_PER_USER', '4'))  # 사용자당 동시 처리 분석 요청 수 (프로세스당)
+ADMISSION_MAX_ACTIVE_VIDEO_JOBS = int(os.getenv('ADMISSION_MAX_ACTIVE_VIDEO_JOBS', '3'))  # 사용자당 대기 + 처리 중 영상 분석 작업 수
+ADMISSION_QUEUE_FACTOR = float(os.getenv('ADMISSION_QUEUE_FACTOR', '2'))  # AI 호출 레인 대기 요청이 레인 상한의 N배 이상이면 거절
+ADMISSION_MAX_RETRY_AFTER = 120  # Retry-After 최댓값 (초)
+ADMISSION_RATE_LIMITS = {
+    # 사용자별 토큰 버킷 - rate: 초당 보충 토큰 수 / burst: 최대 토큰 수 (연속 요청 허용량)
+    # 버킷은 Django 캐시에 저장하므로 전체 워커 공통 제한에는 공유 캐시(CACHES: Redis / Memcached)가 필요 (기본 LocMemCache는 워커별)
+    'image': {'rate': float(os.getenv('ADMISSION_IMAGE_RATE', '1')), 'burst': 20},
+    'zoom': {'rate': float(os.getenv('ADMISSION_ZOOM_RATE', '2')), 'burst': 10},
+    'video': {'rate': float(os.getenv('ADMISSION_VIDEO_RATE', '0.05')), 'burst': 5},
+    'protection': {'rate': float(os.getenv('ADMISSION_PROTECTION_RATE', '0.2')), 'burst': 10},
+}
+
+# 요청 단계별 소요 시간 측정 (Server-Timing 헤더 + request_timing 로그)
+REQUEST_TIMING_SAMPLE_RATE = float(os.getenv('REQUEST_TIMING_SAMPLE_RATE', '1.0'))  # 측정할 요청 비율 (0이면 끔)
+REQUEST_TIMING_HEADER = os.getenv('REQUEST_TIMING_HEADER', 'True') == 'True'  # 응답에 Server-Timing 헤더 포함
+
+# SystemLog 버퍼 (요청 중에는 메모리에 쌓고 백그라운드 스레드에서 bulk_create)
+SYSTEM_LOG_BUFFER_SIZE = int(os.getenv('SYSTEM_LOG_BUFFER_SIZE', '10000'))  # 프로세스당 최대 대기 로그 수 (넘으면 버림)
+SYSTEM_LOG_BATCH_SIZE = int(os.getenv('SYSTEM_LOG_BATCH_SIZE', '200'))  # 이만큼 쌓이면 바로 저장
+SYSTEM_LOG_FLUSH_INTERVAL = float(os.getenv('SYSTEM_LOG_FLUSH_INTERVAL', '2'))  # 최대 저장 간격 (초)
+
+# Prometheus 지표 (/metrics, 멀티프로세스 모드는 PROMETHEUS_MULTIPROC_DIR 환경변수로 켜짐)
+METRICS_AUTH_TOKEN = os.getenv('METRICS_AUTH_TOKEN', '')  # 설정하면 Authorization: Bearer <token>으로 조회 가능
+METRICS_ALLOWED_IPS = [ip for ip in os.getenv('METRICS_ALLOWED_IPS', '').split(',') if ip]  # 조회 허용 IP (REMOTE_ADDR), 기본은 토큰 / 스태프만
 
 
 # 로깅 설정
@@ -253,6 +371,10 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        # 비동기 AI 클라이언트(httpx)의 요청별 INFO 로그는 남기지 않음
+        'httpx': {
+            'level': 'WARNING',
+        },
     },
 }
 
@@ -271,4 +393,5 @@ AWS_PRESIGNED_URL_EXPIRATION = 3600  # 1시간
 
 # S3 사용 설정
 USE_S3_FOR_PROTECTION = os.getenv('USE_S3_FOR_PROTECTION', 'False') == 'True'
-USE_S3_FOR_REPORTS = os.getenv('USE_S3_FOR_REPORTS', 'False') == 'True'
\ No newline at end of file
+USE_S3_FOR_REPORTS = os.getenv('USE_S3_FOR_REPORTS', 'False') == 'True'
+USE_S3_FOR_ANALYSIS_ARTIFACTS = os.getenv('USE_S3_FOR_ANALYSIS_ARTIFACTS', 'False') == 'True'
\ No newline at end of file
@@ -0,0 +1,206 @@
+import functools
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+
+
+logger = logging.getLogger('request_timing')
+
+
+class RequestTimer:
+    """
+    요청 1건의 단계별 소요 시간
+
+    upload(본문 파싱·업로드 핸들러), storage(파일 저장), ai(AI 서버 왕복), db(쿼리 실행)
+    async 뷰에서는 sync_to_async 스레드에서도 같은 객체에 기록된다 (컨텍스트 변수가 복사됨).
+    """
+
+    PHASES = ('upload', 'storage', 'ai', 'db')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations = dict.fromkeys(self.PHASES, 0.0)
+        self.db_queries = 0
+        self._lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        with self._lock:
+            self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+            if phase == 'db':
+                self.db_queries += 1
+
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total):
+        """Server-Timing 헤더 값 (밀리초)"""
+        metrics = []
+        for phase, seconds in self.durations.items():
+            if phase == 'db':
+                metrics.append(f'db;dur={seconds * 1000:.1f};desc="{self.db_queries} queries"')
+            elif seconds:
+                metrics.append(f'{phase};dur={seconds * 1000:.1f}')
+        metrics.append(f'total;dur={total * 1000:.1f}')
+        return ', '.join(metrics)
+
+
+_current_timer = ContextVar('request_timer', default=None)
+
+
+@contextmanager
+def timing_phase(phase):
+    """
+    현재 요청의 phase 구간 시간 기록 (측정 중인 요청이 아니면 아무것도 하지 않음)
+
+    with timing_phase('ai'):
+        response = client.post(...)
+    """
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(phase, time.perf_counter() - start)
+
+
+def timed(phase):
+    """메서드 전체를 timing_phase로 감싸는 데코레이터"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timing_phase(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================
+# DB 쿼리 시간
+# ============================================
+def _db_timing_wrapper(execute, sql, params, many, context):
+    with timing_phase('db'):
+        return execute(sql, params, many, context)
+
+
+def _install_db_timing(sender, connection, **kwargs):
+    # 연결마다 한 번 등록 (측정 중이 아닌 요청에서는 컨텍스트 변수 조회만 함)
+    if _db_timing_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_db_timing_wrapper)
+
+
+connection_created.connect(_install_db_timing)
+
+# 이 모듈을 불러오기 전에 이미 열린 연결 (현재 스레드)
+for _connection in connections.all(initialized_only=True):
+    _install_db_timing(None, _connection)
+
+
+# ============================================
+# 본문 파싱 시간 (DRF 파서)
+# ============================================
+class TimedJSONParser(JSONParser):
+    @timed('upload')
+    def parse(self, stream, media_type=None, parser_context=None):
+        return super().parse(stream, media_type, parser_context)
+
+
+class TimedMultiPartParser(MultiPartParser):
+    """multipart 파싱 (스트리밍 업로드 핸들러의 파일 기록 시간 포함)"""
+
+    @timed('upload')
+    def parse(self, stream, media_type=None, parser_context=None):
+        return super().parse(stream, media_type, parser_context)
+
+
+class TimedFormParser(FormParser):
+    @timed('upload')
+    def parse(self, stream, media_type=None, parser_context=None):
+        return super().parse(stream, media_type, parser_context)
+
+
+# ============================================
+# 미들웨어
+# ============================================
+class RequestTimingMiddleware:
+    """
+    요청 단계별 소요 시간 측정 미들웨어
+
+    REQUEST_TIMING_SAMPLE_RATE 비율의 요청만 측정하고, 측정한 요청은
+    Server-Timing 헤더(REQUEST_TIMING_HEADER)와 request_timing 로거에 JSON 한 줄로 남긴다.
+    MIDDLEWARE 맨 앞에 두어야 total에 다른 미들웨어 시간까지 포함된다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        self.emit_header = settings.REQUEST_TIMING_HEADER
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        if not self.is_sampled():
+            return self.get_response(request)
+
+        timer = RequestTimer()
+        token = _current_timer.set(timer)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+
+        self.report(request, response, timer)
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_sampled():
+            return await self.get_response(request)
+
+        timer = RequestTimer()
+        token = _current_timer.set(timer)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+
+        self.report(request, response, timer)
+        return response
+
+    def is_sampled(self):
+        return self.sample_rate >= 1 or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def report(self, request, response, timer):
+        total = timer.total()
+
+        if self.emit_header:
+            response['Server-Timing'] = timer.server_timing(total)
+
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 1),
+            **{f'{phase}_ms': round(seconds * 1000, 1) for phase, seconds in timer.durations.items()},
+            'db_queries': timer.db_queries,
+        }))
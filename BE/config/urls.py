@@ -6,6 +6,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from rest_framework.authtoken.views import obtain_auth_token
+from config.metrics import metrics_view
 
 urlpatterns = [
     # Django Admin
@@ -21,6 +22,9 @@ urlpatterns = [
     path('api/protection/', include('protection.urls')),
     path('api/reports/', include('reports.urls')),
     path('api/files/', include('media_files.urls')),
+    
+    # Prometheus 지표
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # 개발 환경에서 미디어 파일 서빙
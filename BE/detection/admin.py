@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import AnalysisRecord
+from django.db import transaction
+from .models import AnalysisDailyRollup, AnalysisRecord, DetectedPerson, UserAnalysisStatistics, VideoAnalysisJob
 
 
 @admin.register(AnalysisRecord)
@@ -20,6 +21,14 @@ class AnalysisRecordAdmin(admin.ModelAdmin):
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
     
+    def delete_queryset(self, request, queryset):
+        """일괄 삭제 시에도 사용자 통계 / 일별 집계 갱신"""
+        with transaction.atomic():
+            records = list(queryset)
+            UserAnalysisStatistics.decrement(records)
+            AnalysisDailyRollup.decrement(records)
+            super().delete_queryset(request, queryset)
+    
     fieldsets = (
         ('기본 정보', {
             'fields': (
@@ -53,4 +62,78 @@ class AnalysisRecordAdmin(admin.ModelAdmin):
                 'updated_at'
             )
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(DetectedPerson)
+class DetectedPersonAdmin(admin.ModelAdmin):
+    """인물별 탐지 결과 관리자"""
+    
+    list_display = [
+        'detection_id',
+        'record',
+        'user',
+        'person_id',
+        'is_deepfake',
+        'confidence',
+        'created_at'
+    ]
+    list_filter = ['is_deepfake', 'created_at']
+    search_fields = ['user__email']
+    readonly_fields = ['created_at']
+    ordering = ['-created_at']
+
+
+@admin.register(VideoAnalysisJob)
+class VideoAnalysisJobAdmin(admin.ModelAdmin):
+    """영상 분석 작업 관리자"""
+    
+    list_display = [
+        'job_id',
+        'user',
+        'job_status',
+        'record',
+        'created_at',
+        'processing_completed_at'
+    ]
+    list_filter = ['job_status', 'created_at']
+    search_fields = ['user__email']
+    readonly_fields = ['created_at']
+    ordering = ['-created_at']
+
+
+@admin.register(UserAnalysisStatistics)
+class UserAnalysisStatisticsAdmin(admin.ModelAdmin):
+    """사용자 분석 통계 관리자"""
+    
+    list_display = [
+        'user',
+        'total_count',
+        'safe_count',
+        'suspicious_count',
+        'deepfake_count',
+        'last_analyzed_at',
+        'updated_at'
+    ]
+    search_fields = ['user__email']
+    readonly_fields = ['statistics_id', 'updated_at']
+
+
+@admin.register(AnalysisDailyRollup)
+class AnalysisDailyRollupAdmin(admin.ModelAdmin):
+    """일별 분석 집계 관리자"""
+    
+    list_display = [
+        'user',
+        'date',
+        'total_count',
+        'safe_count',
+        'suspicious_count',
+        'deepfake_count',
+        'zoom_alert_count',
+        'updated_at'
+    ]
+    list_filter = ['date']
+    search_fields = ['user__email']
+    readonly_fields = ['rollup_id', 'updated_at']
+    ordering = ['-date']
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+
+from config.timing import timing_phase
+
+
+class AIServerClient:
+    """AI 서버 HTTP 클라이언트 (커넥션 풀 + keep-alive 공유)"""
+
+    # 재시도해도 안전한 멱등 메서드만 재시도 (분석/보호 POST는 재시도하지 않음)
+    IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    def __init__(
+        self,
+        pool_connections=None,
+        pool_maxsize=None,
+        max_retries=None,
+        backoff_factor=None
+    ):
+        self.pool_connections = pool_connections or settings.AI_HTTP_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or settings.AI_HTTP_POOL_MAXSIZE
+
+        retry = Retry(
+            total=settings.AI_HTTP_MAX_RETRIES if max_retries is None else max_retries,
+            backoff_factor=settings.AI_HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=self.IDEMPOTENT_METHODS,
+            raise_on_status=False
+        )
+
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+
+        # 세션 하나로 모든 요청의 TCP 연결을 재사용 (keep-alive)
+        self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+
+    def get(self, url, **kwargs):
+        with timing_phase('ai'):
+            return self.session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        with timing_phase('ai'):
+            return self.session.post(url, **kwargs)
+
+    def get_pool_stats(self):
+        """
+        커넥션 풀 재사용 통계
+
+        Returns:
+            dict: {
+                'pool_connections': int,
+                'pool_maxsize': int,
+                'requests': int,  # 풀을 통해 보낸 요청 수
+                'hits': int,  # 기존 연결을 재사용한 요청 수
+                'misses': int,  # 새 TCP 연결을 맺은 횟수
+                'hosts': [{'host': str, 'requests': int, 'hits': int, 'misses': int}]
+            }
+        """
+        pools = self.adapter.poolmanager.pools
+
+        with pools.lock:
+            host_pools = list(pools._container.values())
+
+        hosts = []
+        for pool in host_pools:
+            requests_count = pool.num_requests
+            misses = pool.num_connections
+            hosts.append({
+                'host': f"{pool.scheme}://{pool.host}:{pool.port}",
+                'requests': requests_count,
+                'hits': max(requests_count - misses, 0),
+                'misses': misses
+            })
+
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'requests': sum(h['requests'] for h in hosts),
+            'hits': sum(h['hits'] for h in hosts),
+            'misses': sum(h['misses'] for h in hosts),
+            'hosts': hosts
+        }
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_ai_client():
+    """프로세스 전역 AI 서버 클라이언트 반환 (지연 생성, gunicorn fork 이후 생성됨)"""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AIServerClient()
+    return _client
+
+
+class AsyncAIServerClient:
+    """
+    AI 서버 비동기 HTTP 클라이언트 (async 뷰용)
+
+    응답을 기다리는 동안 스레드를 점유하지 않으므로 한 프로세스가 많은 AI 요청을 동시에 기다릴 수 있다.
+    httpx.AsyncClient는 만든 이벤트 루프에서만 쓸 수 있어 루프마다 하나씩 만든다.
+    """
+
+    def __init__(self, max_connections=None, max_keepalive_connections=None):
+        self.limits = httpx.Limits(
+            max_connections=max_connections or settings.AI_ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive_connections or settings.AI_HTTP_POOL_MAXSIZE
+        )
+        self.client = httpx.AsyncClient(limits=self.limits)
+
+    async def get(self, url, **kwargs):
+        with timing_phase('ai'):
+            return await self.client.get(url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        with timing_phase('ai'):
+            return await self.client.post(url, **kwargs)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+def build_async_timeout(read_timeout):
+    """requests의 (connect, read) 타임아웃과 같은 의미의 httpx 타임아웃"""
+    return httpx.Timeout(read_timeout, connect=settings.AI_CONNECT_TIMEOUT)
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_ai_client():
+    """현재 이벤트 루프의 AI 서버 비동기 클라이언트 반환 (루프가 끝나면 함께 정리)"""
+    loop = asyncio.get_running_loop()
+
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncAIServerClient()
+        _async_clients[loop] = client
+    return client
@@ -0,0 +1,185 @@
+import io
+import mimetypes
+import os
+import re
+import threading
+from urllib.parse import urljoin, urlparse
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+
+from media_files.models import MediaFile
+from media_files.services import FileService
+from .ai_client import get_ai_client
+
+
+PERSON_ARTIFACT = re.compile(r'^persons/(?P<person_id>\d+)/(?P<kind>heatmap|detection_image)$')
+
+# 같은 이미지를 여러 요청이 동시에 받아오지 않도록 (프로세스 내, 키 해시로 나눈 잠금)
+_fetch_locks = [threading.Lock() for _ in range(64)]
+
+
+def artifact_url(record_id, artifact, thumbnail=False, request=None):
+    """분석 결과 이미지 프록시 URL (AI 서버 URL 대신 응답에 사용, request가 있으면 절대 URL)"""
+    url = reverse('detection:record_artifact', kwargs={'pk': record_id, 'artifact': artifact})
+    if thumbnail:
+        url = f"{url}?size=thumbnail"
+    return request.build_absolute_uri(url) if request is not None else url
+
+
+def proxy_detection_details(record_id, detection_details, request=None):
+    """detection_details의 인물별 이미지 URL을 프록시 URL로 바꾼 목록"""
+    details = []
+    for detail in detection_details or []:
+        detail = dict(detail)
+        for kind in ('detection_image', 'heatmap'):
+            if detail.get(f'{kind}_url'):
+                detail[f'{kind}_url'] = artifact_url(
+                    record_id, f"persons/{detail.get('person_id')}/{kind}", request=request
+                )
+        details.append(detail)
+    return details
+
+
+class AnalysisArtifactService:
+    """
+    분석 결과 이미지(히트맵 / 인물별 탐지 이미지) 프록시 캐시
+
+    처음 요청될 때 AI 서버가 돌려준 URL에서 한 번 받아 분석 기록에 연결된 MediaFile로 저장하고,
+    목록 화면용 썸네일도 함께 만든다. 이후 요청은 저장된 파일로 응답한다.
+
+    artifact 이름
+        heatmap: 기록 히트맵 (heatmap_path)
+        persons/<person_id>/heatmap, persons/<person_id>/detection_image: 인물별 이미지 (detection_details)
+    """
+
+    def __init__(self, record):
+        self.record = record
+        self.client = get_ai_client()
+
+    def get_file(self, artifact, thumbnail=False):
+        """
+        저장된 이미지 반환 (없으면 AI 서버에서 받아 저장)
+
+        Returns:
+            MediaFile: AI 서버 결과에 이미지가 없으면 None
+
+        Raises:
+            ValueError: 알 수 없는 artifact 이름
+            requests.exceptions.RequestException: AI 서버에서 받지 못함
+        """
+        source_url = self.get_source_url(artifact)
+        if not source_url:
+            return None
+
+        variant = 'thumbnail' if thumbnail else 'original'
+        media_file = self._find(artifact, variant)
+        if media_file is not None:
+            return media_file
+
+        with _fetch_locks[hash((self.record.record_id, artifact)) % len(_fetch_locks)]:
+            media_file = self._find(artifact, variant)
+            if media_file is None:
+                stored = self._fetch(artifact, source_url)
+                media_file = stored[variant]
+        return media_file
+
+    @staticmethod
+    def is_artifact(artifact):
+        return artifact == 'heatmap' or PERSON_ARTIFACT.match(artifact) is not None
+
+    def get_source_url(self, artifact):
+        """AI 서버가 돌려준 원본 URL"""
+        if artifact == 'heatmap':
+            return self.record.heatmap_path
+
+        match = PERSON_ARTIFACT.match(artifact)
+        if match is None:
+            raise ValueError(f"알 수 없는 분석 이미지입니다: {artifact}")
+
+        person_id = int(match['person_id'])
+        for index, detail in enumerate(self.record.detection_details or []):
+            if detail.get('person_id', index + 1) == person_id:
+                return detail.get(f"{match['kind']}_url")
+        return None
+
+    def _find(self, artifact, variant):
+        return MediaFile.objects.filter(
+            related_model='AnalysisRecord',
+            related_record_id=self.record.record_id,
+            is_deleted=False,
+            metadata__artifact=artifact,
+            metadata__variant=variant
+        ).order_by('file_id').first()
+
+    def _fetch(self, artifact, source_url):
+        """AI 서버에서 이미지를 받아 원본 + 썸네일 저장"""
+        # 분석 시 응답한 AI 서버 기준 절대 URL로 저장된다 (상대 경로는 이전에 저장된 기록)
+        content, content_type = self._download(urljoin(f"{settings.FASTAPI_URL}/", source_url))
+        extension = self._get_extension(source_url, content_type)
+        name = f"{self.record.record_id}_{artifact.replace('/', '_')}"
+
+        thumbnail = io.BytesIO()
+        with Image.open(io.BytesIO(content)) as image:
+            image.thumbnail((settings.ANALYSIS_ARTIFACT_THUMBNAIL_SIZE,) * 2)
+            if extension in ('jpg', 'jpeg') and image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            image.save(thumbnail, format=Image.registered_extensions()[f'.{extension}'])
+
+        return {
+            'original': self._store(f"{name}.{extension}", content, content_type, artifact, 'original', source_url),
+            'thumbnail': self._store(
+                f"{name}_thumb.{extension}", thumbnail.getvalue(), content_type, artifact, 'thumbnail', source_url
+            ),
+        }
+
+    def _download(self, url):
+        """이미지 다운로드 (IMAGE_MAX_SIZE를 넘으면 중단)"""
+        response = self.client.get(
+            url,
+            stream=True,
+            timeout=(settings.AI_CONNECT_TIMEOUT, settings.ANALYSIS_ARTIFACT_FETCH_TIMEOUT)
+        )
+        with response:
+            response.raise_for_status()
+
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(64 * 1024):
+                size += len(chunk)
+                if size > settings.IMAGE_MAX_SIZE:
+                    raise ValueError("분석 이미지가 너무 큽니다.")
+                chunks.append(chunk)
+
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+        return b''.join(chunks), content_type
+
+    def _get_extension(self, source_url, content_type):
+        extension = os.path.splitext(urlparse(source_url).path)[1].lstrip('.').lower()
+        if extension not in settings.IMAGE_ALLOWED_EXTENSIONS:
+            extension = (mimetypes.guess_extension(content_type) or '.png').lstrip('.')
+        if extension not in settings.IMAGE_ALLOWED_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 분석 이미지 형식입니다: {content_type}")
+        return extension
+
+    def _store(self, name, content, content_type, artifact, variant, source_url):
+        media_file = FileService(self.record.user).upload_file(
+            uploaded_file=SimpleUploadedFile(name, content, content_type or None),
+            file_type='image',
+            purpose='detection',
+            is_temporary=False,
+            metadata={
+                'artifact': artifact,
+                'variant': variant,
+                'source_url': source_url
+            },
+            use_s3=settings.USE_S3_FOR_ANALYSIS_ARTIFACTS
+        )
+
+        # ✅ 분석 기록과 연결 (기록 삭제 시 함께 삭제)
+        media_file.related_model = 'AnalysisRecord'
+        media_file.related_record_id = self.record.record_id
+        media_file.save(update_fields=['related_model', 'related_record_id'])
+        return media_file
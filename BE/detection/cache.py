@@ -0,0 +1,130 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class AnalysisResultCache:
+    """
+    콘텐츠 해시 기반 AI 분석 결과 캐시 (프로세스 내 LRU)
+
+    키: (콘텐츠 해시, AI 모델 버전, 분석 종류)
+    같은 파일을 다시 올리면 FastAPI 호출 없이 이전 분석 결과를 돌려준다.
+    AI 모델 버전이 바뀌면 이전 버전 결과는 모두 버린다.
+    """
+
+    def __init__(self, max_entries=None, ttl=None):
+        self.max_entries = max_entries or settings.ANALYSIS_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.ANALYSIS_CACHE_TTL
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (저장 시각, 결과)
+        self.model_version = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, content_hash, analysis_kind, model_version):
+        """
+        캐시된 분석 결과 조회
+
+        Args:
+            content_hash: 파일 콘텐츠 해시 (sha256)
+            analysis_kind: 분석 종류 ('image' / 'video')
+            model_version: 현재 AI 모델 버전 (모르면 None → 항상 miss)
+
+        Returns:
+            dict: 분석 결과 복사본, 없으면 None
+        """
+        if not content_hash or not model_version:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        key = (content_hash, model_version, analysis_kind)
+
+        with self._lock:
+            self._sync_model_version(model_version)
+
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                    self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(self, content_hash, analysis_kind, result):
+        """분석 결과 저장 (결과의 ai_model_version 기준)"""
+        model_version = result.get('ai_model_version')
+        if not content_hash or not model_version:
+            return
+
+        key = (content_hash, model_version, analysis_kind)
+
+        with self._lock:
+            self._sync_model_version(model_version)
+
+            self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self):
+        """캐시 전체 무효화"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def _sync_model_version(self, model_version):
+        """모델 버전이 바뀌었으면 이전 버전 결과 삭제 (lock 안에서 호출)"""
+        if model_version == self.model_version:
+            return
+
+        if self.model_version is not None:
+            stale_keys = [key for key in self._entries if key[1] != model_version]
+            for key in stale_keys:
+                del self._entries[key]
+            self.invalidations += 1
+
+        self.model_version = model_version
+
+    def stats(self):
+        """캐시 적중 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'model_version': self.model_version,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """프로세스 전역 분석 결과 캐시 반환"""
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AnalysisResultCache()
+    return _cache
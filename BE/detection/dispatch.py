@@ -0,0 +1,240 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+
+from django.conf import settings
+
+from config.metrics import AI_LANE_IN_FLIGHT, AI_LANE_QUEUE_DEPTH, AI_LANE_SLO_MISSES, AI_LANE_WAIT_SECONDS
+
+
+class _Waiter:
+    """AI 호출 차례를 기다리는 요청 1건 (스레드는 Event, async는 Future로 깨운다)"""
+
+    def __init__(self, lane, loop=None):
+        self.lane = lane
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.granted_at = None
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+
+    def wake(self):
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class _Lane:
+    HOLD_SMOOTHING = 0.2  # 평균 점유 시간(EWMA) 가중치
+
+    def __init__(self, name, priority, max_concurrency, slo):
+        self.name = name
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+        self.slo = slo
+        self.waiters = deque()
+        self.in_flight = 0
+        self.granted = 0
+        self.slo_misses = 0
+        self.avg_hold = None  # 자리 1개를 점유하는 평균 시간 (초)
+
+    def record_hold(self, seconds):
+        if self.avg_hold is None:
+            self.avg_hold = seconds
+        else:
+            self.avg_hold += self.HOLD_SMOOTHING * (seconds - self.avg_hold)
+
+
+class AIDispatcher:
+    """
+    AI 호출 우선순위 디스패처 (프로세스 내)
+
+    레인(zoom / image / bulk)마다 우선순위, 동시 호출 상한, 대기 시간 SLO가 있다.
+    전체 동시 호출 수(AI_DISPATCH_MAX_CONCURRENCY)에 여유가 생기면 다음 순서로 차례를 준다.
+        1. 대기 시간이 레인 SLO를 넘긴 요청 중 SLO 대비 가장 오래 기다린 요청 (낮은 우선순위도 굶지 않음)
+        2. 우선순위가 가장 높은 레인의 가장 오래된 요청
+    bulk 레인의 상한을 전체보다 작게 두면 영상/보호 작업이 몰려도 실시간 요청 자리가 남는다.
+
+    스레드(sync 뷰, 영상 분석 워커)와 async 뷰가 같은 디스패처를 공유한다.
+    """
+
+    def __init__(self, max_concurrency=None, lanes=None):
+        self.max_concurrency = max_concurrency or settings.AI_DISPATCH_MAX_CONCURRENCY
+        lanes = lanes or settings.AI_DISPATCH_LANES
+        self.lanes = {
+            name: _Lane(name, config['priority'], config['max_concurrency'], config['slo'])
+            for name, config in lanes.items()
+        }
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    @contextmanager
+    def slot(self, lane):
+        """
+        AI 호출 차례를 기다렸다가 블록이 끝날 때까지 자리 점유 (스레드용)
+
+        with dispatcher.slot('bulk'):
+            response = client.post(...)
+        """
+        waiter = self._enqueue(lane)
+        waiter.event.wait()
+        try:
+            yield
+        finally:
+            self._release(waiter)
+
+    @asynccontextmanager
+    async def aslot(self, lane):
+        """slot의 async 버전 (기다리는 동안 이벤트 루프를 막지 않음)"""
+        waiter = self._enqueue(lane, asyncio.get_running_loop())
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            self._cancel(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release(waiter)
+
+    def queued(self, lane):
+        """레인에서 차례를 기다리는 요청 수"""
+        return len(self.lanes[lane].waiters)
+
+    def estimated_wait(self, lane):
+        """
+        지금 레인에 들어오면 기다릴 것으로 예상되는 시간 (초)
+
+        (대기 요청 수 / 레인 동시 호출 상한 + 1) × 평균 점유 시간. 아직 통계가 없으면 레인 SLO.
+        """
+        lane = self.lanes[lane]
+        with self._lock:
+            queued = len(lane.waiters)
+            avg_hold = lane.avg_hold
+        if avg_hold is None:
+            return lane.slo
+        return (queued / lane.max_concurrency + 1) * avg_hold
+
+    def snapshot(self):
+        """헬스체크 API용 레인별 상태"""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'max_concurrency': self.max_concurrency,
+                'in_flight': self.in_flight,
+                'lanes': {
+                    lane.name: {
+                        'priority': lane.priority,
+                        'max_concurrency': lane.max_concurrency,
+                        'slo_seconds': lane.slo,
+                        'in_flight': lane.in_flight,
+                        'queued': len(lane.waiters),
+                        'oldest_wait_seconds': (
+                            round(now - lane.waiters[0].enqueued_at, 2) if lane.waiters else None
+                        ),
+                        'granted': lane.granted,
+                        'slo_misses': lane.slo_misses,
+                        'avg_hold_seconds': round(lane.avg_hold, 3) if lane.avg_hold is not None else None,
+                    }
+                    for lane in self.lanes.values()
+                }
+            }
+
+    # ------------------------------------------------------------------
+    # 내부 (모두 self._lock 안에서 상태 변경)
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, lane_name, loop=None):
+        if lane_name not in self.lanes:
+            raise ValueError(f"알 수 없는 AI 호출 레인입니다: {lane_name}")
+
+        lane = self.lanes[lane_name]
+        waiter = _Waiter(lane, loop)
+        with self._lock:
+            lane.waiters.append(waiter)
+            AI_LANE_QUEUE_DEPTH.labels(lane=lane.name).inc()
+            self._dispatch()
+        return waiter
+
+    def _release(self, waiter):
+        lane = waiter.lane
+        with self._lock:
+            lane.record_hold(time.monotonic() - waiter.granted_at)
+            lane.in_flight -= 1
+            self.in_flight -= 1
+            AI_LANE_IN_FLIGHT.labels(lane=lane.name).dec()
+            self._dispatch()
+
+    def _cancel(self, waiter):
+        """기다리다 취소된 요청 정리 (이미 차례를 받았으면 자리 반납)"""
+        with self._lock:
+            granted = waiter.granted
+            if not granted:
+                waiter.lane.waiters.remove(waiter)
+                AI_LANE_QUEUE_DEPTH.labels(lane=waiter.lane.name).dec()
+        if granted:
+            self._release(waiter)
+
+    def _dispatch(self):
+        """빈 자리만큼 대기 중인 요청에 차례 부여"""
+        while self.in_flight < self.max_concurrency:
+            lane = self._next_lane()
+            if lane is None:
+                return
+
+            waiter = lane.waiters.popleft()
+            waited = time.monotonic() - waiter.enqueued_at
+
+            waiter.granted = True
+            waiter.granted_at = time.monotonic()
+            lane.in_flight += 1
+            lane.granted += 1
+            self.in_flight += 1
+            if waited > lane.slo:
+                lane.slo_misses += 1
+                AI_LANE_SLO_MISSES.labels(lane=lane.name).inc()
+
+            AI_LANE_QUEUE_DEPTH.labels(lane=lane.name).dec()
+            AI_LANE_IN_FLIGHT.labels(lane=lane.name).inc()
+            AI_LANE_WAIT_SECONDS.labels(lane=lane.name).observe(waited)
+            waiter.wake()
+
+    def _next_lane(self):
+        now = time.monotonic()
+        ready = [
+            lane for lane in self.lanes.values()
+            if lane.waiters and lane.in_flight < lane.max_concurrency
+        ]
+        if not ready:
+            return None
+
+        overdue = [
+            lane for lane in ready
+            if now - lane.waiters[0].enqueued_at > lane.slo
+        ]
+        if overdue:
+            return max(overdue, key=lambda lane: (now - lane.waiters[0].enqueued_at) / lane.slo)
+        return min(ready, key=lambda lane: lane.priority)
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_ai_dispatcher():
+    """프로세스 전역 AI 호출 디스패처 반환"""
+    global _dispatcher
+
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = AIDispatcher()
+    return _dispatcher
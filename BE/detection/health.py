@@ -0,0 +1,293 @@
+import logging
+import threading
+import time
+from collections import deque
+
+import requests
+from django.conf import settings
+
+from .ai_client import get_ai_client
+
+logger = logging.getLogger(__name__)
+
+
+class AIHealthMonitor:
+    """
+    AI 서버 상태 모니터 (TTL 캐시 + 서킷 브레이커)
+
+    실제 요청 결과와 백그라운드 /health 프로브 결과로 상태를 갱신하므로
+    요청마다 /health를 호출하지 않는다.
+
+    상태 전이:
+        closed    → open       연속 실패 또는 오류율이 임계치를 넘은 경우
+        open      → half_open  AI_CIRCUIT_RESET_TIMEOUT 경과 후 시험 요청 1건 허용
+        half_open → closed     시험 요청 성공
+        half_open → open       시험 요청 실패
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.client = get_ai_client()
+
+        self.cache_ttl = settings.AI_HEALTH_CACHE_TTL
+        self.probe_interval = settings.AI_HEALTH_PROBE_INTERVAL
+        self.probe_timeout = settings.AI_HEALTH_PROBE_TIMEOUT
+        self.failure_threshold = settings.AI_CIRCUIT_FAILURE_THRESHOLD
+        self.error_rate_threshold = settings.AI_CIRCUIT_ERROR_RATE_THRESHOLD
+        self.min_requests = settings.AI_CIRCUIT_MIN_REQUESTS
+        self.reset_timeout = settings.AI_CIRCUIT_RESET_TIMEOUT
+        self.window_seconds = settings.AI_HEALTH_WINDOW_SECONDS
+
+        self._lock = threading.Lock()
+        self._outcomes = deque()  # (monotonic 시간, 성공 여부)
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+        self.last_observed_at = None
+        self.last_success_at = None
+        self.last_probe_at = None
+        self.last_probe_ok = None
+        self.model_version = None
+
+        self._probing = False
+        self._prober = None
+
+    # ------------------------------------------------------------------
+    # 요청 전 확인
+    # ------------------------------------------------------------------
+
+    def is_available(self):
+        """
+        AI 서버로 요청을 보내도 되는지 확인 (네트워크 호출 없이 캐시된 상태 사용)
+
+        프로브는 백그라운드 스레드만 실행한다. 상태가 오래됐어도 요청 경로(async 뷰 포함)에서
+        /health를 호출하지 않고 마지막 상태로 판단하며, 실제 요청 결과로 서킷이 갱신된다.
+        """
+        self._ensure_prober()
+
+        with self._lock:
+            now = time.monotonic()
+
+            if self.state == self.CLOSED:
+                # 최근 프로브가 실패했고 그 뒤로 성공한 실제 요청이 없으면 사용 불가
+                return not (
+                    self.last_probe_ok is False
+                    and (self.last_success_at or 0) < self.last_probe_at
+                )
+
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self.trial_started_at = now
+                return True
+
+            # half_open: 시험 요청이 끝날 때까지 다른 요청은 차단
+            # (시험 요청 결과가 기록되지 않은 채 reset_timeout이 지나면 새 시험 허용)
+            if now - self.trial_started_at >= self.reset_timeout:
+                self.trial_started_at = now
+                return True
+            return False
+
+    # ------------------------------------------------------------------
+    # 결과 기록
+    # ------------------------------------------------------------------
+
+    def record_success(self, model_version=None):
+        """AI 서버 요청 성공 기록"""
+        with self._lock:
+            self._add_outcome(True)
+            self.last_success_at = time.monotonic()
+            self.consecutive_failures = 0
+            if model_version:
+                self.model_version = model_version
+            if self.state != self.CLOSED:
+                logger.info(f"AI 서버 서킷 닫힘: {self.base_url}")
+                self.state = self.CLOSED
+                self.opened_at = None
+                self.trial_started_at = None
+
+    def record_failure(self):
+        """AI 서버 요청 실패 기록 (연결 오류, 타임아웃, 5xx)"""
+        with self._lock:
+            self._add_outcome(False)
+            self.consecutive_failures += 1
+
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._should_trip()
+            ):
+                logger.warning(f"AI 서버 서킷 열림: {self.base_url}")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.trial_started_at = None
+
+    def record_exception(self, exc):
+        """
+        requests 예외를 결과로 기록
+
+        4xx 응답은 요청 자체의 문제(잘못된 파일 등)이므로 서버 장애로 보지 않는다.
+        """
+        response = getattr(exc, 'response', None)
+        if response is not None and response.status_code < 500:
+            self.record_success()
+        else:
+            self.record_failure()
+
+    # ------------------------------------------------------------------
+    # 프로브
+    # ------------------------------------------------------------------
+
+    def probe(self):
+        """/health 프로브 1회 실행 (동시에 여러 스레드가 프로브하지 않음)"""
+        with self._lock:
+            if self._probing:
+                return self.last_probe_ok
+            self._probing = True
+
+        ok = False
+        model_version = None
+        try:
+            response = self.client.get(
+                f"{self.base_url}/health",
+                timeout=self.probe_timeout
+            )
+            ok = response.status_code == 200
+            if ok:
+                try:
+                    model_version = response.json().get('model_version')
+                except (ValueError, AttributeError):
+                    model_version = None
+        except requests.exceptions.RequestException:
+            ok = False
+        finally:
+            with self._lock:
+                self._probing = False
+                self.last_probe_at = time.monotonic()
+                self.last_probe_ok = ok
+
+        self._record_probe(ok, model_version)
+        return ok
+
+    def _record_probe(self, ok, model_version):
+        with self._lock:
+            state = self.state
+            reset_elapsed = (
+                state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            )
+
+        # 서킷이 열린 동안은 reset_timeout이 지난 뒤의 프로브만 시험 요청으로 취급
+        if state == self.OPEN and not reset_elapsed:
+            return
+
+        if ok:
+            self.record_success(model_version)
+        else:
+            self.record_failure()
+
+    def _ensure_prober(self):
+        """백그라운드 프로브 스레드 시작 (최초 호출 시, fork 이후)"""
+        if self.probe_interval <= 0 or self._prober is not None:
+            return
+
+        with self._lock:
+            if self._prober is not None:
+                return
+            self._prober = threading.Thread(
+                target=self._probe_loop,
+                name=f"ai-health-prober:{self.base_url}",
+                daemon=True
+            )
+            self._prober.start()
+
+    def _probe_loop(self):
+        while True:
+            try:
+                self.probe()
+            except Exception as e:  # 프로브 스레드는 절대 죽지 않도록
+                logger.error(f"AI 서버 프로브 오류: {str(e)}")
+            time.sleep(self.probe_interval)
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+
+    def _is_stale(self):
+        """캐시된 상태가 TTL을 넘겼는지 (실제 요청/프로브 결과가 없을 때)"""
+        last = max(self.last_observed_at or 0, self.last_probe_at or 0)
+        return not last or time.monotonic() - last > self.cache_ttl
+
+    def _add_outcome(self, ok):
+        now = time.monotonic()
+        self.last_observed_at = now
+        self._outcomes.append((now, ok))
+        self._trim_outcomes(now)
+
+    def _trim_outcomes(self, now):
+        threshold = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < threshold:
+            self._outcomes.popleft()
+
+    def _error_rate(self):
+        total = len(self._outcomes)
+        if total == 0:
+            return 0.0
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return failures / total
+
+    def _should_trip(self):
+        if self.consecutive_failures >= self.failure_threshold:
+            return True
+        return (
+            len(self._outcomes) >= self.min_requests
+            and self._error_rate() >= self.error_rate_threshold
+        )
+
+    def snapshot(self):
+        """헬스체크 API용 현재 상태"""
+        with self._lock:
+            now = time.monotonic()
+            self._trim_outcomes(now)
+
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(self.reset_timeout - (now - self.opened_at), 0)
+
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'error_rate': round(self._error_rate(), 4),
+                'window_requests': len(self._outcomes),
+                'window_seconds': self.window_seconds,
+                'retry_in_seconds': round(retry_in, 1) if retry_in is not None else None,
+                'last_probe_ok': self.last_probe_ok,
+                'last_probe_age_seconds': (
+                    round(now - self.last_probe_at, 1) if self.last_probe_at else None
+                ),
+                'stale': self._is_stale(),
+                'model_version': self.model_version
+            }
+
+
+_monitors = {}
+_monitors_lock = threading.Lock()
+
+
+def get_health_monitor(base_url=None):
+    """AI 서버 URL별 프로세스 전역 상태 모니터 반환"""
+    base_url = base_url or settings.FASTAPI_URL
+
+    monitor = _monitors.get(base_url)
+    if monitor is None:
+        with _monitors_lock:
+            monitor = _monitors.get(base_url)
+            if monitor is None:
+                monitor = AIHealthMonitor(base_url)
+                _monitors[base_url] = monitor
+    return monitor
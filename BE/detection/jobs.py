@@ -0,0 +1,304 @@
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from .models import AnalysisRecord, DetectedPerson, VideoAnalysisJob
+from .services import AIModelService
+from config.metrics import VIDEO_QUEUE_JOBS
+from media_files.models import MediaFile
+from media_files.services import FileService
+
+logger = logging.getLogger(__name__)
+
+
+class VideoAnalysisQueue:
+    """
+    영상 분석 작업 큐
+
+    업로드 요청은 작업만 등록하고 바로 응답하며, 실제 AI 분석은
+    크기가 제한된 백그라운드 워커 풀에서 처리한다.
+
+    큐는 프로세스 메모리에 있으므로 작업에 등록한 프로세스(worker_id)를 기록하고,
+    재시작 / 배포 / OOM으로 주인을 잃은 작업은 recover_video_jobs가 주기적으로 정리한다.
+    """
+
+    DURATION_SMOOTHING = 0.2  # 평균 작업 시간(EWMA) 가중치
+
+    def __init__(self, max_workers=None, max_queue_size=None):
+        self.max_workers = max_workers or settings.VIDEO_ANALYSIS_WORKERS
+        self.max_queue_size = max_queue_size or settings.VIDEO_ANALYSIS_QUEUE_SIZE
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='video-analysis'
+        )
+        self._lock = threading.Lock()
+        self._pending = 0  # 이 프로세스에서 대기 + 처리 중인 작업 수
+        self.avg_duration = None  # 작업 1건 평균 처리 시간 (초)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._recovery = None
+        self._start_recovery()
+
+    @property
+    def capacity(self):
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def has_capacity(self):
+        """새 작업을 받을 수 있는지 확인"""
+        return self._pending < self.capacity
+
+    def estimated_wait(self):
+        """
+        지금 등록하면 처리가 시작될 때까지 예상 대기 시간 (초)
+
+        Returns:
+            float: 평균 작업 시간 통계가 없으면 None
+        """
+        if self.avg_duration is None:
+            return None
+        waiting = max(self._pending - self.max_workers + 1, 0)
+        return waiting / self.max_workers * self.avg_duration
+
+    def submit(self, job):
+        """
+        작업 등록
+
+        Returns:
+            bool: 등록 성공 여부 (큐가 가득 차면 False)
+        """
+        with self._lock:
+            if self._pending >= self.capacity:
+                return False
+            self._pending += 1
+        VIDEO_QUEUE_JOBS.inc()
+
+        VideoAnalysisJob.objects.filter(job_id=job.job_id).update(worker_id=self.worker_id)
+        job.worker_id = self.worker_id
+
+        self._executor.submit(self._run, job.job_id)
+        return True
+
+    def adopt(self, job):
+        """
+        주인을 잃은 대기 작업을 이 프로세스 큐로 가져옴 (유휴 워커가 있을 때만)
+
+        원래 프로세스가 살아 있어도 worker_id가 바뀌므로 그 프로세스는 작업을 건너뛴다.
+
+        Returns:
+            bool: 가져왔는지 여부
+        """
+        if self._pending >= self.max_workers:
+            return False
+        adopted = VideoAnalysisJob.objects.filter(
+            job_id=job.job_id,
+            job_status='queued',
+            worker_id=job.worker_id
+        ).update(worker_id=self.worker_id)
+        return bool(adopted) and self.submit(job)
+
+    def _run(self, job_id):
+        close_old_connections()
+        start = time.monotonic()
+        try:
+            process_video_job(job_id, worker_id=self.worker_id)
+        except Exception as e:
+            logger.exception(f"영상 분석 작업 실패: job_id={job_id}")
+            VideoAnalysisJob.objects.filter(job_id=job_id).update(
+                job_status='failed',
+                error_message=str(e),
+                processing_completed_at=timezone.now()
+            )
+        finally:
+            duration = time.monotonic() - start
+            with self._lock:
+                self._pending -= 1
+                if self.avg_duration is None:
+                    self.avg_duration = duration
+                else:
+                    self.avg_duration += self.DURATION_SMOOTHING * (duration - self.avg_duration)
+            VIDEO_QUEUE_JOBS.dec()
+            # 워커 스레드의 DB 연결은 요청 사이클 밖이므로 직접 정리
+            connection.close()
+
+    def _start_recovery(self):
+        """주인을 잃은 작업 정리 스레드 시작 (시작 직후 1회 + 주기적으로)"""
+        if settings.VIDEO_ANALYSIS_RECOVERY_INTERVAL <= 0:
+            return
+        self._recovery = threading.Thread(
+            target=self._recovery_loop,
+            name='video-analysis-recovery',
+            daemon=True
+        )
+        self._recovery.start()
+
+    def _recovery_loop(self):
+        while True:
+            try:
+                recover_video_jobs(self)
+            except Exception as e:  # 정리 스레드는 절대 죽지 않도록
+                logger.error(f"영상 분석 작업 정리 오류: {str(e)}")
+            finally:
+                connection.close()
+            time.sleep(settings.VIDEO_ANALYSIS_RECOVERY_INTERVAL)
+
+
+def process_video_job(job_id, worker_id=None):
+    """
+    영상 분석 작업 1건 처리 (워커 스레드에서 실행)
+
+    worker_id가 주어지면 그 프로세스가 등록한 대기 작업일 때만 처리한다
+    (다른 프로세스가 가져갔거나 이미 정리된 작업은 None 반환).
+    """
+    claim = VideoAnalysisJob.objects.filter(job_id=job_id, job_status='queued')
+    if worker_id is not None:
+        claim = claim.filter(worker_id=worker_id)
+    if not claim.update(job_status='processing', processing_started_at=timezone.now()):
+        return None
+
+    job = VideoAnalysisJob.objects.select_related('user').get(job_id=job_id)
+    media_file = MediaFile.objects.get(file_id=job.media_file_id)
+
+    # AI 분석
+    ai_service = AIModelService()
+    result = ai_service.analyze_video(media_file)
+
+    if not result['success']:
+        job.job_status = 'failed'
+        job.error_message = result['error']
+        job.processing_completed_at = timezone.now()
+        job.save(update_fields=['job_status', 'error_message', 'processing_completed_at'])
+        return job
+
+    # 분석 기록 + 인물별 결과 저장
+    with transaction.atomic():
+        record = AnalysisRecord.objects.create(
+            user=job.user,
+            analysis_type='video',
+            file_name=media_file.original_name,
+            file_size=media_file.file_size,
+            file_format=media_file.file_format,
+            original_path=media_file.file_path,
+            analysis_result=result['analysis_result'],
+            confidence_score=result['confidence_score'],
+            detection_details=result.get('detection_details', []),  # ✅ 사람별 상세 결과
+            processing_time=result['processing_time'],
+            ai_model_version=result['ai_model_version']
+        )
+        DetectedPerson.create_for_record(record)
+
+    # ✅ 관계 연결
+    media_file.related_model = 'AnalysisRecord'
+    media_file.related_record_id = record.record_id
+    media_file.save()
+
+    job.record = record
+    job.job_status = 'completed'
+    job.processing_completed_at = timezone.now()
+    job.save(update_fields=['record', 'job_status', 'processing_completed_at'])
+    return job
+
+
+def enqueue_video_analysis(user, media_file, queue=None):
+    """
+    영상 분석 작업 생성 후 큐에 등록
+    
+    Returns:
+        VideoAnalysisJob: 등록된 작업 (큐가 가득 차면 None, 파일은 삭제)
+    """
+    queue = queue or get_video_analysis_queue()
+    
+    job = VideoAnalysisJob.objects.create(
+        user=user,
+        media_file_id=media_file.file_id,
+        job_status='queued'
+    )
+    
+    if not queue.submit(job):
+        job.job_status = 'failed'
+        job.error_message = '작업 큐가 가득 찼습니다.'
+        job.save()
+        FileService(user).delete_file(media_file.file_id, hard_delete=True)
+        return None
+    
+    return job
+
+
+def recover_video_jobs(queue):
+    """
+    재시작 / 배포 / OOM으로 주인을 잃은 작업 정리
+
+    - 처리 중: VIDEO_ANALYSIS_STALE_AFTER보다 오래 처리 중인 작업은 실패 처리
+      (AI 호출 타임아웃보다 길게 살아 있을 수 없음, 워커를 죽였을 수 있어 다시 돌리지 않음)
+    - 대기 중: VIDEO_ANALYSIS_REQUEUE_AFTER보다 오래 기다린 작업은 유휴 워커가 있으면 이 큐로 가져옴
+
+    Returns:
+        tuple: (실패 처리한 작업 수, 가져온 작업 수)
+    """
+    now = timezone.now()
+
+    failed = VideoAnalysisJob.objects.filter(
+        job_status='processing',
+        processing_started_at__lt=now - timedelta(seconds=settings.VIDEO_ANALYSIS_STALE_AFTER)
+    ).update(
+        job_status='failed',
+        error_message='작업이 중단되었습니다. 다시 요청해주세요.',
+        processing_completed_at=now
+    )
+    if failed:
+        logger.warning(f"중단된 영상 분석 작업 {failed}건을 실패 처리했습니다.")
+
+    orphans = VideoAnalysisJob.objects.filter(
+        job_status='queued',
+        created_at__lt=now - timedelta(seconds=settings.VIDEO_ANALYSIS_REQUEUE_AFTER)
+    ).exclude(worker_id=queue.worker_id).order_by('job_id')
+
+    adopted = 0
+    for job in orphans[:queue.max_workers]:
+        if not queue.adopt(job):
+            break
+        adopted += 1
+    return failed, adopted
+
+
+def get_queue_position(job):
+    """
+    대기 중인 작업의 큐 위치 (1부터 시작, 대기 중이 아니면 None)
+
+    작업을 가진 프로세스의 큐 안에서 앞선 대기 작업 수로 계산한다
+    (다른 프로세스 / 주인을 잃은 작업은 세지 않음).
+    """
+    if job.job_status != 'queued':
+        return None
+
+    return VideoAnalysisJob.objects.filter(
+        job_status='queued',
+        worker_id=job.worker_id,
+        job_id__lt=job.job_id
+    ).count() + 1
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_video_analysis_queue():
+    """프로세스 전역 영상 분석 큐 반환 (지연 생성, gunicorn fork 이후 생성됨)"""
+    global _queue
+
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = VideoAnalysisQueue()
+    return _queue
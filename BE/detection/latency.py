@@ -0,0 +1,175 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+from config.metrics import AI_HEDGED_REQUESTS
+
+
+# 요청 크기 구간 (bytes) - 같은 라우트라도 파일 크기에 따라 처리 시간이 크게 다르다
+SIZE_BUCKETS = (
+    (256 * 1024, '256KB'),
+    (1024 * 1024, '1MB'),
+    (4 * 1024 * 1024, '4MB'),
+    (16 * 1024 * 1024, '16MB'),
+    (64 * 1024 * 1024, '64MB'),
+    (256 * 1024 * 1024, '256MB'),
+)
+
+
+def size_bucket(size):
+    """요청 크기(bytes)가 속한 구간 라벨 (크기를 모르면 'unknown')"""
+    if size is None:
+        return 'unknown'
+    for limit, label in SIZE_BUCKETS:
+        if size <= limit:
+            return label
+    return 'large'
+
+
+class LatencyTracker:
+    """
+    라우트 / 요청 크기 구간별 AI 호출 지연 시간 통계 (프로세스 내)
+
+    성공한 호출의 최근 지연 시간으로 다음 값을 정한다.
+    - 타임아웃: p99 × AI_ADAPTIVE_TIMEOUT_MULTIPLIER (AI_ADAPTIVE_TIMEOUT_MIN ~ 라우트 상한 사이)
+    - 헤지 요청 시점: p95
+    표본이 AI_LATENCY_MIN_SAMPLES보다 적으면 라우트 상한 타임아웃을 쓰고 헤지하지 않는다.
+
+    헤지 요청 수는 헤지 대상 요청의 AI_HEDGE_MAX_RATIO 비율까지로 제한한다
+    (AI 서버 전체가 느려졌을 때 헤지가 부하를 두 배로 만들지 않도록).
+    """
+
+    def __init__(self, window=None, min_samples=None, multiplier=None, min_timeout=None, max_hedge_ratio=None):
+        self.window = window or settings.AI_LATENCY_WINDOW
+        self.min_samples = min_samples or settings.AI_LATENCY_MIN_SAMPLES
+        self.multiplier = multiplier or settings.AI_ADAPTIVE_TIMEOUT_MULTIPLIER
+        self.min_timeout = min_timeout or settings.AI_ADAPTIVE_TIMEOUT_MIN
+        self.max_hedge_ratio = (
+            settings.AI_HEDGE_MAX_RATIO if max_hedge_ratio is None else max_hedge_ratio
+        )
+
+        self._lock = threading.Lock()
+        self._samples = {}  # (route, bucket) -> deque[초]
+        self.hedge_candidates = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def record(self, route, size, seconds):
+        """성공한 호출의 지연 시간 기록 (실패 / 타임아웃은 기록하지 않음)"""
+        key = (route, size_bucket(size))
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, route, size, p):
+        """
+        최근 지연 시간의 p 백분위수 (초)
+
+        Returns:
+            float: 표본이 부족하면 None
+        """
+        with self._lock:
+            samples = self._samples.get((route, size_bucket(size)))
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+    def timeout_for(self, route, size, ceiling):
+        """라우트 / 크기 구간의 읽기 타임아웃 (초, ceiling을 넘지 않음)"""
+        p99 = self.percentile(route, size, 99)
+        if p99 is None:
+            return ceiling
+        return min(max(p99 * self.multiplier, self.min_timeout), ceiling)
+
+    def hedge_delay(self, route, size):
+        """헤지 요청을 보낼 시점 (초, 첫 요청이 p95를 넘기면), 표본이 부족하면 None"""
+        delay = self.percentile(route, size, 95)
+        if delay is not None:
+            with self._lock:
+                self.hedge_candidates += 1
+        return delay
+
+    def try_hedge(self, route):
+        """헤지 비율 상한 안이면 헤지 요청 1건 허용"""
+        with self._lock:
+            if self.hedges_sent >= self.hedge_candidates * self.max_hedge_ratio + 1:
+                return False
+            self.hedges_sent += 1
+        AI_HEDGED_REQUESTS.labels(route=route, result='sent').inc()
+        return True
+
+    def record_hedge_win(self, route):
+        """헤지 요청 응답이 먼저 와서 사용한 경우"""
+        with self._lock:
+            self.hedges_won += 1
+        AI_HEDGED_REQUESTS.labels(route=route, result='won').inc()
+
+    def snapshot(self):
+        """헬스체크 API용 구간별 표본 수 / p50 / p95 / p99 (ms) + 헤지 통계"""
+        with self._lock:
+            items = [(key, sorted(samples)) for key, samples in self._samples.items()]
+            hedging = {
+                'candidates': self.hedge_candidates,
+                'sent': self.hedges_sent,
+                'won': self.hedges_won,
+            }
+
+        def percentile(ordered, p):
+            return round(ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)] * 1000, 1)
+
+        return {
+            'routes': [
+                {
+                    'route': route,
+                    'size_bucket': bucket,
+                    'samples': len(ordered),
+                    'p50': percentile(ordered, 50),
+                    'p95': percentile(ordered, 95),
+                    'p99': percentile(ordered, 99),
+                }
+                for (route, bucket), ordered in sorted(items)
+            ],
+            'hedging': hedging
+        }
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker():
+    """프로세스 전역 지연 시간 통계 반환"""
+    global _tracker
+
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = LatencyTracker()
+    return _tracker
+
+
+_hedge_executor = None
+_hedge_executor_lock = threading.Lock()
+
+
+def get_hedge_executor():
+    """
+    sync 헤지 요청용 스레드 풀 (프로세스 전역)
+
+    requests 호출은 중간에 취소할 수 없어 늦은 쪽 요청도 적응형 타임아웃까지 이 풀에서 끝난다.
+    """
+    global _hedge_executor
+
+    if _hedge_executor is None:
+        with _hedge_executor_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(
+                    max_workers=settings.AI_HEDGE_WORKERS,
+                    thread_name_prefix='ai-hedge'
+                )
+    return _hedge_executor
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from detection.models import AnalysisRecord, DetectedPerson
+
+
+class Command(BaseCommand):
+    """
+    기존 분석 기록의 detection_details(JSON)를 인물별 탐지 결과 테이블로 옮김
+
+    이미 인물별 결과가 있는 기록은 건너뛰므로 여러 번 실행해도 된다.
+
+    예) python manage.py backfill_detected_persons
+        python manage.py backfill_detected_persons --batch-size 200
+    """
+
+    help = '기존 분석 기록의 detection_details를 인물별 탐지 결과 테이블로 옮김'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 처리할 분석 기록 수 (기본 500)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        records = AnalysisRecord.objects.filter(
+            detection_details__isnull=False
+        ).exclude(
+            Exists(DetectedPerson.objects.filter(record=OuterRef('pk')))
+        ).only('record_id', 'user_id', 'detection_details').order_by('record_id')
+
+        record_count = 0
+        person_count = 0
+        last_id = 0
+        while True:
+            batch = list(records.filter(record_id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+
+            persons = []
+            for record in batch:
+                persons.extend(DetectedPerson.from_details(record, record.detection_details))
+
+            with transaction.atomic():
+                DetectedPerson.objects.bulk_create(persons, ignore_conflicts=True)
+
+            record_count += len(batch)
+            person_count += len(persons)
+            last_id = batch[-1].record_id
+
+        self.stdout.write(
+            f"분석 기록 {record_count}건에서 인물별 결과 {person_count}건을 옮겼습니다."
+        )
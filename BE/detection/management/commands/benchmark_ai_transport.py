@@ -0,0 +1,189 @@
+import json
+import os
+import shutil
+import statistics
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from detection.services import AIModelService
+from media_files.models import MediaFile
+
+
+class Command(BaseCommand):
+    """
+    AI 서버 파일 전송 방식별 분석 지연 시간 비교
+
+    같은 파일을 multipart / path / s3 방식으로 반복 분석해 종단 간 지연 시간을 측정한다.
+    분석 결과 캐시는 사용하지 않는다.
+
+    예) python manage.py benchmark_ai_transport sample.mp4 --iterations 5
+    """
+
+    help = 'AI 서버 파일 전송 방식(multipart/path/s3)별 분석 지연 시간 비교'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='분석할 이미지 또는 영상 파일 경로')
+        parser.add_argument('--iterations', type=int, default=10, help='전송 방식별 반복 횟수')
+        parser.add_argument('--warmup', type=int, default=1, help='측정 전 예열 요청 수')
+        parser.add_argument(
+            '--transports',
+            default=','.join(AIModelService.TRANSPORTS),
+            help='비교할 전송 방식 (쉼표 구분)'
+        )
+        parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    def handle(self, *args, **options):
+        source = options['file']
+        if not os.path.isfile(source):
+            raise CommandError(f"파일을 찾을 수 없습니다: {source}")
+
+        transports = [t.strip() for t in options['transports'].split(',') if t.strip()]
+        unknown = set(transports) - set(AIModelService.TRANSPORTS)
+        if unknown:
+            raise CommandError(f"지원하지 않는 전송 방식입니다: {', '.join(sorted(unknown))}")
+
+        extension = os.path.splitext(source)[1].lstrip('.').lower()
+        if extension in settings.VIDEO_ALLOWED_EXTENSIONS:
+            file_type = 'video'
+        elif extension in settings.IMAGE_ALLOWED_EXTENSIONS:
+            file_type = 'image'
+        else:
+            raise CommandError(f"이미지 또는 영상 파일만 사용할 수 있습니다: {extension}")
+
+        if not AIModelService().check_health():
+            raise CommandError("AI 서버에 연결할 수 없습니다 (Mock 응답으로는 비교할 수 없음).")
+
+        # 공유 볼륨(MEDIA_ROOT) 아래에 벤치마크용 복사본 생성
+        filename = f"{uuid.uuid4().hex}.{extension}"
+        relative_path = os.path.join('benchmark', filename)
+        local_path = os.path.join(settings.MEDIA_ROOT, relative_path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        shutil.copyfile(source, local_path)
+
+        local_file = self._build_media_file(source, file_type, extension, filename, relative_path)
+        s3_file = None
+        s3_storage = None
+
+        try:
+            if 's3' in transports:
+                s3_file, s3_storage = self._upload_to_s3(local_file, local_path, relative_path)
+                if s3_file is None:
+                    transports.remove('s3')
+
+            results = []
+            for transport in transports:
+                media_file = s3_file if transport == 's3' else local_file
+                results.append(self._run(transport, media_file, file_type, options))
+        finally:
+            os.remove(local_path)
+            if s3_file is not None:
+                s3_storage.delete(s3_file.s3_key)
+
+        if options['json']:
+            self.stdout.write(json.dumps({
+                'file': source,
+                'file_size': local_file.file_size,
+                'results': results
+            }, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(
+            f"\n파일: {source} ({local_file.file_size / (1024 * 1024):.1f}MB), "
+            f"반복: {options['iterations']}회\n"
+        )
+        self.stdout.write(
+            f"{'전송 방식':<10} {'성공':>5} {'실패':>5} {'평균(ms)':>10} "
+            f"{'p50(ms)':>10} {'p95(ms)':>10} {'최대(ms)':>10}"
+        )
+        for row in results:
+            self.stdout.write(
+                f"{row['transport']:<10} {row['succeeded']:>5} {row['failed']:>5} "
+                f"{row['mean_ms']:>10.1f} {row['p50_ms']:>10.1f} "
+                f"{row['p95_ms']:>10.1f} {row['max_ms']:>10.1f}"
+            )
+
+    def _build_media_file(self, source, file_type, extension, filename, relative_path):
+        """DB에 저장하지 않는 벤치마크용 MediaFile (콘텐츠 해시가 없어 캐시 미사용)"""
+        return MediaFile(
+            original_name=os.path.basename(source),
+            file_name=filename,
+            file_size=os.path.getsize(source),
+            file_type=file_type,
+            file_format=extension,
+            storage_type='local',
+            file_path=relative_path,
+            purpose='detection',
+            is_temporary=True,
+            metadata={}
+        )
+
+    def _upload_to_s3(self, local_file, local_path, relative_path):
+        """S3에 복사본 업로드 (설정이 없거나 실패하면 s3 방식은 건너뜀)"""
+        if not settings.AWS_STORAGE_BUCKET_NAME:
+            self.stderr.write("AWS_STORAGE_BUCKET_NAME이 없어 s3 방식은 건너뜁니다.")
+            return None, None
+
+        from media_files.storage import S3Storage
+
+        s3_storage = S3Storage()
+        s3_key = relative_path.replace(os.sep, '/')
+        if not s3_storage.upload(local_path, s3_key):
+            self.stderr.write("S3 업로드에 실패해 s3 방식은 건너뜁니다.")
+            return None, None
+
+        s3_file = MediaFile(
+            original_name=local_file.original_name,
+            file_name=local_file.file_name,
+            file_size=local_file.file_size,
+            file_type=local_file.file_type,
+            file_format=local_file.file_format,
+            storage_type='s3',
+            file_path=f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{s3_key}",
+            s3_key=s3_key,
+            s3_bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            purpose='detection',
+            is_temporary=True,
+            metadata={}
+        )
+        return s3_file, s3_storage
+
+    def _run(self, transport, media_file, file_type, options):
+        """전송 방식 하나로 반복 분석하고 지연 시간 통계 반환"""
+        service = AIModelService(transport=transport)
+        analyze = service.analyze_video if file_type == 'video' else service.analyze_image
+
+        for _ in range(options['warmup']):
+            analyze(media_file)
+
+        latencies = []
+        failed = 0
+        for _ in range(options['iterations']):
+            started = time.perf_counter()
+            result = analyze(media_file)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if result['success']:
+                latencies.append(elapsed_ms)
+            else:
+                failed += 1
+
+        latencies.sort()
+        return {
+            'transport': transport,
+            'succeeded': len(latencies),
+            'failed': failed,
+            'mean_ms': statistics.mean(latencies) if latencies else 0.0,
+            'p50_ms': self._percentile(latencies, 50),
+            'p95_ms': self._percentile(latencies, 95),
+            'max_ms': latencies[-1] if latencies else 0.0
+        }
+
+    @staticmethod
+    def _percentile(sorted_values, percent):
+        """정렬된 값의 백분위수 (nearest-rank)"""
+        if not sorted_values:
+            return 0.0
+        rank = max(1, -(-len(sorted_values) * percent // 100))
+        return sorted_values[int(rank) - 1]
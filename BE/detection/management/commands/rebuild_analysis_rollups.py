@@ -0,0 +1,45 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from detection.models import AnalysisDailyRollup
+
+
+class Command(BaseCommand):
+    """
+    사용자별 일별 분석 집계를 분석 기록 / Zoom 캡처에서 다시 계산 (기존 기록 백필)
+
+    지정한 범위의 집계를 지우고 다시 만들므로 여러 번 실행해도 된다.
+
+    예) python manage.py rebuild_analysis_rollups
+        python manage.py rebuild_analysis_rollups --since 2025-01-01 --user-id 3
+    """
+
+    help = '사용자별 일별 분석 집계를 분석 기록 / Zoom 캡처에서 다시 계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='다시 계산할 사용자 ID (여러 번 지정 가능, 없으면 전체)'
+        )
+        parser.add_argument(
+            '--since',
+            type=date.fromisoformat,
+            help='이 날짜(YYYY-MM-DD)부터 다시 계산 (없으면 전체 기간)'
+        )
+        parser.add_argument(
+            '--until',
+            type=date.fromisoformat,
+            help='이 날짜(YYYY-MM-DD)까지 다시 계산 (없으면 오늘까지)'
+        )
+
+    def handle(self, *args, **options):
+        count = AnalysisDailyRollup.rebuild(
+            user_ids=options['user_ids'],
+            start=options['since'],
+            end=options['until']
+        )
+        self.stdout.write(f"일별 분석 집계 {count}건을 다시 계산했습니다.")
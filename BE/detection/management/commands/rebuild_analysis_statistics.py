@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from detection.models import UserAnalysisStatistics
+
+
+class Command(BaseCommand):
+    """
+    사용자별 분석 통계 카운터를 분석 기록에서 다시 계산
+
+    예) python manage.py rebuild_analysis_statistics
+        python manage.py rebuild_analysis_statistics --user-id 3 --user-id 7
+    """
+
+    help = '사용자별 분석 통계 카운터를 분석 기록에서 다시 계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='다시 계산할 사용자 ID (여러 번 지정 가능, 없으면 전체)'
+        )
+
+    def handle(self, *args, **options):
+        statistics = UserAnalysisStatistics.rebuild(user_ids=options['user_ids'])
+        self.stdout.write(f"사용자 {len(statistics)}명의 분석 통계를 다시 계산했습니다.")
@@ -0,0 +1,98 @@
+# Generated by Django 5.1 on 2026-10-17 00:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("detection", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VideoAnalysisJob",
+            fields=[
+                ("job_id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "media_file_id",
+                    models.BigIntegerField(verbose_name="미디어 파일 ID"),
+                ),
+                (
+                    "job_status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "대기 중"),
+                            ("processing", "처리 중"),
+                            ("completed", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                        verbose_name="작업 상태",
+                    ),
+                ),
+                (
+                    "error_message",
+                    models.TextField(blank=True, null=True, verbose_name="오류 메시지"),
+                ),
+                (
+                    "processing_started_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="처리 시작 시간"
+                    ),
+                ),
+                (
+                    "processing_completed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="처리 완료 시간"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "record",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="video_jobs",
+                        to="detection.analysisrecord",
+                        verbose_name="분석 기록",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="video_analysis_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "영상 분석 작업",
+                "verbose_name_plural": "영상 분석 작업 목록",
+                "db_table": "video_analysis_jobs",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="videoanalysisjob",
+            index=models.Index(
+                fields=["user", "-created_at"], name="video_analy_user_id_979f13_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="videoanalysisjob",
+            index=models.Index(
+                fields=["job_status"], name="video_analy_job_sta_98fb97_idx"
+            ),
+        ),
+    ]
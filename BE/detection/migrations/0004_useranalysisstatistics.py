@@ -0,0 +1,72 @@
+# Generated by Django 5.1 on 2026-10-17 00:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("detection", "0003_videoanalysisjob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAnalysisStatistics",
+            fields=[
+                (
+                    "statistics_id",
+                    models.BigAutoField(primary_key=True, serialize=False),
+                ),
+                (
+                    "total_count",
+                    models.IntegerField(default=0, verbose_name="전체 분석 수"),
+                ),
+                ("safe_count", models.IntegerField(default=0, verbose_name="안전")),
+                (
+                    "suspicious_count",
+                    models.IntegerField(default=0, verbose_name="의심"),
+                ),
+                (
+                    "deepfake_count",
+                    models.IntegerField(default=0, verbose_name="딥페이크"),
+                ),
+                ("image_count", models.IntegerField(default=0, verbose_name="이미지")),
+                ("video_count", models.IntegerField(default=0, verbose_name="영상")),
+                (
+                    "screenshot_count",
+                    models.IntegerField(default=0, verbose_name="스크린샷"),
+                ),
+                (
+                    "zoom_count",
+                    models.IntegerField(default=0, verbose_name="Zoom 캡처"),
+                ),
+                (
+                    "last_analyzed_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="마지막 분석 일시"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="analysis_statistics",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "사용자 분석 통계",
+                "verbose_name_plural": "사용자 분석 통계 목록",
+                "db_table": "user_analysis_statistics",
+            },
+        ),
+    ]
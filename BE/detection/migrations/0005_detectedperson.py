@@ -0,0 +1,84 @@
+# Generated by Django 5.1 on 2026-10-17 01:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("detection", "0004_useranalysisstatistics"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DetectedPerson",
+            fields=[
+                (
+                    "detection_id",
+                    models.BigAutoField(primary_key=True, serialize=False),
+                ),
+                ("person_id", models.IntegerField(verbose_name="인물 번호")),
+                ("is_deepfake", models.BooleanField(verbose_name="딥페이크 여부")),
+                (
+                    "confidence",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=5, verbose_name="신뢰도 (%)"
+                    ),
+                ),
+                (
+                    "detection_image_url",
+                    models.TextField(
+                        blank=True, null=True, verbose_name="탐지 이미지 URL"
+                    ),
+                ),
+                (
+                    "heatmap_url",
+                    models.TextField(blank=True, null=True, verbose_name="히트맵 URL"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "record",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="detected_persons",
+                        to="detection.analysisrecord",
+                        verbose_name="분석 기록",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="detected_persons",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "인물별 탐지 결과",
+                "verbose_name_plural": "인물별 탐지 결과 목록",
+                "db_table": "detected_persons",
+                "ordering": ["record_id", "person_id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="detectedperson",
+            index=models.Index(
+                fields=["user", "is_deepfake", "confidence"],
+                name="detected_pe_user_id_a3b77b_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="detectedperson",
+            constraint=models.UniqueConstraint(
+                fields=("record", "person_id"), name="unique_detected_person_per_record"
+            ),
+        ),
+    ]
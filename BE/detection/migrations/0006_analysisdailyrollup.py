@@ -0,0 +1,75 @@
+# Generated by Django 5.1 on 2026-10-17 01:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("detection", "0005_detectedperson"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalysisDailyRollup",
+            fields=[
+                ("rollup_id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "total_count",
+                    models.IntegerField(default=0, verbose_name="전체 분석 수"),
+                ),
+                ("safe_count", models.IntegerField(default=0, verbose_name="안전")),
+                (
+                    "suspicious_count",
+                    models.IntegerField(default=0, verbose_name="의심"),
+                ),
+                (
+                    "deepfake_count",
+                    models.IntegerField(default=0, verbose_name="딥페이크"),
+                ),
+                ("image_count", models.IntegerField(default=0, verbose_name="이미지")),
+                ("video_count", models.IntegerField(default=0, verbose_name="영상")),
+                (
+                    "screenshot_count",
+                    models.IntegerField(default=0, verbose_name="스크린샷"),
+                ),
+                (
+                    "zoom_count",
+                    models.IntegerField(default=0, verbose_name="Zoom 캡처"),
+                ),
+                (
+                    "zoom_alert_count",
+                    models.IntegerField(default=0, verbose_name="Zoom 경고"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="analysis_daily_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 분석 집계",
+                "verbose_name_plural": "일별 분석 집계 목록",
+                "db_table": "analysis_daily_rollups",
+                "ordering": ["user", "date"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="analysisdailyrollup",
+            constraint=models.UniqueConstraint(
+                fields=("user", "date"), name="unique_analysis_rollup_per_day"
+            ),
+        ),
+    ]
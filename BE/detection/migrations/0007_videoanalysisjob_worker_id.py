@@ -0,0 +1,24 @@
+# Generated by Django 5.1 on 2026-10-17 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("detection", "0006_analysisdailyrollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videoanalysisjob",
+            name="worker_id",
+            field=models.CharField(
+                blank=True,
+                help_text="작업을 큐에 등록한 프로세스 (호스트명:PID)",
+                max_length=100,
+                null=True,
+                verbose_name="처리 프로세스",
+            ),
+        ),
+    ]
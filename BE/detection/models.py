@@ -1,5 +1,12 @@
-from django.db import models
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import TruncDate
 from django.conf import settings
+from django.utils import timezone
 
 
 class AnalysisRecord(models.Model):
@@ -79,4 +86,583 @@ class AnalysisRecord(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.file_name} - {self.get_analysis_result_display()}"
\ No newline at end of file
+        return f"{self.file_name} - {self.get_analysis_result_display()}"
+    
+    def save(self, *args, **kwargs):
+        # ✅ 새 기록이면 같은 트랜잭션에서 사용자 통계 갱신
+        is_new = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_new:
+                UserAnalysisStatistics.increment([self])
+                AnalysisDailyRollup.increment([self])
+    
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            UserAnalysisStatistics.decrement([self])
+            AnalysisDailyRollup.decrement([self])
+            return super().delete(*args, **kwargs)
+
+
+class DetectedPerson(models.Model):
+    """
+    분석 기록의 사람별 탐지 결과
+
+    AnalysisRecord.detection_details(JSON)를 행으로 풀어 둔 테이블.
+    "신뢰도 90% 이상 딥페이크 인물이 있는 기록" 같은 조건을 인덱스로 찾을 수 있다.
+    detection_details는 기존 응답 형식 유지를 위해 그대로 저장한다.
+    """
+    
+    detection_id = models.BigAutoField(primary_key=True)
+    record = models.ForeignKey(
+        AnalysisRecord,
+        on_delete=models.CASCADE,
+        related_name='detected_persons',
+        verbose_name='분석 기록'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='detected_persons',
+        verbose_name='사용자'
+    )
+    person_id = models.IntegerField(verbose_name='인물 번호')
+    is_deepfake = models.BooleanField(verbose_name='딥페이크 여부')
+    confidence = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        verbose_name='신뢰도 (%)'
+    )
+    detection_image_url = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name='탐지 이미지 URL'
+    )
+    heatmap_url = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name='히트맵 URL'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    
+    class Meta:
+        db_table = 'detected_persons'
+        verbose_name = '인물별 탐지 결과'
+        verbose_name_plural = '인물별 탐지 결과 목록'
+        ordering = ['record_id', 'person_id']
+        indexes = [
+            models.Index(fields=['user', 'is_deepfake', 'confidence']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['record', 'person_id'],
+                name='unique_detected_person_per_record'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"기록 #{self.record_id} - 인물 {self.person_id}"
+    
+    @classmethod
+    def from_details(cls, record, detection_details):
+        """detection_details 목록을 저장 전 DetectedPerson 객체로 변환"""
+        return [
+            cls(
+                record=record,
+                user_id=record.user_id,
+                person_id=detail.get('person_id', index + 1),
+                is_deepfake=bool(detail.get('is_deepfake')),
+                confidence=round(float(detail.get('confidence') or 0), 2),
+                detection_image_url=detail.get('detection_image_url'),
+                heatmap_url=detail.get('heatmap_url')
+            )
+            for index, detail in enumerate(detection_details or [])
+        ]
+    
+    @classmethod
+    def create_for_record(cls, record):
+        """분석 기록의 detection_details를 한 번에 저장"""
+        return cls.objects.bulk_create(
+            cls.from_details(record, record.detection_details)
+        )
+
+
+class UserAnalysisStatistics(models.Model):
+    """
+    사용자별 분석 통계 (집계 카운터)
+    
+    AnalysisRecord 저장/삭제와 같은 트랜잭션에서 F() 연산으로 갱신한다.
+    bulk_create / QuerySet.delete는 save()/delete()를 거치지 않으므로
+    increment / decrement를 직접 호출해야 한다 (increment는 저장 후, decrement는 삭제 전).
+    통계 행이 없는 사용자(도입 전부터 기록이 있던 사용자)는 먼저 기록에서 계산해 만든다.
+    어긋난 값은 rebuild_analysis_statistics 명령으로 다시 계산한다.
+    """
+    
+    RESULT_FIELDS = {
+        'safe': 'safe_count',
+        'suspicious': 'suspicious_count',
+        'deepfake': 'deepfake_count',
+    }
+    
+    TYPE_FIELDS = {
+        'image': 'image_count',
+        'video': 'video_count',
+        'screenshot': 'screenshot_count',
+        'zoom': 'zoom_count',
+    }
+    
+    statistics_id = models.BigAutoField(primary_key=True)
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='analysis_statistics',
+        verbose_name='사용자'
+    )
+    
+    # 결과별
+    total_count = models.IntegerField(default=0, verbose_name='전체 분석 수')
+    safe_count = models.IntegerField(default=0, verbose_name='안전')
+    suspicious_count = models.IntegerField(default=0, verbose_name='의심')
+    deepfake_count = models.IntegerField(default=0, verbose_name='딥페이크')
+    
+    # 분석 유형별
+    image_count = models.IntegerField(default=0, verbose_name='이미지')
+    video_count = models.IntegerField(default=0, verbose_name='영상')
+    screenshot_count = models.IntegerField(default=0, verbose_name='스크린샷')
+    zoom_count = models.IntegerField(default=0, verbose_name='Zoom 캡처')
+    
+    last_analyzed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='마지막 분석 일시'
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'user_analysis_statistics'
+        verbose_name = '사용자 분석 통계'
+        verbose_name_plural = '사용자 분석 통계 목록'
+    
+    def __str__(self):
+        return f"{self.user} - 분석 {self.total_count}건"
+    
+    @classmethod
+    def increment(cls, records):
+        """새로 저장된 분석 기록만큼 카운터 증가"""
+        cls._apply(records, 1)
+    
+    @classmethod
+    def decrement(cls, records):
+        """삭제할 분석 기록만큼 카운터 감소"""
+        cls._apply(records, -1)
+    
+    @classmethod
+    def _apply(cls, records, sign):
+        by_user = defaultdict(list)
+        for record in records:
+            by_user[record.user_id].append(record)
+        
+        with transaction.atomic():
+            for user_id, user_records in by_user.items():
+                if not cls.objects.filter(user_id=user_id).exists():
+                    # ✅ 통계 행이 없으면 기존 기록으로 계산해 생성
+                    # (동시에 생성되면 get_or_create가 먼저 만들어진 행을 사용)
+                    _, created = cls.objects.get_or_create(
+                        user_id=user_id,
+                        defaults=cls._aggregate([user_id]).get(user_id, cls._empty_counts())
+                    )
+                    # 저장 후 호출되는 증가는 새 기록이 이미 계산에 포함됨
+                    if created and sign > 0:
+                        continue
+                
+                counts = Counter({'total_count': len(user_records)})
+                for record in user_records:
+                    counts[cls.RESULT_FIELDS[record.analysis_result]] += 1
+                    counts[cls.TYPE_FIELDS[record.analysis_type]] += 1
+                
+                updates = {
+                    field: F(field) + sign * count
+                    for field, count in counts.items()
+                }
+                if sign > 0:
+                    updates['last_analyzed_at'] = max(
+                        record.created_at or timezone.now()
+                        for record in user_records
+                    )
+                
+                cls.objects.filter(user_id=user_id).update(
+                    updated_at=timezone.now(),
+                    **updates
+                )
+    
+    @classmethod
+    def for_user(cls, user):
+        """사용자 통계 조회 (아직 없으면 기존 기록으로 계산해 생성)"""
+        try:
+            return cls.objects.get(user=user)
+        except cls.DoesNotExist:
+            stats, _ = cls.objects.get_or_create(
+                user=user,
+                defaults=cls._aggregate([user.pk]).get(user.pk, cls._empty_counts())
+            )
+            return stats
+    
+    @classmethod
+    def rebuild(cls, user_ids=None):
+        """
+        분석 기록에서 카운터를 처음부터 다시 계산
+        
+        Args:
+            user_ids: 다시 계산할 사용자 ID 목록 (없으면 기록이 있는 전체 사용자)
+        
+        Returns:
+            list: 갱신된 통계 객체
+        """
+        rows = cls._aggregate(user_ids)
+        if user_ids is None:
+            # 기록이 모두 삭제된 사용자의 통계도 0으로 맞춤
+            target_ids = set(rows) | set(cls.objects.values_list('user_id', flat=True))
+        else:
+            target_ids = set(user_ids)
+        
+        statistics = []
+        with transaction.atomic():
+            for user_id in target_ids:
+                stats, _ = cls.objects.update_or_create(
+                    user_id=user_id,
+                    defaults=rows.get(user_id, cls._empty_counts())
+                )
+                statistics.append(stats)
+        return statistics
+    
+    @classmethod
+    def _aggregate(cls, user_ids=None):
+        """분석 기록에서 사용자별 카운터 계산 ({user_id: {필드: 값}}, 기록이 없는 사용자는 빠짐)"""
+        aggregates = {
+            'total_count': Count('record_id'),
+            'last_analyzed_at': Max('created_at'),
+        }
+        for value, field in cls.RESULT_FIELDS.items():
+            aggregates[field] = Count('record_id', filter=Q(analysis_result=value))
+        for value, field in cls.TYPE_FIELDS.items():
+            aggregates[field] = Count('record_id', filter=Q(analysis_type=value))
+        
+        records = AnalysisRecord.objects.all()
+        if user_ids is not None:
+            records = records.filter(user_id__in=user_ids)
+        
+        return {
+            row.pop('user'): row
+            for row in records.order_by().values('user').annotate(**aggregates)
+        }
+    
+    @classmethod
+    def _empty_counts(cls):
+        counts = dict.fromkeys(['total_count', *cls.RESULT_FIELDS.values(), *cls.TYPE_FIELDS.values()], 0)
+        counts['last_analyzed_at'] = None
+        return counts
+
+
+class AnalysisDailyRollup(models.Model):
+    """
+    사용자별 일별 분석 집계 (추이 차트용)
+    
+    날짜는 TIME_ZONE 기준 분석 기록 생성일 / Zoom 캡처 시각이다.
+    UserAnalysisStatistics와 같은 시점(AnalysisRecord 저장/삭제, ZoomCapture 저장)에
+    F() 연산으로 갱신하므로 기간 조회는 기록 수가 아니라 일 수만큼만 읽는다.
+    bulk_create / QuerySet.delete 경로는 increment / decrement를 직접 호출해야 하고
+    (increment는 저장 후, decrement는 삭제 전), 집계 행이 없는 날짜(도입 전 기록 등)는
+    그날의 기록에서 계산해 get_or_create로 만든다.
+    어긋난 값이나 기존 기록은 rebuild_analysis_rollups 명령으로 다시 계산한다.
+    """
+    
+    COUNT_FIELDS = [
+        'total_count',
+        *UserAnalysisStatistics.RESULT_FIELDS.values(),
+        *UserAnalysisStatistics.TYPE_FIELDS.values(),
+        'zoom_alert_count',
+    ]
+    
+    rollup_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='analysis_daily_rollups',
+        verbose_name='사용자'
+    )
+    date = models.DateField(verbose_name='날짜')
+    
+    # 결과별
+    total_count = models.IntegerField(default=0, verbose_name='전체 분석 수')
+    safe_count = models.IntegerField(default=0, verbose_name='안전')
+    suspicious_count = models.IntegerField(default=0, verbose_name='의심')
+    deepfake_count = models.IntegerField(default=0, verbose_name='딥페이크')
+    
+    # 분석 유형별
+    image_count = models.IntegerField(default=0, verbose_name='이미지')
+    video_count = models.IntegerField(default=0, verbose_name='영상')
+    screenshot_count = models.IntegerField(default=0, verbose_name='스크린샷')
+    zoom_count = models.IntegerField(default=0, verbose_name='Zoom 캡처')
+    
+    # ✅ Zoom 경고 (중복 프레임으로 판정을 재사용한 캡처 포함)
+    zoom_alert_count = models.IntegerField(default=0, verbose_name='Zoom 경고')
+    
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'analysis_daily_rollups'
+        verbose_name = '일별 분석 집계'
+        verbose_name_plural = '일별 분석 집계 목록'
+        ordering = ['user', 'date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'date'],
+                name='unique_analysis_rollup_per_day'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.user} - {self.date} 분석 {self.total_count}건"
+    
+    @classmethod
+    def increment(cls, records):
+        """새로 저장된 분석 기록만큼 해당 날짜 집계 증가"""
+        cls._apply(cls._count_records(records), 1)
+    
+    @classmethod
+    def decrement(cls, records):
+        """삭제할 분석 기록(+ 함께 삭제되는 Zoom 경고 캡처)만큼 해당 날짜 집계 감소"""
+        counts = cls._count_records(records)
+        
+        ZoomCapture = apps.get_model('zoom', 'ZoomCapture')
+        captures = ZoomCapture.objects.filter(
+            record__in=[record.pk for record in records],
+            alert_triggered=True
+        ).values_list('session__user_id', 'capture_timestamp')
+        for user_id, captured_at in captures:
+            counts[(user_id, timezone.localdate(captured_at))]['zoom_alert_count'] += 1
+        
+        cls._apply(counts, -1)
+    
+    @classmethod
+    def increment_zoom_alerts(cls, captures):
+        """새로 저장된 Zoom 캡처 중 경고가 발생한 만큼 해당 날짜 집계 증가"""
+        counts = defaultdict(Counter)
+        for capture in captures:
+            if capture.alert_triggered:
+                day = timezone.localdate(capture.capture_timestamp or timezone.now())
+                counts[(capture.session.user_id, day)]['zoom_alert_count'] += 1
+        cls._apply(counts, 1)
+    
+    @staticmethod
+    def _count_records(records):
+        counts = defaultdict(Counter)
+        for record in records:
+            day = timezone.localdate(record.created_at or timezone.now())
+            row = counts[(record.user_id, day)]
+            row['total_count'] += 1
+            row[UserAnalysisStatistics.RESULT_FIELDS[record.analysis_result]] += 1
+            row[UserAnalysisStatistics.TYPE_FIELDS[record.analysis_type]] += 1
+        return counts
+    
+    @classmethod
+    def _apply(cls, counts, sign):
+        with transaction.atomic():
+            for (user_id, day), row in counts.items():
+                if not cls.objects.filter(user_id=user_id, date=day).exists():
+                    # ✅ 집계 행이 없으면 그날의 기록으로 계산해 생성
+                    # (같은 날 첫 기록이 동시에 저장되면 get_or_create가 먼저 만들어진 행을 사용)
+                    _, created = cls.objects.get_or_create(
+                        user_id=user_id,
+                        date=day,
+                        defaults=cls._aggregate([user_id], day, day).get((user_id, day), {})
+                    )
+                    # 저장 후 호출되는 증가는 새 기록이 이미 계산에 포함됨
+                    if created and sign > 0:
+                        continue
+                
+                cls.objects.filter(user_id=user_id, date=day).update(
+                    updated_at=timezone.now(),
+                    **{field: F(field) + sign * count for field, count in row.items()}
+                )
+    
+    @classmethod
+    def rebuild(cls, user_ids=None, start=None, end=None):
+        """
+        분석 기록 / Zoom 캡처에서 일별 집계를 처음부터 다시 계산
+        
+        Args:
+            user_ids: 다시 계산할 사용자 ID 목록 (없으면 전체)
+            start, end: 다시 계산할 날짜 범위 (date, 양 끝 포함, 없으면 전체 기간)
+        
+        Returns:
+            int: 저장된 일별 집계 행 수
+        """
+        rows = cls._aggregate(user_ids, start, end)
+        
+        rollups = cls.objects.all()
+        if user_ids is not None:
+            rollups = rollups.filter(user_id__in=user_ids)
+        if start is not None:
+            rollups = rollups.filter(date__gte=start)
+        if end is not None:
+            rollups = rollups.filter(date__lte=end)
+        
+        with transaction.atomic():
+            rollups.delete()
+            cls.objects.bulk_create([
+                cls(user_id=user_id, date=day, **counts)
+                for (user_id, day), counts in rows.items()
+            ], batch_size=1000)
+        return len(rows)
+    
+    @classmethod
+    def _aggregate(cls, user_ids=None, start=None, end=None):
+        """분석 기록 / Zoom 경고 캡처에서 일별 집계 계산 ({(user_id, date): {필드: 값}})"""
+        ZoomCapture = apps.get_model('zoom', 'ZoomCapture')
+        
+        aggregates = {'total_count': Count('record_id')}
+        for value, field in UserAnalysisStatistics.RESULT_FIELDS.items():
+            aggregates[field] = Count('record_id', filter=Q(analysis_result=value))
+        for value, field in UserAnalysisStatistics.TYPE_FIELDS.items():
+            aggregates[field] = Count('record_id', filter=Q(analysis_type=value))
+        
+        records = AnalysisRecord.objects.annotate(day=TruncDate('created_at'))
+        captures = ZoomCapture.objects.filter(alert_triggered=True).annotate(
+            day=TruncDate('capture_timestamp'),
+            user_id=F('session__user_id')
+        )
+        if user_ids is not None:
+            records = records.filter(user_id__in=user_ids)
+            captures = captures.filter(session__user_id__in=user_ids)
+        if start is not None:
+            records = records.filter(day__gte=start)
+            captures = captures.filter(day__gte=start)
+        if end is not None:
+            records = records.filter(day__lte=end)
+            captures = captures.filter(day__lte=end)
+        
+        rows = defaultdict(dict)
+        for row in records.order_by().values('user_id', 'day').annotate(**aggregates):
+            rows[(row.pop('user_id'), row.pop('day'))].update(row)
+        for row in captures.order_by().values('user_id', 'day').annotate(zoom_alert_count=Count('capture_id')):
+            rows[(row['user_id'], row['day'])]['zoom_alert_count'] = row['zoom_alert_count']
+        return rows
+    
+    @classmethod
+    def series(cls, user, start, end, interval='day'):
+        """
+        기간별 집계 목록 (집계가 없는 기간은 0)
+        
+        Args:
+            start, end: 날짜 범위 (date, 양 끝 포함)
+            interval: 'day' / 'week' (월요일 시작) / 'month'
+        
+        Returns:
+            list: [{'period': 기간 시작일, 'total_count': ..., ...}]
+        """
+        def period_of(day):
+            if interval == 'week':
+                return day - timedelta(days=day.weekday())
+            if interval == 'month':
+                return day.replace(day=1)
+            return day
+        
+        periods = {}
+        day = start
+        while day <= end:
+            periods.setdefault(period_of(day), dict.fromkeys(cls.COUNT_FIELDS, 0))
+            day += timedelta(days=1)
+        
+        rollups = cls.objects.filter(
+            user=user,
+            date__gte=start,
+            date__lte=end
+        ).values('date', *cls.COUNT_FIELDS)
+        for row in rollups:
+            totals = periods[period_of(row.pop('date'))]
+            for field, count in row.items():
+                totals[field] += count
+        
+        return [
+            {'period': period, **totals}
+            for period, totals in periods.items()
+        ]
+
+
+class VideoAnalysisJob(models.Model):
+    """영상 분석 작업 (백그라운드 워커에서 비동기 처리)"""
+    
+    STATUS_CHOICES = [
+        ('queued', '대기 중'),
+        ('processing', '처리 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    job_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='video_analysis_jobs',
+        verbose_name='사용자'
+    )
+    media_file_id = models.BigIntegerField(verbose_name='미디어 파일 ID')
+    record = models.ForeignKey(
+        AnalysisRecord,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='video_jobs',
+        verbose_name='분석 기록'
+    )
+    job_status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='queued',
+        verbose_name='작업 상태'
+    )
+    error_message = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name='오류 메시지'
+    )
+    worker_id = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        verbose_name='처리 프로세스',
+        help_text='작업을 큐에 등록한 프로세스 (호스트명:PID)'
+    )
+    processing_started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='처리 시작 시간'
+    )
+    processing_completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='처리 완료 시간'
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    
+    class Meta:
+        db_table = 'video_analysis_jobs'
+        verbose_name = '영상 분석 작업'
+        verbose_name_plural = '영상 분석 작업 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['job_status']),
+        ]
+    
+    def __str__(self):
+        return f"영상 분석 #{self.job_id} - {self.get_job_status_display()}"
+    
+    @property
+    def processing_duration(self):
+        """처리 소요 시간 계산 (처리 중이면 현재까지 경과 시간)"""
+        if not self.processing_started_at:
+            return None
+        end_time = self.processing_completed_at or timezone.now()
+        return (end_time - self.processing_started_at).total_seconds()
@@ -0,0 +1,179 @@
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from config.metrics import observe_ai_call
+from .health import get_health_monitor
+
+
+class AIBackend:
+    """
+    AI 서버 풀의 서버 1대
+
+    서버별 상태 모니터(서킷 브레이커)가 열리면 라우터가 이 서버를 건너뛴다 (자동 제외).
+    """
+
+    CAPABILITIES = ('image', 'video', 'protect')
+    LATENCY_WINDOW = 200  # 지연 시간 통계에 쓰는 최근 요청 수
+
+    def __init__(self, url, weight=1, capabilities=None):
+        capabilities = tuple(capabilities or self.CAPABILITIES)
+        unknown = set(capabilities) - set(self.CAPABILITIES)
+        if unknown:
+            raise ValueError(f"지원하지 않는 AI 서버 기능입니다: {', '.join(sorted(unknown))}")
+        if weight <= 0:
+            raise ValueError(f"AI 서버 가중치는 0보다 커야 합니다: {url}")
+
+        self.url = url.rstrip('/')
+        self.weight = weight
+        self.capabilities = capabilities
+        self.health = get_health_monitor(self.url)
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+
+    def load(self):
+        """가중치를 반영한 현재 부하 (처리 중 요청 수 / 가중치)"""
+        return (self.outstanding + 1) / self.weight
+
+    @contextmanager
+    def lease(self, service, route):
+        """
+        AI 서버 호출 1건 동안 처리 중 요청 수를 올리고, 끝나면 지연 시간과 결과를 기록
+
+        with backend.lease('detection', '/api/analyze/image') as call:
+            response = ...
+            response.raise_for_status()
+            call.model_version = response.json().get('model_version')
+
+        성공하면 상태 모니터에 성공(+ 모델 버전)으로, 예외가 나면 실패로 기록하고 예외는 그대로 전달한다.
+        Prometheus 지표(observe_ai_call)도 함께 기록한다.
+        """
+        with self._lock:
+            self.outstanding += 1
+            self.requests += 1
+        start = time.perf_counter()
+        try:
+            with observe_ai_call(service, route) as call:
+                yield call
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            self.health.record_exception(e)
+            raise
+        else:
+            self.health.record_success(call.model_version)
+        finally:
+            with self._lock:
+                self.outstanding -= 1
+                self._latencies.append(time.perf_counter() - start)
+
+    def snapshot(self):
+        """헬스체크 API용 서버 상태 / 최근 지연 시간"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            outstanding = self.outstanding
+            requests_count = self.requests
+            errors = self.errors
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(int(len(latencies) * p / 100), len(latencies) - 1)] * 1000, 1)
+
+        return {
+            'url': self.url,
+            'weight': self.weight,
+            'capabilities': list(self.capabilities),
+            'outstanding': outstanding,
+            'requests': requests_count,
+            'errors': errors,
+            'latency_ms': {
+                'samples': len(latencies),
+                'p50': percentile(50),
+                'p95': percentile(95),
+                'p99': percentile(99),
+            },
+            'circuit_breaker': self.health.snapshot()
+        }
+
+
+class AIBackendRouter:
+    """
+    AI 서버 풀 라우터 (least outstanding requests)
+
+    기능(image/video/protect)을 지원하는 서버 중 가중치 대비 처리 중 요청이 가장 적은 서버를 고른다.
+    서킷이 열린 서버는 건너뛰고, 열린 지 AI_CIRCUIT_RESET_TIMEOUT이 지나면 시험 요청을 보내 복귀시킨다.
+    """
+
+    def __init__(self, backends):
+        if not backends:
+            raise ValueError("AI 서버가 하나 이상 필요합니다.")
+        self.backends = backends
+
+    def choose(self, capability, exclude=None):
+        """
+        요청을 보낼 서버 선택
+
+        Args:
+            capability: 필요한 기능 (image/video/protect)
+            exclude: 제외할 서버 (헤지 요청은 첫 요청과 다른 서버로)
+
+        Returns:
+            AIBackend: 사용할 서버, 사용 가능한 서버가 없으면 None
+        """
+        candidates = [
+            b for b in self.backends
+            if capability in b.capabilities and b is not exclude
+        ]
+        random.shuffle(candidates)  # 부하가 같은 서버끼리는 고르게
+
+        # is_available()은 열린 서킷의 시험 요청 기회를 쓰므로 실제로 고를 순서대로만 확인
+        for backend in sorted(candidates, key=lambda b: b.load()):
+            if backend.health.is_available():
+                return backend
+        return None
+
+    @property
+    def model_version(self):
+        """가장 최근에 확인된 AI 모델 버전 (분석 결과 캐시 키)"""
+        latest = None
+        for backend in self.backends:
+            health = backend.health
+            if health.model_version and (
+                latest is None or (health.last_success_at or 0) > (latest.last_success_at or 0)
+            ):
+                latest = health
+        return latest.model_version if latest else None
+
+    def snapshot(self):
+        return [backend.snapshot() for backend in self.backends]
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_ai_router():
+    """AI_BACKENDS 설정으로 만든 프로세스 전역 라우터 반환"""
+    global _router
+
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = AIBackendRouter([
+                    AIBackend(
+                        url=backend['url'],
+                        weight=backend.get('weight', 1),
+                        capabilities=backend.get('capabilities')
+                    )
+                    for backend in settings.AI_BACKENDS
+                ])
+    return _router
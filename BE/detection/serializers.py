@@ -1,5 +1,11 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
-from .models import AnalysisRecord
+from config.projection import SparseFieldsetMixin
+from .artifacts import artifact_url, proxy_detection_details
+from .models import AnalysisRecord, VideoAnalysisJob
 
 
 class AnalysisRecordSerializer(serializers.ModelSerializer):
@@ -13,6 +19,8 @@ class AnalysisRecordSerializer(serializers.ModelSerializer):
         source='get_analysis_result_display',
         read_only=True
     )
+    heatmap_url = serializers.SerializerMethodField()
+    heatmap_thumbnail_url = serializers.SerializerMethodField()
     
     class Meta:
         model = AnalysisRecord
@@ -27,6 +35,8 @@ class AnalysisRecordSerializer(serializers.ModelSerializer):
             'original_path',
             'processed_path',
             'heatmap_path',  # ✅ 히트맵 경로
+            'heatmap_url',  # ✅ 히트맵 (프록시 캐시)
+            'heatmap_thumbnail_url',
             'analysis_result',
             'analysis_result_display',
             'confidence_score',
@@ -42,6 +52,25 @@ class AnalysisRecordSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
+    
+    def get_heatmap_url(self, obj):
+        if not obj.heatmap_path:
+            return None
+        return artifact_url(obj.record_id, 'heatmap', request=self.context.get('request'))
+    
+    def get_heatmap_thumbnail_url(self, obj):
+        if not obj.heatmap_path:
+            return None
+        return artifact_url(obj.record_id, 'heatmap', thumbnail=True, request=self.context.get('request'))
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if 'detection_details' in data:
+            # ✅ 인물별 이미지는 AI 서버 URL 대신 프록시 URL
+            data['detection_details'] = proxy_detection_details(
+                instance.record_id, data['detection_details'], request=self.context.get('request')
+            )
+        return data
 
 
 class ImageAnalysisRequestSerializer(serializers.Serializer):
@@ -54,6 +83,20 @@ class ImageAnalysisRequestSerializer(serializers.Serializer):
     )
 
 
+class BatchImageAnalysisRequestSerializer(serializers.Serializer):
+    """이미지 일괄 분석 요청 Serializer"""
+    
+    images = serializers.ListField(
+        child=serializers.ImageField(),
+        min_length=1,
+        max_length=settings.BATCH_ANALYSIS_MAX_IMAGES
+    )
+    analysis_type = serializers.ChoiceField(
+        choices=['image', 'screenshot'],
+        default='image'
+    )
+
+
 class VideoAnalysisRequestSerializer(serializers.Serializer):
     """영상 분석 요청 Serializer"""
     
@@ -76,7 +119,7 @@ class VideoAnalysisRequestSerializer(serializers.Serializer):
         return value
 
 
-class AnalysisRecordListSerializer(serializers.ModelSerializer):
+class AnalysisRecordListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """분석 기록 목록 Serializer (간단한 정보만)"""
     
     analysis_type_display = serializers.CharField(
@@ -87,6 +130,7 @@ class AnalysisRecordListSerializer(serializers.ModelSerializer):
         source='get_analysis_result_display',
         read_only=True
     )
+    heatmap_thumbnail_url = serializers.SerializerMethodField()
     
     class Meta:
         model = AnalysisRecord
@@ -98,9 +142,16 @@ class AnalysisRecordListSerializer(serializers.ModelSerializer):
             'analysis_result',
             'analysis_result_display',
             'confidence_score',
+            'heatmap_thumbnail_url',  # ✅ 목록용 히트맵 썸네일
             'created_at'
         ]
         read_only_fields = fields
+        projection_dependencies = {'heatmap_thumbnail_url': ['heatmap_path']}
+    
+    def get_heatmap_thumbnail_url(self, obj):
+        if not obj.heatmap_path:
+            return None
+        return artifact_url(obj.record_id, 'heatmap', thumbnail=True, request=self.context.get('request'))
 
 
 class AnalysisStatisticsSerializer(serializers.Serializer):
@@ -110,4 +161,87 @@ class AnalysisStatisticsSerializer(serializers.Serializer):
     safe_count = serializers.IntegerField()
     suspicious_count = serializers.IntegerField()
     deepfake_count = serializers.IntegerField()
-    recent_analyses = AnalysisRecordListSerializer(many=True)
\ No newline at end of file
+    analysis_type_counts = serializers.DictField(child=serializers.IntegerField())
+    last_analyzed_at = serializers.DateTimeField(allow_null=True)
+    recent_analyses = AnalysisRecordListSerializer(many=True)
+
+
+class AnalysisTimeSeriesRequestSerializer(serializers.Serializer):
+    """기간별 분석 통계 요청 Serializer (쿼리 파라미터)"""
+    
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    interval = serializers.ChoiceField(
+        choices=['day', 'week', 'month'],
+        default='day'
+    )
+    
+    def validate(self, attrs):
+        # 기본값: 오늘까지 최근 ANALYSIS_TIMESERIES_DEFAULT_DAYS일
+        end = attrs.get('end') or timezone.localdate()
+        start = attrs.get('start') or end - timedelta(days=settings.ANALYSIS_TIMESERIES_DEFAULT_DAYS - 1)
+        
+        if start > end:
+            raise serializers.ValidationError("시작일은 종료일보다 늦을 수 없습니다.")
+        if (end - start).days + 1 > settings.ANALYSIS_TIMESERIES_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"조회 기간은 최대 {settings.ANALYSIS_TIMESERIES_MAX_DAYS}일입니다."
+            )
+        
+        attrs['start'] = start
+        attrs['end'] = end
+        return attrs
+
+
+class VideoAnalysisJobSerializer(serializers.ModelSerializer):
+    """영상 분석 작업 상태 Serializer"""
+    
+    job_status_display = serializers.CharField(
+        source='get_job_status_display',
+        read_only=True
+    )
+    queue_position = serializers.SerializerMethodField()
+    processing_time = serializers.SerializerMethodField()
+    result = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = VideoAnalysisJob
+        fields = [
+            'job_id',
+            'job_status',
+            'job_status_display',
+            'queue_position',
+            'processing_time',
+            'record',
+            'result',
+            'error_message',
+            'processing_started_at',
+            'processing_completed_at',
+            'created_at',
+        ]
+        read_only_fields = fields
+    
+    def get_queue_position(self, obj):
+        """대기 순번 (대기 중일 때만)"""
+        from .jobs import get_queue_position
+        return get_queue_position(obj)
+    
+    def get_processing_time(self, obj):
+        """처리 소요 시간 (초, 처리 중이면 현재까지 경과 시간)"""
+        return obj.processing_duration
+    
+    def get_result(self, obj):
+        """분석 결과 (완료된 경우만)"""
+        record = obj.record
+        if obj.job_status != 'completed' or record is None:
+            return None
+        
+        return {
+            'record_id': record.record_id,
+            'is_deepfake': record.analysis_result != 'safe',
+            'confidence_score': float(record.confidence_score),
+            'analysis_result': record.analysis_result,
+            'detection_details': proxy_detection_details(
+                record.record_id, record.detection_details, request=self.context.get('request')
+            )
+        }
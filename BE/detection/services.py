@@ -1,22 +1,74 @@
+import asyncio
+import contextvars
+import os
+import httpx
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as futures_wait
+from contextlib import ExitStack
+from urllib.parse import urljoin
 from django.conf import settings
-from media_files.models import SystemLog
+from django.db import connection
+from media_files.log_buffer import write_system_log
+from .ai_client import build_async_timeout, get_ai_client, get_async_ai_client
+from .router import get_ai_router
+from .dispatch import get_ai_dispatcher
+from .cache import get_result_cache
+from .latency import get_hedge_executor, get_latency_tracker
+from config.metrics import record_mock_fallback
+
+
+def build_file_identifier(media_file):
+    """
+    AI 서버에 넘길 파일 식별자 (탐지 / 보호 API 공통)
+    
+    로컬 파일은 AI 서버에서 보이는 공유 볼륨 경로(AI_SHARED_MEDIA_ROOT 기준)로 변환한다.
+    """
+    if media_file.storage_type == 's3':
+        return {
+            'type': 's3',
+            'file_id': media_file.file_id,
+            's3_bucket': media_file.s3_bucket,
+            's3_key': media_file.s3_key
+        }
+    
+    return {
+        'type': 'local',
+        'file_id': media_file.file_id,
+        'path': os.path.join(settings.AI_SHARED_MEDIA_ROOT, media_file.file_path)
+    }
 
 
 class AIModelService:
     """AI 모델 서비스 (FastAPI 연동)"""
     
-    def __init__(self):
-        self.fastapi_url = settings.FASTAPI_URL
+    TRANSPORTS = ('multipart', 'path', 's3')
+    
+    # 분석 종류별 기본 우선순위 레인 (실시간 Zoom 캡처는 lane='zoom'으로 생성)
+    DEFAULT_LANES = {
+        'image': 'image',
+        'video': 'bulk',
+    }
+    
+    def __init__(self, transport=None, lane=None):
+        self.client = get_ai_client()
+        self.router = get_ai_router()
+        self.dispatcher = get_ai_dispatcher()
+        self.lane = lane
+        self.cache = get_result_cache()
+        self.latency = get_latency_tracker()
         self.timeout = settings.AI_REQUEST_TIMEOUT
+        self.transport = transport or settings.AI_DETECTION_TRANSPORT
+        
+        if self.transport not in self.TRANSPORTS:
+            raise ValueError(f"지원하지 않는 AI 파일 전송 방식입니다: {self.transport}")
     
-    def analyze_image(self, image_path):
+    def analyze_image(self, media_file):
         """
         이미지 딥페이크 분석 (단일 사람 가정)
         
         Args:
-            image_path: 이미지 파일의 절대 경로
+            media_file: 분석할 MediaFile (metadata의 콘텐츠 해시가 있으면 이전 분석 결과 재사용)
         
         Returns:
             dict: {
@@ -31,60 +83,203 @@ class AIModelService:
         """
         
         start_time = time.time()
+        content_hash = self._get_content_hash(media_file)
         
-        # 🔧 AI 서버 연결 확인
-        if not self.check_health():
-            print("⚠️ AI 서버 없음 - Mock 데이터 반환")
-            return self._get_mock_image_response(start_time)
+        # ✅ 같은 파일의 이전 분석 결과 재사용
+        cached = self._get_cached_result(content_hash, 'image', start_time)
+        if cached:
+            return cached
         
-        # 실제 AI 서버 호출
-        try:
-            with open(image_path, 'rb') as f:
-                files = {'file': f}
-                response = requests.post(
-                    f"{self.fastapi_url}/api/analyze/image",
-                    files=files,
-                    timeout=self.timeout
-                )
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        with self.dispatcher.slot(self._lane_for('image')):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('image')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_image_response(start_time)
             
-            response.raise_for_status()
-            result = response.json()
+            # 실제 AI 서버 호출
+            try:
+                result = self._call_ai(backend, 'image', '/api/analyze/image', [media_file], hedge=True)
+                
+                processing_time = int((time.time() - start_time) * 1000)
+                
+                analysis = self._build_image_result(result, processing_time)
+                self.cache.set(content_hash, 'image', analysis)
+                return analysis
+            
+            except requests.exceptions.RequestException as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='detection',
+                    message=f'AI 모델 분석 실패: {str(e)}',
+                    error_code='AI_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+    
+    async def aanalyze_image(self, media_file):
+        """
+        이미지 딥페이크 분석 (async 뷰용, analyze_image와 같은 결과)
+        
+        AI 서버 응답을 기다리는 동안 스레드를 점유하지 않는다.
+        """
+        
+        start_time = time.time()
+        content_hash = self._get_content_hash(media_file)
+        
+        # ✅ 같은 파일의 이전 분석 결과 재사용
+        cached = self._get_cached_result(content_hash, 'image', start_time)
+        if cached:
+            return cached
+        
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        async with self.dispatcher.aslot(self._lane_for('image')):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('image')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_image_response(start_time)
             
-            processing_time = int((time.time() - start_time) * 1000)
+            # 실제 AI 서버 호출
+            try:
+                result = await self._acall_ai(backend, 'image', '/api/analyze/image', [media_file], hedge=True)
+                
+                processing_time = int((time.time() - start_time) * 1000)
+                
+                analysis = self._build_image_result(result, processing_time)
+                self.cache.set(content_hash, 'image', analysis)
+                return analysis
             
-            return {
-                'success': True,
-                'is_deepfake': result.get('is_deepfake', False),
-                'confidence_score': result.get('confidence', 0.0),  # 0-100
-                'analysis_result': self._get_analysis_result(
-                    result.get('is_deepfake', False),
-                    result.get('confidence', 0.0)
-                ),
-                'heatmap_url': result.get('heatmap_url', None),
-                'ai_model_version': result.get('model_version', 'v1.0'),
-                'processing_time': processing_time
-            }
+            except (httpx.HTTPError, ValueError) as e:  # ValueError: AI 서버가 JSON이 아닌 응답을 준 경우
+                write_system_log(
+                    log_level='error',
+                    log_category='detection',
+                    message=f'AI 모델 분석 실패: {str(e)}',
+                    error_code='AI_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+    
+    def analyze_images(self, media_files):
+        """
+        여러 이미지 일괄 분석
+        
+        AI 서버에 일괄 분석 라우트가 있으면(AI_BATCH_ROUTE_ENABLED) 한 번에 보내고,
+        없으면 최대 AI_BATCH_CONCURRENCY개까지 동시에 analyze_image를 호출한다.
+        
+        Args:
+            media_files: 분석할 MediaFile 리스트
+        
+        Returns:
+            list: 입력 순서대로 analyze_image와 같은 형식의 결과
+        """
+        
+        if not media_files:
+            return []
+        
+        if settings.AI_BATCH_ROUTE_ENABLED:
+            return self._analyze_images_batch_route(media_files)
+        
+        max_workers = min(settings.AI_BATCH_CONCURRENCY, len(media_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._analyze_image_in_thread, media_files))
+    
+    def _analyze_image_in_thread(self, media_file):
+        """일괄 분석 워커 스레드용 analyze_image (스레드 DB 연결 정리)"""
+        try:
+            return self.analyze_image(media_file)
+        finally:
+            connection.close()
+    
+    def _analyze_images_batch_route(self, media_files):
+        """AI 서버 일괄 분석 라우트(/api/analyze/images)로 한 번에 분석"""
+        
+        start_time = time.time()
+        results = [None] * len(media_files)
+        content_hashes = [self._get_content_hash(mf) for mf in media_files]
+        
+        # ✅ 캐시된 항목은 제외하고 나머지만 전송
+        pending = []
+        for index, content_hash in enumerate(content_hashes):
+            cached = self._get_cached_result(content_hash, 'image', start_time)
+            if cached:
+                results[index] = cached
+            else:
+                pending.append(index)
         
-        except requests.exceptions.RequestException as e:
-            SystemLog.objects.create(
-                log_level='error',
-                log_category='detection',
-                message=f'AI 모델 분석 실패: {str(e)}',
-                error_code='AI_API_ERROR'
-            )
+        if not pending:
+            return results
+        
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        with self.dispatcher.slot(self._lane_for('image')):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('image')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                for index in pending:
+                    results[index] = self._get_mock_image_response(start_time)
+                return results
             
-            return {
-                'success': False,
-                'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
-                'processing_time': int((time.time() - start_time) * 1000)
-            }
+            try:
+                payload = self._call_ai(
+                    backend,
+                    'image',
+                    '/api/analyze/images',
+                    [media_files[index] for index in pending],
+                    field_name='files'
+                )
+                
+                processing_time = int((time.time() - start_time) * 1000)
+                
+                for index, item in zip(pending, payload.get('results', [])):
+                    if item.get('error'):
+                        results[index] = {
+                            'success': False,
+                            'error': item['error'],
+                            'processing_time': processing_time
+                        }
+                        continue
+                    
+                    item.setdefault('model_version', payload.get('model_version'))
+                    analysis = self._build_image_result(item, processing_time)
+                    self.cache.set(content_hashes[index], 'image', analysis)
+                    results[index] = analysis
+            
+            except requests.exceptions.RequestException as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='detection',
+                    message=f'AI 일괄 분석 실패: {str(e)}',
+                    error_code='AI_API_ERROR'
+                )
+        
+        # 응답에서 빠진 항목은 실패 처리
+        processing_time = int((time.time() - start_time) * 1000)
+        for index in pending:
+            if results[index] is None:
+                results[index] = {
+                    'success': False,
+                    'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
+                    'processing_time': processing_time
+                }
+        
+        return results
     
-    def analyze_video(self, video_path):
+    def analyze_video(self, media_file):
         """
         영상 딥페이크 분석 (다중 사람 분석)
         
         Args:
-            video_path: 영상 파일의 절대 경로
+            media_file: 분석할 MediaFile (metadata의 콘텐츠 해시가 있으면 이전 분석 결과 재사용)
         
         Returns:
             dict: {
@@ -108,55 +303,286 @@ class AIModelService:
         """
         
         start_time = time.time()
+        content_hash = self._get_content_hash(media_file)
         
-        # 🔧 AI 서버 연결 확인
-        if not self.check_health():
-            print("⚠️ AI 서버 없음 - Mock 데이터 반환")
-            return self._get_mock_video_response(start_time)
+        # ✅ 같은 파일의 이전 분석 결과 재사용
+        cached = self._get_cached_result(content_hash, 'video', start_time)
+        if cached:
+            return cached
         
-        # 실제 AI 서버 호출
-        try:
-            with open(video_path, 'rb') as f:
-                files = {'file': f}
-                response = requests.post(
-                    f"{self.fastapi_url}/api/analyze/video",
-                    files=files,
-                    timeout=self.timeout
-                )
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        with self.dispatcher.slot(self._lane_for('video')):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('video')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_video_response(start_time)
             
-            response.raise_for_status()
-            result = response.json()
+            # 실제 AI 서버 호출
+            try:
+                result = self._call_ai(backend, 'video', '/api/analyze/video', [media_file])
+                
+                processing_time = int((time.time() - start_time) * 1000)
+                
+                # 전체 판정 (하나라도 딥페이크면 딥페이크)
+                detection_details = result.get('detection_details', [])
+                is_any_deepfake = any([d['is_deepfake'] for d in detection_details])
+                avg_confidence = sum([d['confidence'] for d in detection_details]) / len(detection_details) if detection_details else 0.0
+                
+                analysis = {
+                    'success': True,
+                    'is_deepfake': is_any_deepfake,
+                    'confidence_score': round(avg_confidence, 2),
+                    'analysis_result': self._get_analysis_result(is_any_deepfake, avg_confidence),
+                    'detection_details': detection_details,  # AI가 detection 이미지 URL 포함해서 반환
+                    'ai_model_version': result.get('model_version', 'v1.0'),
+                    'processing_time': processing_time
+                }
+                self.cache.set(content_hash, 'video', analysis)
+                return analysis
             
-            processing_time = int((time.time() - start_time) * 1000)
-            
-            # 전체 판정 (하나라도 딥페이크면 딥페이크)
-            detection_details = result.get('detection_details', [])
-            is_any_deepfake = any([d['is_deepfake'] for d in detection_details])
-            avg_confidence = sum([d['confidence'] for d in detection_details]) / len(detection_details) if detection_details else 0.0
-            
-            return {
-                'success': True,
-                'is_deepfake': is_any_deepfake,
-                'confidence_score': round(avg_confidence, 2),
-                'analysis_result': self._get_analysis_result(is_any_deepfake, avg_confidence),
-                'detection_details': detection_details,  # AI가 detection 이미지 URL 포함해서 반환
-                'ai_model_version': result.get('model_version', 'v1.0'),
-                'processing_time': processing_time
-            }
+            except requests.exceptions.RequestException as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='detection',
+                    message=f'영상 AI 분석 실패: {str(e)}',
+                    error_code='AI_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+    
+    def _lane_for(self, analysis_kind):
+        return self.lane or self.DEFAULT_LANES[analysis_kind]
+    
+    def _call_ai(self, backend, capability, route, media_files, field_name='file', hedge=False):
+        """
+        AI 서버 호출 후 응답 JSON 반환 (실패 시 requests 예외 전달)
         
-        except requests.exceptions.RequestException as e:
-            SystemLog.objects.create(
-                log_level='error',
-                log_category='detection',
-                message=f'영상 AI 분석 실패: {str(e)}',
-                error_code='AI_API_ERROR'
-            )
-            
-            return {
-                'success': False,
-                'error': 'AI 분석 중 오류가 발생했습니다. 다시 시도해주세요.',
-                'processing_time': int((time.time() - start_time) * 1000)
-            }
+        읽기 타임아웃은 라우트 / 요청 크기 구간의 최근 지연 시간으로 정한다 (상한 AI_REQUEST_TIMEOUT).
+        hedge=True이고 작은 요청이면 첫 요청이 p95를 넘길 때 다른 서버로 같은 요청을 보내
+        먼저 성공한 응답을 쓴다 (늦은 응답은 버림).
+        """
+        size = self._get_payload_size(media_files)
+        timeout = self.latency.timeout_for(route, size, self.timeout)
+        attempt = (route, media_files, field_name, size, timeout)
+        
+        hedge_delay = self._get_hedge_delay(route, size) if hedge else None
+        if hedge_delay is None:
+            return self._attempt(backend, *attempt)
+        
+        executor = get_hedge_executor()
+        primary = executor.submit(contextvars.copy_context().run, self._attempt, backend, *attempt)
+        if futures_wait([primary], timeout=hedge_delay).done:
+            return primary.result()
+        
+        # ✅ p95를 넘김 - 다른 서버로 헤지 요청
+        other = self.router.choose(capability, exclude=backend)
+        if other is None or not self.latency.try_hedge(route):
+            return primary.result()
+        hedged = executor.submit(contextvars.copy_context().run, self._attempt, other, *attempt)
+        
+        error = None
+        for future in as_completed([primary, hedged]):
+            try:
+                result = future.result()
+            except requests.exceptions.RequestException as e:
+                error = e
+                continue
+            if future is hedged:
+                self.latency.record_hedge_win(route)
+            return result
+        raise error
+    
+    async def _acall_ai(self, backend, capability, route, media_files, field_name='file', hedge=False):
+        """_call_ai의 비동기 버전 (늦은 쪽 요청은 취소)"""
+        size = self._get_payload_size(media_files)
+        timeout = self.latency.timeout_for(route, size, self.timeout)
+        attempt = (route, media_files, field_name, size, timeout)
+        
+        hedge_delay = self._get_hedge_delay(route, size) if hedge else None
+        if hedge_delay is None:
+            return await self._aattempt(backend, *attempt)
+        
+        primary = asyncio.ensure_future(self._aattempt(backend, *attempt))
+        done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+        if done:
+            return primary.result()
+        
+        # ✅ p95를 넘김 - 다른 서버로 헤지 요청
+        other = self.router.choose(capability, exclude=backend)
+        if other is None or not self.latency.try_hedge(route):
+            return await primary
+        hedged = asyncio.ensure_future(self._aattempt(other, *attempt))
+        
+        pending = {primary, hedged}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    if task is hedged:
+                        self.latency.record_hedge_win(route)
+                    return task.result()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _attempt(self, backend, route, media_files, field_name, size, timeout):
+        """AI 서버 1대에 요청 1회 (성공하면 지연 시간 기록)"""
+        start = time.perf_counter()
+        with backend.lease('detection', route) as call:
+            response = self._post_files(backend, route, media_files, field_name, timeout)
+            response.raise_for_status()
+            result = self._resolve_artifact_urls(backend, response.json())
+            call.model_version = result.get('model_version', 'v1.0')
+        self.latency.record(route, size, time.perf_counter() - start)
+        return result
+    
+    async def _aattempt(self, backend, route, media_files, field_name, size, timeout):
+        start = time.perf_counter()
+        with backend.lease('detection', route) as call:
+            response = await self._apost_files(backend, route, media_files, field_name, timeout)
+            response.raise_for_status()
+            result = self._resolve_artifact_urls(backend, response.json())
+            call.model_version = result.get('model_version', 'v1.0')
+        self.latency.record(route, size, time.perf_counter() - start)
+        return result
+    
+    def _resolve_artifact_urls(self, backend, result):
+        """
+        응답의 상대 이미지 URL(히트맵 / 인물별 이미지)을 응답한 AI 서버 기준 절대 URL로 변경
+        
+        분석 이미지 프록시(AnalysisArtifactService)가 나중에 같은 서버에서 받아 오도록 그대로 저장한다.
+        """
+        items = [result, *result.get('results', []), *result.get('detection_details', [])]
+        for item in items:
+            for key in ('heatmap_url', 'detection_image_url'):
+                if item.get(key):
+                    item[key] = urljoin(f"{backend.url}/", item[key])
+        return result
+    
+    def _get_payload_size(self, media_files):
+        """요청 파일 크기 합 (bytes), 모르는 파일이 있으면 None"""
+        sizes = [mf.file_size for mf in media_files]
+        if any(size is None for size in sizes):
+            return None
+        return sum(sizes)
+    
+    def _get_hedge_delay(self, route, size):
+        if not settings.AI_HEDGE_ENABLED or size is None or size > settings.AI_HEDGE_MAX_BYTES:
+            return None
+        return self.latency.hedge_delay(route, size)
+    
+    def _post_files(self, backend, route, media_files, field_name='file', read_timeout=None):
+        """
+        전송 방식(AI_DETECTION_TRANSPORT)에 따라 분석 요청
+        
+        - multipart: 파일 내용을 multipart로 업로드
+        - path: 공유 볼륨 경로만 전달
+        - s3: S3 키만 전달 (업로드 시 S3에 저장된 파일, 로컬 파일은 multipart)
+        
+        S3에 저장된 파일은 전송 방식과 관계없이 S3 키를 전달한다.
+        """
+        url = f"{backend.url}{route}"
+        timeout = (settings.AI_CONNECT_TIMEOUT, read_timeout or self.timeout)
+        
+        if not all(self._can_hand_off(mf) for mf in media_files):
+            with ExitStack() as stack:
+                files = [
+                    (field_name, stack.enter_context(
+                        open(os.path.join(settings.MEDIA_ROOT, mf.file_path), 'rb')
+                    ))
+                    for mf in media_files
+                ]
+                return self.client.post(url, files=files, timeout=timeout)
+        
+        # ✅ 파일 참조만 전달 (공유 스토리지에서 AI 서버가 직접 읽음)
+        identifiers = [build_file_identifier(mf) for mf in media_files]
+        payload = (
+            {'files': identifiers} if field_name == 'files'
+            else {field_name: identifiers[0]}
+        )
+        return self.client.post(url, json=payload, timeout=timeout)
+    
+    async def _apost_files(self, backend, route, media_files, field_name='file', read_timeout=None):
+        """
+        _post_files의 비동기 버전
+        
+        multipart 전송 시 파일은 스레드에서 읽는다 (이벤트 루프를 막지 않음).
+        """
+        url = f"{backend.url}{route}"
+        client = get_async_ai_client()
+        timeout = build_async_timeout(read_timeout or self.timeout)
+        
+        if not all(self._can_hand_off(mf) for mf in media_files):
+            files = []
+            for mf in media_files:
+                content = await asyncio.to_thread(self._read_local_file, mf)
+                files.append((field_name, (os.path.basename(mf.file_path), content)))
+            return await client.post(url, files=files, timeout=timeout)
+        
+        # ✅ 파일 참조만 전달
+        identifiers = [build_file_identifier(mf) for mf in media_files]
+        payload = (
+            {'files': identifiers} if field_name == 'files'
+            else {field_name: identifiers[0]}
+        )
+        return await client.post(url, json=payload, timeout=timeout)
+    
+    def _read_local_file(self, media_file):
+        with open(os.path.join(settings.MEDIA_ROOT, media_file.file_path), 'rb') as f:
+            return f.read()
+    
+    def _can_hand_off(self, media_file):
+        """파일 내용 대신 참조만 넘길 수 있는지 여부"""
+        if media_file.storage_type == 's3':
+            return True  # S3 파일은 로컬에 없으므로 항상 키 전달
+        return self.transport == 'path'
+    
+    def _get_content_hash(self, media_file):
+        """MediaFile 콘텐츠 해시 (업로드 시 계산)"""
+        return (media_file.metadata or {}).get('content_hash')
+    
+    def _build_image_result(self, result, processing_time):
+        """AI 서버 이미지 분석 응답을 서비스 결과 형식으로 변환"""
+        return {
+            'success': True,
+            'is_deepfake': result.get('is_deepfake', False),
+            'confidence_score': result.get('confidence', 0.0),  # 0-100
+            'analysis_result': self._get_analysis_result(
+                result.get('is_deepfake', False),
+                result.get('confidence', 0.0)
+            ),
+            'heatmap_url': result.get('heatmap_url', None),
+            'ai_model_version': result.get('model_version') or 'v1.0',
+            'processing_time': processing_time
+        }
+    
+    def _get_cached_result(self, content_hash, analysis_kind, start_time):
+        """
+        콘텐츠 해시로 캐시된 분석 결과 조회
+        
+        현재 AI 모델 버전(헬스 모니터가 마지막으로 확인한 버전)과 같은 결과만 사용
+        """
+        result = self.cache.get(
+            content_hash,
+            analysis_kind,
+            self.router.model_version
+        )
+        if result is None:
+            return None
+        
+        result['processing_time'] = int((time.time() - start_time) * 1000)
+        result['cached'] = True
+        return result
     
     def _get_mock_image_response(self, start_time):
         """
@@ -164,6 +590,8 @@ class AIModelService:
         """
         import random
         
+        record_mock_fallback('detection', 'image')
+        
         processing_time = int((time.time() - start_time) * 1000)
         
         # 랜덤으로 결과 생성 (테스트용)
@@ -186,6 +614,8 @@ class AIModelService:
         """
         import random
         
+        record_mock_fallback('detection', 'video')
+        
         processing_time = int((time.time() - start_time) * 1000)
         
         # 2-3명의 사람이 있다고 가정
@@ -228,13 +658,6 @@ class AIModelService:
         else:
             return 'safe'
     
-    def check_health(self):
-        """FastAPI 서버 상태 확인"""
-        try:
-            response = requests.get(
-                f"{self.fastapi_url}/health",
-                timeout=2  # 빠른 타임아웃
-            )
-            return response.status_code == 200
-        except:
-            return False
\ No newline at end of file
+    def check_health(self, capability='image'):
+        """기능을 지원하는 AI 서버 중 사용 가능한 서버가 있는지 (캐시된 상태 + 서킷 브레이커)"""
+        return self.router.choose(capability) is not None
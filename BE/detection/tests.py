@@ -1,3 +1,710 @@
-from django.test import TestCase
+import asyncio
+import threading
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from config.admission import AdmissionControlMixin, AdmissionController, TokenBucketThrottle
+from config.async_views import AsyncAPIView
+from config.pagination import KeysetPagination
+from users.models import User
+from .cache import AnalysisResultCache
+from .dispatch import AIDispatcher
+from .health import AIHealthMonitor
+from .jobs import VideoAnalysisQueue, get_queue_position, process_video_job, recover_video_jobs
+from .models import AnalysisDailyRollup, AnalysisRecord, UserAnalysisStatistics, VideoAnalysisJob
+from .services import AIModelService
+from .views import AnalysisArtifactView
+
+
+@override_settings(
+    AI_HEALTH_PROBE_INTERVAL=0,
+    AI_CIRCUIT_FAILURE_THRESHOLD=3,
+    AI_CIRCUIT_MIN_REQUESTS=100,
+    AI_CIRCUIT_RESET_TIMEOUT=30
+)
+class AIHealthMonitorTests(SimpleTestCase):
+    """서킷 브레이커 상태 전이"""
+
+    def setUp(self):
+        self.monitor = AIHealthMonitor('http://ai.test')
+
+    def test_opens_after_consecutive_failures(self):
+        for _ in range(2):
+            self.monitor.record_failure()
+        self.assertTrue(self.monitor.is_available())
+
+        self.monitor.record_failure()
+        self.assertEqual(self.monitor.state, AIHealthMonitor.OPEN)
+        self.assertFalse(self.monitor.is_available())
+
+    def test_half_open_allows_single_trial_then_closes_on_success(self):
+        for _ in range(3):
+            self.monitor.record_failure()
+        self.monitor.reset_timeout = 0
+
+        self.assertTrue(self.monitor.is_available())
+        self.assertEqual(self.monitor.state, AIHealthMonitor.HALF_OPEN)
+
+        self.monitor.reset_timeout = 30
+        self.assertFalse(self.monitor.is_available())
+
+        self.monitor.record_success()
+        self.assertEqual(self.monitor.state, AIHealthMonitor.CLOSED)
+        self.assertTrue(self.monitor.is_available())
+
+    def test_failed_trial_reopens(self):
+        for _ in range(3):
+            self.monitor.record_failure()
+        self.monitor.reset_timeout = 0
+        self.monitor.is_available()
+
+        self.monitor.record_failure()
+        self.assertEqual(self.monitor.state, AIHealthMonitor.OPEN)
+
+    def test_client_errors_do_not_count_as_failures(self):
+        exc = requests.exceptions.HTTPError(response=mock.Mock(status_code=400))
+        for _ in range(5):
+            self.monitor.record_exception(exc)
+        self.assertEqual(self.monitor.state, AIHealthMonitor.CLOSED)
+        self.assertEqual(self.monitor.consecutive_failures, 0)
+
+    def test_stale_state_does_not_probe_on_request_path(self):
+        with mock.patch.object(self.monitor, 'probe', side_effect=AssertionError('probe called')):
+            self.assertTrue(self.monitor._is_stale())
+            self.assertTrue(self.monitor.is_available())
+
+    def test_failed_probe_blocks_until_a_request_succeeds(self):
+        self.monitor.client = mock.Mock(get=mock.Mock(side_effect=requests.exceptions.ConnectionError()))
+        self.assertFalse(self.monitor.probe())
+        self.assertFalse(self.monitor.is_available())
+
+        self.monitor.record_success()
+        self.assertTrue(self.monitor.is_available())
+
+
+@override_settings(
+    VIDEO_ANALYSIS_RECOVERY_INTERVAL=0,
+    VIDEO_ANALYSIS_STALE_AFTER=900,
+    VIDEO_ANALYSIS_REQUEUE_AFTER=120
+)
+class VideoJobRecoveryTests(TestCase):
+    """주인을 잃은 영상 분석 작업 정리"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='jobs@test.com', password='pw12345!x', nickname='jobs')
+        self.queue = VideoAnalysisQueue(max_workers=2, max_queue_size=2)
+        self.queue.submit = mock.Mock(return_value=True)
+
+    def make_job(self, status, worker_id, age=0, started_age=None):
+        job = VideoAnalysisJob.objects.create(
+            user=self.user,
+            media_file_id=1,
+            job_status=status,
+            worker_id=worker_id,
+            processing_started_at=(
+                timezone.now() - timedelta(seconds=started_age) if started_age is not None else None
+            )
+        )
+        VideoAnalysisJob.objects.filter(pk=job.pk).update(created_at=timezone.now() - timedelta(seconds=age))
+        job.refresh_from_db()
+        return job
+
+    def test_stale_processing_jobs_fail(self):
+        stale = self.make_job('processing', 'old:1', started_age=1000)
+        running = self.make_job('processing', 'old:1', started_age=10)
+
+        failed, _ = recover_video_jobs(self.queue)
+
+        self.assertEqual(failed, 1)
+        stale.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual(stale.job_status, 'failed')
+        self.assertEqual(running.job_status, 'processing')
+
+    def test_old_queued_jobs_are_adopted(self):
+        orphan = self.make_job('queued', 'old:1', age=300)
+        fresh = self.make_job('queued', 'old:1', age=10)
+
+        _, adopted = recover_video_jobs(self.queue)
+
+        self.assertEqual(adopted, 1)
+        orphan.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(orphan.worker_id, self.queue.worker_id)
+        self.assertEqual(fresh.worker_id, 'old:1')
+
+    def test_previous_owner_skips_adopted_job(self):
+        job = self.make_job('queued', 'new:2')
+        self.assertIsNone(process_video_job(job.job_id, worker_id='old:1'))
+        job.refresh_from_db()
+        self.assertEqual(job.job_status, 'queued')
+
+    def test_queue_position_counts_only_same_process(self):
+        self.make_job('queued', 'other:1')
+        self.make_job('queued', 'mine:1')
+        job = self.make_job('queued', 'mine:1')
+        self.assertEqual(get_queue_position(job), 2)
+
+
+class AnalysisResultCacheTests(SimpleTestCase):
+    """분석 결과 캐시 키 / 무효화"""
+
+    def setUp(self):
+        self.cache = AnalysisResultCache(max_entries=2, ttl=60)
+        self.result = {'ai_model_version': 'v1', 'analysis_result': 'safe', 'confidence_score': 90}
+
+    def test_hit_requires_same_hash_kind_and_model_version(self):
+        self.cache.set('hash-a', 'image', self.result)
+
+        self.assertEqual(self.cache.get('hash-a', 'image', 'v1'), self.result)
+        self.assertIsNone(self.cache.get('hash-b', 'image', 'v1'))
+        self.assertIsNone(self.cache.get('hash-a', 'video', 'v1'))
+        self.assertIsNone(self.cache.get('hash-a', 'image', None))
+
+    def test_returns_copies(self):
+        self.cache.set('hash-a', 'image', self.result)
+        self.cache.get('hash-a', 'image', 'v1')['analysis_result'] = 'deepfake'
+        self.assertEqual(self.cache.get('hash-a', 'image', 'v1')['analysis_result'], 'safe')
+
+    def test_model_version_change_drops_old_results(self):
+        self.cache.set('hash-a', 'image', self.result)
+        self.assertIsNone(self.cache.get('hash-a', 'image', 'v2'))
+
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.assertEqual(self.cache.stats()['invalidations'], 1)
+
+    def test_expired_and_least_recent_entries_are_evicted(self):
+        for content_hash in ('hash-a', 'hash-b'):
+            self.cache.set(content_hash, 'image', self.result)
+        self.cache.get('hash-a', 'image', 'v1')
+        self.cache.set('hash-c', 'image', self.result)
+
+        self.assertIsNone(self.cache.get('hash-b', 'image', 'v1'))
+        self.assertIsNotNone(self.cache.get('hash-a', 'image', 'v1'))
+
+        self.cache.ttl = -1
+        self.assertIsNone(self.cache.get('hash-a', 'image', 'v1'))
+
+    def test_invalidate_clears_everything(self):
+        self.cache.set('hash-a', 'image', self.result)
+        self.cache.invalidate()
+        self.assertIsNone(self.cache.get('hash-a', 'image', 'v1'))
+
+
+def make_record(user, result='safe', analysis_type='image', **kwargs):
+    return AnalysisRecord.objects.create(
+        user=user,
+        analysis_type=analysis_type,
+        file_name='a.png',
+        file_size=1,
+        file_format='png',
+        original_path='detection/a.png',
+        analysis_result=result,
+        confidence_score=90,
+        processing_time=10,
+        ai_model_version='v1',
+        **kwargs
+    )
+
+
+class UserAnalysisStatisticsTests(TestCase):
+    """사용자 통계 증감 / 기존 기록 반영"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='stats@test.com', password='pw12345!x', nickname='stats')
+
+    def stats(self):
+        return UserAnalysisStatistics.objects.get(user=self.user)
+
+    def test_save_and_delete_adjust_counts(self):
+        make_record(self.user, 'safe', 'image')
+        deepfake = make_record(self.user, 'deepfake', 'video')
+
+        stats = self.stats()
+        self.assertEqual((stats.total_count, stats.safe_count, stats.deepfake_count), (2, 1, 1))
+        self.assertEqual((stats.image_count, stats.video_count), (1, 1))
+
+        deepfake.delete()
+        stats = self.stats()
+        self.assertEqual((stats.total_count, stats.deepfake_count, stats.video_count), (1, 0, 0))
+
+    def test_missing_row_is_seeded_from_existing_records(self):
+        for _ in range(3):
+            make_record(self.user)
+        UserAnalysisStatistics.objects.filter(user=self.user).delete()
+
+        make_record(self.user, 'suspicious')
+        stats = self.stats()
+        self.assertEqual((stats.total_count, stats.safe_count, stats.suspicious_count), (4, 3, 1))
+
+    def test_delete_without_row_is_seeded_before_decrement(self):
+        records = [make_record(self.user) for _ in range(3)]
+        UserAnalysisStatistics.objects.filter(user=self.user).delete()
+
+        records[0].delete()
+        stats = self.stats()
+        self.assertEqual((stats.total_count, stats.safe_count), (2, 2))
+
+    def test_row_created_concurrently_is_reused(self):
+        aggregate = UserAnalysisStatistics._aggregate.__func__
+
+        def other_request_creates_row(cls, user_ids=None):
+            # exists() 확인과 생성 사이에 다른 요청이 먼저 행을 만든 경우
+            UserAnalysisStatistics.objects.create(user=self.user, total_count=1, safe_count=1, image_count=1)
+            return aggregate(cls, user_ids)
+
+        with mock.patch.object(UserAnalysisStatistics, '_aggregate', classmethod(other_request_creates_row)):
+            make_record(self.user)
+
+        stats = self.stats()
+        self.assertEqual((stats.total_count, stats.safe_count), (2, 2))
+
+    def test_statistics_view_includes_recent_records(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        record = make_record(self.user, 'deepfake', heatmap_path='http://ai.test/static/h.png')
+
+        response = client.get(reverse('detection:statistics'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['total_analyses'], response.data['deepfake_count']), (1, 1))
+        recent = response.data['recent_analyses'][0]
+        self.assertEqual(recent['record_id'], record.pk)
+        self.assertEqual(
+            recent['heatmap_thumbnail_url'],
+            f'http://testserver/api/detection/records/{record.pk}/artifacts/heatmap/?size=thumbnail'
+        )
+
+    def test_rebuild_matches_records(self):
+        make_record(self.user, 'deepfake', 'zoom')
+        UserAnalysisStatistics.objects.filter(user=self.user).update(total_count=99)
+
+        UserAnalysisStatistics.rebuild([self.user.pk])
+        stats = self.stats()
+        self.assertEqual((stats.total_count, stats.deepfake_count, stats.zoom_count), (1, 1, 1))
+
+
+class AnalysisDailyRollupTests(TestCase):
+    """일별 집계 증감 / 기간별 조회"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='rollup@test.com', password='pw12345!x', nickname='rollup')
+
+    def rollup(self, day):
+        return AnalysisDailyRollup.objects.get(user=self.user, date=day)
+
+    def test_save_and_delete_adjust_today(self):
+        make_record(self.user, 'safe')
+        record = make_record(self.user, 'deepfake')
+        today = timezone.localdate()
+        self.assertEqual((self.rollup(today).total_count, self.rollup(today).deepfake_count), (2, 1))
+
+        record.delete()
+        self.assertEqual((self.rollup(today).total_count, self.rollup(today).deepfake_count), (1, 0))
+
+    def test_delete_on_day_without_rollup_is_seeded_first(self):
+        records = [make_record(self.user) for _ in range(2)]
+        old = timezone.now() - timedelta(days=10)
+        AnalysisRecord.objects.filter(user=self.user).update(created_at=old)
+        AnalysisDailyRollup.objects.filter(user=self.user).delete()
+
+        records[0].refresh_from_db()
+        records[0].delete()
+        self.assertEqual(self.rollup(timezone.localdate(old)).total_count, 1)
+
+    def test_row_created_concurrently_is_reused(self):
+        aggregate = AnalysisDailyRollup._aggregate.__func__
+
+        def other_request_creates_row(cls, user_ids=None, start=None, end=None):
+            # 같은 날 첫 기록을 다른 요청이 먼저 저장하고 집계 행을 만든 경우
+            AnalysisDailyRollup.objects.create(
+                user=self.user, date=timezone.localdate(), total_count=1, safe_count=1, image_count=1
+            )
+            return aggregate(cls, user_ids, start, end)
+
+        with mock.patch.object(AnalysisDailyRollup, '_aggregate', classmethod(other_request_creates_row)):
+            make_record(self.user)
+
+        rollup = self.rollup(timezone.localdate())
+        self.assertEqual((rollup.total_count, rollup.safe_count), (2, 2))
+
+    def test_rebuild_matches_records(self):
+        make_record(self.user, 'suspicious', 'video')
+        AnalysisDailyRollup.objects.filter(user=self.user).update(total_count=99)
+
+        AnalysisDailyRollup.rebuild([self.user.pk])
+        rollup = self.rollup(timezone.localdate())
+        self.assertEqual((rollup.total_count, rollup.suspicious_count, rollup.video_count), (1, 1, 1))
+
+    def test_series_fills_empty_periods_and_groups_by_interval(self):
+        AnalysisDailyRollup.objects.create(user=self.user, date=date(2026, 2, 27), total_count=2, safe_count=2)
+        AnalysisDailyRollup.objects.create(user=self.user, date=date(2026, 3, 2), total_count=3, deepfake_count=1)
+        start, end = date(2026, 2, 27), date(2026, 3, 3)  # 금요일 ~ 다음 주 화요일
+
+        daily = AnalysisDailyRollup.series(self.user, start, end, 'day')
+        self.assertEqual([row['total_count'] for row in daily], [2, 0, 0, 3, 0])
+        self.assertEqual(daily[0]['period'], start)
+
+        weekly = AnalysisDailyRollup.series(self.user, start, end, 'week')
+        self.assertEqual(
+            [(row['period'], row['total_count']) for row in weekly],
+            [(date(2026, 2, 23), 2), (date(2026, 3, 2), 3)]
+        )
+
+        monthly = AnalysisDailyRollup.series(self.user, start, end, 'month')
+        self.assertEqual(
+            [(row['period'], row['total_count'], row['deepfake_count']) for row in monthly],
+            [(date(2026, 2, 1), 2, 0), (date(2026, 3, 1), 3, 1)]
+        )
+
+
+@mock.patch.object(KeysetPagination, 'page_size', 2)
+class KeysetPaginationTests(TestCase):
+    """분석 기록 목록 커서 페이지네이션"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='pages@test.com', password='pw12345!x', nickname='pages')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('detection:record_list')
+
+        # 생성 시각이 같은 기록이 섞여 있어도 PK로 순서가 정해져야 함
+        now = timezone.now()
+        self.records = [make_record(self.user) for _ in range(5)]
+        for index, record in enumerate(self.records):
+            created_at = now - timedelta(minutes=index // 2)
+            AnalysisRecord.objects.filter(pk=record.pk).update(created_at=created_at)
+        self.expected = [
+            record.pk for record in
+            AnalysisRecord.objects.filter(user=self.user).order_by('-created_at', '-record_id')
+        ]
+
+    def ids(self, response):
+        return [row['record_id'] for row in response.data['results']]
+
+    def test_next_links_walk_every_row_once_in_order(self):
+        seen = []
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['count'], 5)
+        while True:
+            seen.extend(self.ids(response))
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        self.assertEqual(seen, self.expected)
+
+    def test_previous_link_returns_the_earlier_page(self):
+        first = self.client.get(self.url)
+        second = self.client.get(first.data['next'])
+        back = self.client.get(second.data['previous'])
+
+        self.assertEqual(self.ids(second), self.expected[2:4])
+        self.assertEqual(self.ids(back), self.ids(first))
+        self.assertIsNone(self.client.get(self.url).data['previous'])
+
+    def test_count_can_be_skipped(self):
+        self.assertIsNone(self.client.get(self.url, {'count': 'false'}).data['count'])
+
+    def test_page_number_is_rejected(self):
+        response = self.client.get(self.url, {'page': 2})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('cursor', str(response.data['page']))
+
+    def test_invalid_cursor_is_not_found(self):
+        self.assertEqual(self.client.get(self.url, {'cursor': 'broken'}).status_code, 404)
+
+
+class AIDispatcherTests(SimpleTestCase):
+    """AI 호출 우선순위 / SLO 초과 요청 우선 처리"""
+
+    LANES = {
+        'zoom': {'priority': 0, 'max_concurrency': 2, 'slo': 1},
+        'image': {'priority': 1, 'max_concurrency': 2, 'slo': 5},
+        'bulk': {'priority': 2, 'max_concurrency': 1, 'slo': 60},
+    }
+
+    def setUp(self):
+        self.dispatcher = AIDispatcher(max_concurrency=1, lanes=self.LANES)
+        self.holder = self.dispatcher._enqueue('image')
+        self.assertTrue(self.holder.granted)
+
+    def test_higher_priority_lane_goes_first(self):
+        bulk = self.dispatcher._enqueue('bulk')
+        image = self.dispatcher._enqueue('image')
+        zoom = self.dispatcher._enqueue('zoom')
+
+        self.dispatcher._release(self.holder)
+        self.assertEqual([w.granted for w in (zoom, image, bulk)], [True, False, False])
+
+        self.dispatcher._release(zoom)
+        self.assertEqual([w.granted for w in (image, bulk)], [True, False])
+
+        self.dispatcher._release(image)
+        self.assertTrue(bulk.granted)
+
+    def test_request_past_its_slo_beats_higher_priority(self):
+        bulk = self.dispatcher._enqueue('bulk')
+        bulk.enqueued_at = time.monotonic() - 61  # bulk SLO(60초) 초과
+        zoom = self.dispatcher._enqueue('zoom')
+
+        self.dispatcher._release(self.holder)
+        self.assertTrue(bulk.granted)
+        self.assertFalse(zoom.granted)
+        self.assertEqual(self.dispatcher.snapshot()['lanes']['bulk']['slo_misses'], 1)
+
+    def test_most_overdue_relative_to_slo_wins(self):
+        image = self.dispatcher._enqueue('image')
+        image.enqueued_at = time.monotonic() - 10  # SLO의 2배
+        zoom = self.dispatcher._enqueue('zoom')
+        zoom.enqueued_at = time.monotonic() - 3  # SLO의 3배
+
+        self.dispatcher._release(self.holder)
+        self.assertTrue(zoom.granted)
+        self.assertFalse(image.granted)
+
+    def test_lane_cap_leaves_room_for_other_lanes(self):
+        dispatcher = AIDispatcher(max_concurrency=3, lanes=self.LANES)
+        first, second = dispatcher._enqueue('bulk'), dispatcher._enqueue('bulk')
+        zoom = dispatcher._enqueue('zoom')
+
+        self.assertEqual([w.granted for w in (first, second, zoom)], [True, False, True])
+        self.assertEqual(dispatcher.queued('bulk'), 1)
+
+    def test_cancelled_async_waiter_leaves_queue(self):
+        async def wait_then_cancel():
+            async def enter():
+                async with self.dispatcher.aslot('zoom'):
+                    pass
+
+            task = asyncio.ensure_future(enter())
+            await asyncio.sleep(0)
+            self.assertEqual(self.dispatcher.queued('zoom'), 1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(wait_then_cancel())
+        self.assertEqual(self.dispatcher.queued('zoom'), 0)
+
+        self.dispatcher._release(self.holder)
+        self.assertEqual(self.dispatcher.in_flight, 0)
+
+
+class HedgedCallTests(SimpleTestCase):
+    """sync 헤지 요청 (먼저 성공한 응답 사용)"""
+
+    def setUp(self):
+        self.service = AIModelService()
+        self.service.router = mock.Mock()
+        self.service.latency = mock.Mock(timeout_for=mock.Mock(return_value=5))
+        self.service._get_payload_size = mock.Mock(return_value=100)
+        self.service._get_hedge_delay = mock.Mock(return_value=0.05)
+        self.primary, self.other = object(), object()
+        self.service.router.choose.return_value = self.other
+        self.called = []
+
+    def attempt(self, primary, other=lambda: {'backend': 'other'}):
+        def run(backend, *args):
+            self.called.append(backend)
+            return primary() if backend is self.primary else other()
+        return run
+
+    def call(self):
+        return self.service._call_ai(self.primary, 'image', '/api/analyze/image', [mock.Mock()], hedge=True)
+
+    def test_fast_primary_is_used_without_hedge(self):
+        self.service._attempt = mock.Mock(side_effect=self.attempt(lambda: {'backend': 'primary'}))
+
+        self.assertEqual(self.call(), {'backend': 'primary'})
+        self.assertEqual(self.called, [self.primary])
+
+    def test_fast_hedge_beats_slow_primary(self):
+        def slow():
+            time.sleep(0.5)
+            return {'backend': 'primary'}
+        self.service._attempt = mock.Mock(side_effect=self.attempt(slow))
+
+        started = time.monotonic()
+        self.assertEqual(self.call(), {'backend': 'other'})
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.service.latency.record_hedge_win.assert_called_once_with('/api/analyze/image')
+
+    def test_hedge_answers_when_slow_primary_fails(self):
+        def slow_failure():
+            time.sleep(0.1)
+            raise requests.exceptions.Timeout()
+        def slower():
+            time.sleep(0.2)
+            return {'backend': 'other'}
+        self.service._attempt = mock.Mock(side_effect=self.attempt(slow_failure, slower))
+
+        self.assertEqual(self.call(), {'backend': 'other'})
+
+    def test_quick_primary_failure_is_raised_without_hedge(self):
+        def failure():
+            raise requests.exceptions.ConnectionError()
+        self.service._attempt = mock.Mock(side_effect=self.attempt(failure))
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.call()
+        self.assertEqual(self.called, [self.primary])
+
+
+class AsyncImageAnalysisTests(SimpleTestCase):
+    """async 이미지 분석 오류 처리"""
+
+    def test_non_json_ai_response_returns_error_result(self):
+        service = AIModelService()
+        service._get_content_hash = mock.Mock(return_value='hash')
+        service._get_cached_result = mock.Mock(return_value=None)
+        service.router = mock.Mock()
+        service._acall_ai = mock.AsyncMock(side_effect=ValueError('Expecting value'))
+
+        with mock.patch('detection.services.write_system_log') as log:
+            result = asyncio.run(service.aanalyze_image(mock.Mock()))
+
+        self.assertFalse(result['success'])
+        self.assertIn('error', result)
+        log.assert_called_once()
+
+class _AdmittedView(AdmissionControlMixin, AsyncAPIView):
+    admission_scope = 'image'
+    release = None
+
+    async def post(self, request):
+        if self.release is not None:
+            await self.release.wait()
+        return Response({'ok': True})
+
+
+@override_settings(ADMISSION_RATE_LIMITS={'image': {'rate': 0.5, 'burst': 2}})
+class AdmissionControlTests(SimpleTestCase):
+    """승인 제어 (429 + Retry-After, 처리 자리 반납)"""
+
+    def setUp(self):
+        cache.clear()
+        self.controller = AdmissionController(max_in_flight=10, max_in_flight_per_user=1)
+        patcher = mock.patch('config.admission._controller', self.controller)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = SimpleNamespace(pk=7, is_authenticated=True)
+
+    def post(self, view=None):
+        request = APIRequestFactory().post('/analyze/')
+        force_authenticate(request, user=self.user)
+        return asyncio.run((view or _AdmittedView.as_view())(request))
+
+    def test_rate_limit_returns_429_with_retry_after(self):
+        self.assertEqual([self.post().status_code for _ in range(2)], [200, 200])
+
+        response = self.post()
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(1 <= int(response['Retry-After']) <= 4)
+
+    def test_tokens_refill_at_rate_up_to_burst(self):
+        now = [1000.0]
+        clock = SimpleNamespace(time=lambda: now[0], monotonic=time.monotonic, sleep=time.sleep)
+        with mock.patch('config.admission.time', clock):
+            self.assertEqual([self.post().status_code for _ in range(3)], [200, 200, 429])
+
+            now[0] += 2  # rate 0.5 → 토큰 1개
+            self.assertEqual([self.post().status_code for _ in range(2)], [200, 429])
+
+            now[0] += 600  # 오래 쉬어도 burst개까지만
+            self.assertEqual([self.post().status_code for _ in range(3)], [200, 200, 429])
+
+    @override_settings(ADMISSION_RATE_LIMITS={'image': {'rate': 0.001, 'burst': 5}})
+    def test_concurrent_requests_spend_each_token_once(self):
+        request = SimpleNamespace(user=self.user)
+        view = SimpleNamespace(admission_scope='image')
+        allowed = []
+
+        def spend():
+            allowed.append(TokenBucketThrottle().allow_request(request, view))
+
+        threads = [threading.Thread(target=spend) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(allowed.count(True), 5)
+
+    def test_user_concurrency_limit_returns_429(self):
+        self.controller.try_acquire(self.user.pk)
+
+        response = self.post()
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+    def test_slot_is_released_after_response(self):
+        self.assertEqual(self.post().status_code, 200)
+        self.assertEqual(self.controller.snapshot()['in_flight'], 0)
+
+    def test_slot_is_released_when_request_is_cancelled(self):
+        view = _AdmittedView.as_view(release=asyncio.Event())  # 응답하지 않는 핸들러
+
+        async def cancel_mid_request():
+            request = APIRequestFactory().post('/analyze/')
+            force_authenticate(request, user=self.user)
+            task = asyncio.ensure_future(view(request))
+            while self.controller.snapshot()['in_flight'] == 0:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_mid_request())
+        self.assertEqual(self.controller.snapshot()['in_flight'], 0)
+
+
+class AnalysisArtifactTests(TestCase):
+    """분석 결과 이미지 URL / ETag"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='artifact@test.com', password='pw12345!x', nickname='artifact')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_relative_urls_resolve_against_answering_backend(self):
+        result = {
+            'heatmap_url': '/static/heatmap.png',
+            'detection_details': [
+                {'detection_image_url': 'static/face.png', 'heatmap_url': 'http://cdn.test/h.png'}
+            ],
+        }
+        AIModelService()._resolve_artifact_urls(SimpleNamespace(url='http://ai-2:9000'), result)
+
+        self.assertEqual(result['heatmap_url'], 'http://ai-2:9000/static/heatmap.png')
+        self.assertEqual(result['detection_details'][0]['detection_image_url'], 'http://ai-2:9000/static/face.png')
+        self.assertEqual(result['detection_details'][0]['heatmap_url'], 'http://cdn.test/h.png')
+
+    def test_record_urls_are_absolute(self):
+        record = make_record(
+            self.user,
+            heatmap_path='http://ai-2:9000/static/heatmap.png',
+            detection_details=[{'person_id': 1, 'heatmap_url': 'http://ai-2:9000/static/p1.png'}]
+        )
+        data = self.client.get(reverse('detection:record_detail', kwargs={'pk': record.pk})).data
+
+        base = f'http://testserver/api/detection/records/{record.pk}/artifacts/'
+        self.assertEqual(data['heatmap_url'], f'{base}heatmap/')
+        self.assertEqual(data['heatmap_thumbnail_url'], f'{base}heatmap/?size=thumbnail')
+        self.assertEqual(data['detection_details'][0]['heatmap_url'], f'{base}persons/1/heatmap/')
+
+    def test_if_none_match_compares_whole_etags(self):
+        matches = AnalysisArtifactView._etag_matches
+        self.assertTrue(matches('"abc"', '"xyz", W/"abc"'))
+        self.assertTrue(matches('"abc"', '*'))
+        self.assertFalse(matches('"ab"', '"abc"'))
+        self.assertFalse(matches('"abc"', ''))
@@ -2,10 +2,15 @@
 from django.urls import path
 from .views import (
     ImageAnalysisView,
+    BatchImageAnalysisView,
     VideoAnalysisView,
+    VideoAnalysisJobDetailView,
+    VideoUploadCompleteView,
     AnalysisRecordListView,
     AnalysisRecordDetailView,
+    AnalysisArtifactView,
     AnalysisStatisticsView,
+    AnalysisTimeSeriesView,
     AIHealthCheckView
 )
 
@@ -14,14 +19,19 @@ app_name = 'detection'
 urlpatterns = [
     # 분석
     path('image/', ImageAnalysisView.as_view(), name='image_analysis'),
+    path('image/batch/', BatchImageAnalysisView.as_view(), name='batch_image_analysis'),
     path('video/', VideoAnalysisView.as_view(), name='video_analysis'),
+    path('video/jobs/<int:pk>/', VideoAnalysisJobDetailView.as_view(), name='video_job_detail'),
+    path('video/uploads/<int:upload_id>/complete/', VideoUploadCompleteView.as_view(), name='video_upload_complete'),
     
     # 기록
     path('records/', AnalysisRecordListView.as_view(), name='record_list'),
     path('records/<int:pk>/', AnalysisRecordDetailView.as_view(), name='record_detail'),
+    path('records/<int:pk>/artifacts/<path:artifact>/', AnalysisArtifactView.as_view(), name='record_artifact'),
     
     # 통계
     path('statistics/', AnalysisStatisticsView.as_view(), name='statistics'),
+    path('statistics/timeseries/', AnalysisTimeSeriesView.as_view(), name='statistics_timeseries'),
     
     # 상태 확인
     path('health/', AIHealthCheckView.as_view(), name='health'),
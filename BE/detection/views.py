@@ -1,29 +1,93 @@
 from rest_framework import status, generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Count, Q
+from asgiref.sync import sync_to_async
+from django.db import connection, transaction
 from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified, HttpResponseRedirect
+from django.utils.http import parse_etags
 import os
+import requests
 
-from .models import AnalysisRecord
+from .models import AnalysisDailyRollup, AnalysisRecord, DetectedPerson, UserAnalysisStatistics, VideoAnalysisJob
 from .serializers import (
     AnalysisRecordSerializer,
     AnalysisRecordListSerializer,
     ImageAnalysisRequestSerializer,
+    BatchImageAnalysisRequestSerializer,
     VideoAnalysisRequestSerializer,
-    AnalysisStatisticsSerializer
+    AnalysisStatisticsSerializer,
+    AnalysisTimeSeriesRequestSerializer,
+    VideoAnalysisJobSerializer
 )
 from .services import AIModelService
+from .artifacts import AnalysisArtifactService, artifact_url
+from .jobs import enqueue_video_analysis, get_video_analysis_queue
+from media_files.models import MediaFile
 from media_files.services import FileService
+from media_files.storage import S3Storage
+from media_files.upload_sessions import UploadSessionService
+from media_files.uploadhandlers import StreamingUploadMixin
+from config.admission import AdmissionControlMixin
+from config.async_views import AsyncAPIView
+from config.pagination import KeysetPagination
+from config.projection import ProjectedListMixin
 
 
-class ImageAnalysisView(APIView):
-    """이미지 딥페이크 분석 API (단일 사람)"""
+class DetectionUploadMixin(StreamingUploadMixin):
+    """분석 요청 업로드 (S3 키 전달 방식이면 로컬 스트리밍 저장 사용 안 함)"""
     
-    def post(self, request):
-        serializer = ImageAnalysisRequestSerializer(data=request.data)
+    upload_purpose = 'detection'
+    
+    def use_streaming_upload(self, request):
+        return (
+            super().use_streaming_upload(request)
+            and settings.AI_DETECTION_TRANSPORT != 's3'
+        )
+
+
+class VideoAdmissionMixin(AdmissionControlMixin):
+    """영상 분석 작업 등록 승인 제어 (영상 분석 큐 기준)"""
+    
+    admission_scope = 'video'
+    
+    def check_admission(self, request):
+        # 요청은 작업 등록 후 바로 끝나므로 사용자별 상한은 대기 + 처리 중 작업 수로 판단
+        active_jobs = VideoAnalysisJob.objects.filter(
+            user=request.user,
+            job_status__in=['queued', 'processing']
+        ).count()
+        if active_jobs >= settings.ADMISSION_MAX_ACTIVE_VIDEO_JOBS:
+            self.reject('user_concurrency')
         
-        if not serializer.is_valid():
+        super().check_admission(request)
+    
+    def is_saturated(self):
+        return not get_video_analysis_queue().has_capacity()
+    
+    def estimate_wait(self):
+        return get_video_analysis_queue().estimated_wait()
+
+
+class ImageAnalysisView(AdmissionControlMixin, DetectionUploadMixin, AsyncAPIView):
+    """
+    이미지 딥페이크 분석 API (단일 사람)
+    
+    async 뷰: AI 서버 응답을 기다리는 동안 워커 스레드를 점유하지 않는다.
+    파일 저장·분석 기록 저장(ORM)은 스레드에서 실행한다.
+    """
+    
+    upload_field_types = {'image': 'image'}
+    admission_scope = 'image'
+    admission_lane = 'image'
+    
+    async def post(self, request):
+        serializer = ImageAnalysisRequestSerializer(
+            data=await self.get_request_data(request)
+        )
+        
+        if not await sync_to_async(serializer.is_valid)():
             return Response(
                 serializer.errors,
                 status=status.HTTP_400_BAD_REQUEST
@@ -37,52 +101,37 @@ class ImageAnalysisView(APIView):
         
         try:
             # ✅ 통합 파일 업로드
-            media_file = file_service.upload_file(
+            media_file = await sync_to_async(file_service.upload_file)(
                 uploaded_file=image,
                 file_type='image',
                 purpose='detection',
                 is_temporary=True,  # 분석 후 삭제
-                use_s3=False
+                use_s3=settings.AI_DETECTION_TRANSPORT == 's3'  # ✅ S3 키 전달 방식이면 S3에 저장
             )
             
             # AI 분석
             ai_service = AIModelService()
-            full_path = os.path.join(settings.MEDIA_ROOT, media_file.file_path)
-            result = ai_service.analyze_image(full_path)
+            result = await ai_service.aanalyze_image(media_file)
             
             if not result['success']:
+                # ✅ 분석에 실패한 임시 파일 즉시 삭제
+                await sync_to_async(file_service.delete_file)(media_file.file_id, hard_delete=True)
                 return Response(
                     {'error': result['error']},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
             
-            # 분석 기록 저장
-            record = AnalysisRecord.objects.create(
-                user=request.user,
-                analysis_type=analysis_type,
-                file_name=media_file.original_name,
-                file_size=media_file.file_size,
-                file_format=media_file.file_format,
-                original_path=media_file.file_path,
-                heatmap_path=result.get('heatmap_url'),  # ✅ 히트맵
-                analysis_result=result['analysis_result'],
-                confidence_score=result['confidence_score'],
-                processing_time=result['processing_time'],
-                ai_model_version=result['ai_model_version']
+            record = await sync_to_async(self.save_record)(
+                request.user, media_file, analysis_type, result
             )
             
-            # ✅ 관계 연결
-            media_file.related_model = 'AnalysisRecord'
-            media_file.related_record_id = record.record_id
-            media_file.save()
-            
             # ✅ 단순화된 응답
             return Response({
                 'record_id': record.record_id,
                 'is_deepfake': result['is_deepfake'],
                 'confidence_score': float(result['confidence_score']),
                 'analysis_result': result['analysis_result'],
-                'heatmap_url': result.get('heatmap_url')
+                'heatmap_url': artifact_url(record.record_id, 'heatmap', request=request) if record.heatmap_path else None
             }, status=status.HTTP_201_CREATED)
         
         except ValueError as e:
@@ -90,13 +139,46 @@ class ImageAnalysisView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+    
+    def save_record(self, user, media_file, analysis_type, result):
+        """분석 기록 저장 + 파일 관계 연결"""
+        
+        record = AnalysisRecord.objects.create(
+            user=user,
+            analysis_type=analysis_type,
+            file_name=media_file.original_name,
+            file_size=media_file.file_size,
+            file_format=media_file.file_format,
+            original_path=media_file.file_path,
+            heatmap_path=result.get('heatmap_url'),  # ✅ 히트맵
+            analysis_result=result['analysis_result'],
+            confidence_score=result['confidence_score'],
+            processing_time=result['processing_time'],
+            ai_model_version=result['ai_model_version']
+        )
+        
+        # ✅ 관계 연결
+        media_file.related_model = 'AnalysisRecord'
+        media_file.related_record_id = record.record_id
+        media_file.save()
+        
+        return record
 
 
-class VideoAnalysisView(APIView):
-    """영상 딥페이크 분석 API (다중 사람)"""
+class BatchImageAnalysisView(AdmissionControlMixin, DetectionUploadMixin, APIView):
+    """
+    이미지 일괄 딥페이크 분석 API
+    
+    여러 이미지를 한 번에 저장하고, AI 서버에 동시에 분석을 요청한 뒤
+    분석 기록을 일괄 저장한다. 결과는 입력 순서대로, 항목별 오류와 함께 반환한다.
+    """
+    
+    upload_field_types = {'images': 'image'}
+    admission_scope = 'image'
+    admission_lane = 'image'
     
     def post(self, request):
-        serializer = VideoAnalysisRequestSerializer(data=request.data)
+        serializer = BatchImageAnalysisRequestSerializer(data=request.data)
         
         if not serializer.is_valid():
             return Response(
@@ -104,72 +186,199 @@ class VideoAnalysisView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        video = serializer.validated_data['video']
+        images = serializer.validated_data['images']
+        analysis_type = serializer.validated_data['analysis_type']
         
-        # ✅ FileService 사용
+        # ✅ 파일 일괄 저장
         file_service = FileService(request.user)
+        media_files, errors = file_service.upload_files(
+            uploaded_files=images,
+            file_type='image',
+            purpose='detection',
+            is_temporary=True,  # 분석 후 삭제
+            use_s3=settings.AI_DETECTION_TRANSPORT == 's3'  # ✅ S3 키 전달 방식이면 S3에 저장
+        )
         
-        try:
-            # ✅ 통합 파일 업로드
-            media_file = file_service.upload_file(
-                uploaded_file=video,
-                file_type='video',
-                purpose='detection',
-                is_temporary=True,  # 분석 후 삭제
-                use_s3=False
-            )
-            
-            # AI 분석
-            ai_service = AIModelService()
-            full_path = os.path.join(settings.MEDIA_ROOT, media_file.file_path)
-            result = ai_service.analyze_video(full_path)
-            
+        # AI 분석 (저장에 성공한 파일만, 동시 요청)
+        stored = [(index, mf) for index, mf in enumerate(media_files) if mf is not None]
+        ai_service = AIModelService()
+        analyses = ai_service.analyze_images([mf for _, mf in stored])
+        
+        # 분석 기록 준비
+        records = []
+        analyzed = []  # (입력 인덱스, MediaFile, 분석 결과)
+        failed_files = []
+        for (index, media_file), result in zip(stored, analyses):
             if not result['success']:
-                return Response(
-                    {'error': result['error']},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
+                errors[index] = result['error']
+                failed_files.append(media_file)
+                continue
             
-            # 분석 기록 저장
-            record = AnalysisRecord.objects.create(
+            records.append(AnalysisRecord(
                 user=request.user,
-                analysis_type='video',
+                analysis_type=analysis_type,
                 file_name=media_file.original_name,
                 file_size=media_file.file_size,
                 file_format=media_file.file_format,
                 original_path=media_file.file_path,
+                heatmap_path=result.get('heatmap_url'),  # ✅ 히트맵
                 analysis_result=result['analysis_result'],
                 confidence_score=result['confidence_score'],
-                detection_details=result.get('detection_details', []),  # ✅ 사람별 상세 결과
                 processing_time=result['processing_time'],
                 ai_model_version=result['ai_model_version']
-            )
-            
-            # ✅ 관계 연결
-            media_file.related_model = 'AnalysisRecord'
-            media_file.related_record_id = record.record_id
-            media_file.save()
-            
-            # ✅ 다중 사람 분석 결과 반환
-            return Response({
+            ))
+            analyzed.append((index, media_file, result))
+        
+        # ✅ 분석 기록 일괄 저장 + 관계 연결
+        if records:
+            with transaction.atomic():
+                if connection.features.can_return_rows_from_bulk_insert:
+                    AnalysisRecord.objects.bulk_create(records)
+                    UserAnalysisStatistics.increment(records)  # bulk_create는 save()를 거치지 않음
+                    AnalysisDailyRollup.increment(records)
+                else:
+                    # MySQL은 bulk_create 후 PK를 채워주지 않으므로 한 건씩 저장 (save()가 통계 갱신)
+                    for record in records:
+                        record.save()
+                
+                for record, (_, media_file, _) in zip(records, analyzed):
+                    media_file.related_model = 'AnalysisRecord'
+                    media_file.related_record_id = record.record_id
+                
+                MediaFile.objects.bulk_update(
+                    [media_file for _, media_file, _ in analyzed],
+                    ['related_model', 'related_record_id']
+                )
+        
+        # ✅ 분석에 실패한 임시 파일 즉시 삭제
+        for media_file in failed_files:
+            file_service.delete_file(media_file.file_id, hard_delete=True)
+        
+        # ✅ 입력 순서대로 결과 구성
+        results = [
+            {'index': index, 'success': False, 'error': error}
+            for index, error in errors.items()
+        ]
+        for record, (index, _, result) in zip(records, analyzed):
+            results.append({
+                'index': index,
+                'success': True,
                 'record_id': record.record_id,
                 'is_deepfake': result['is_deepfake'],
                 'confidence_score': float(result['confidence_score']),
                 'analysis_result': result['analysis_result'],
-                'detection_details': result.get('detection_details', [])
-            }, status=status.HTTP_201_CREATED)
+                'heatmap_url': artifact_url(record.record_id, 'heatmap', request=request) if record.heatmap_path else None
+            })
+        results.sort(key=lambda item: item['index'])
+        
+        return Response({
+            'total': len(images),
+            'succeeded': len(records),
+            'failed': len(errors),
+            'results': results
+        }, status=status.HTTP_201_CREATED if records else status.HTTP_400_BAD_REQUEST)
+
+
+class VideoAnalysisView(VideoAdmissionMixin, DetectionUploadMixin, APIView):
+    """영상 딥페이크 분석 API (다중 사람) - 작업 등록 후 202 응답"""
+    
+    upload_field_types = {'video': 'video'}
+    
+    def post(self, request):
+        serializer = VideoAnalysisRequestSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        video = serializer.validated_data['video']
+        
+        # 큐가 가득 찬 경우는 승인 제어(VideoAdmissionMixin)에서 본문 파싱 전에 429로 거절
+        queue = get_video_analysis_queue()
+        
+        # ✅ FileService 사용
+        file_service = FileService(request.user)
         
+        try:
+            # ✅ 통합 파일 업로드
+            media_file = file_service.upload_file(
+                uploaded_file=video,
+                file_type='video',
+                purpose='detection',
+                is_temporary=True,  # 분석 후 삭제
+                use_s3=settings.AI_DETECTION_TRANSPORT == 's3'  # ✅ S3 키 전달 방식이면 S3에 저장
+            )
         except ValueError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # ✅ 분석 작업 등록 (AI 분석은 백그라운드 워커에서 처리)
+        job = enqueue_video_analysis(request.user, media_file, queue)
+        if job is None:
+            return Response(
+                {'error': '영상 분석 요청이 많습니다. 잠시 후 다시 시도해주세요.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        return Response(
+            VideoAnalysisJobSerializer(job, context={'request': request}).data,
+            status=status.HTTP_202_ACCEPTED
+        )
 
 
-class AnalysisRecordListView(generics.ListAPIView):
+class VideoUploadCompleteView(VideoAdmissionMixin, APIView):
+    """분할 업로드 완료 후 영상 분석 작업 등록 API"""
+    
+    def post(self, request, upload_id):
+        # 큐가 가득 찼으면 승인 제어에서 완료 처리 전에 429로 거절 (세션은 유지되어 다시 요청 가능)
+        queue = get_video_analysis_queue()
+        
+        try:
+            media_file = UploadSessionService(request.user).complete(
+                upload_id,
+                purpose='detection',
+                is_temporary=True,  # 분석 후 삭제
+                use_s3=settings.AI_DETECTION_TRANSPORT == 's3'
+            )
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        job = enqueue_video_analysis(request.user, media_file, queue)
+        if job is None:
+            return Response(
+                {'error': '영상 분석 요청이 많습니다. 잠시 후 다시 시도해주세요.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        return Response(
+            VideoAnalysisJobSerializer(job, context={'request': request}).data,
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+class VideoAnalysisJobDetailView(generics.RetrieveAPIView):
+    """영상 분석 작업 상태 조회 API (폴링용)"""
+    
+    serializer_class = VideoAnalysisJobSerializer
+    
+    def get_queryset(self):
+        return VideoAnalysisJob.objects.filter(
+            user=self.request.user
+        ).select_related('record')
+
+
+class AnalysisRecordListView(ProjectedListMixin, generics.ListAPIView):
     """분석 기록 목록 조회 API"""
     
     serializer_class = AnalysisRecordListSerializer
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         queryset = AnalysisRecord.objects.filter(user=self.request.user)
@@ -183,7 +392,32 @@ class AnalysisRecordListView(generics.ListAPIView):
         if analysis_result:
             queryset = queryset.filter(analysis_result=analysis_result)
         
+        # ✅ 인물별 결과 필터 (예: ?person=deepfake&person_min_confidence=90)
+        person_filter = self.get_person_filter()
+        if person_filter:
+            persons = DetectedPerson.objects.filter(user=self.request.user, **person_filter)
+            queryset = queryset.filter(record_id__in=persons.values('record_id'))
+        
         return queryset
+    
+    def get_person_filter(self):
+        """인물별 탐지 결과 조건 (user, is_deepfake, confidence 인덱스 사용)"""
+        person_filter = {}
+        
+        person = self.request.query_params.get('person', None)
+        if person:
+            if person not in ('deepfake', 'safe'):
+                raise ValidationError({'person': 'deepfake 또는 safe만 가능합니다.'})
+            person_filter['is_deepfake'] = person == 'deepfake'
+        
+        min_confidence = self.request.query_params.get('person_min_confidence', None)
+        if min_confidence:
+            try:
+                person_filter['confidence__gte'] = float(min_confidence)
+            except ValueError:
+                raise ValidationError({'person_min_confidence': '숫자여야 합니다.'})
+        
+        return person_filter
 
 
 class AnalysisRecordDetailView(generics.RetrieveDestroyAPIView):
@@ -219,43 +453,166 @@ class AnalysisRecordDetailView(generics.RetrieveDestroyAPIView):
         instance.delete()
 
 
+class AnalysisArtifactView(APIView):
+    """
+    분석 결과 이미지(히트맵 / 인물별 탐지 이미지) 조회 API
+
+    처음 요청될 때 AI 서버에서 받아 저장하고, 이후에는 저장된 파일로 응답한다.
+    저장된 이미지는 바뀌지 않으므로 오래 캐시하고 ETag(콘텐츠 해시)로 재검증한다.
+    ?size=thumbnail 이면 목록용 썸네일
+    """
+    
+    def get(self, request, pk, artifact):
+        try:
+            record = AnalysisRecord.objects.get(record_id=pk, user=request.user)
+        except AnalysisRecord.DoesNotExist:
+            return Response(
+                {'error': '분석 기록을 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if not AnalysisArtifactService.is_artifact(artifact):
+            return Response(
+                {'error': '알 수 없는 분석 이미지입니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        thumbnail = request.query_params.get('size') == 'thumbnail'
+        try:
+            media_file = AnalysisArtifactService(record).get_file(artifact, thumbnail)
+        except (requests.exceptions.RequestException, ValueError, OSError):
+            return Response(
+                {'error': 'AI 서버에서 분석 이미지를 가져오지 못했습니다.'},
+                status=status.HTTP_502_BAD_GATEWAY
+            )
+        
+        if media_file is None:
+            return Response(
+                {'error': '분석 이미지가 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        content_hash = media_file.metadata.get('content_hash')
+        etag = f'"{content_hash}"' if content_hash else None
+        cache_control = f'private, max-age={settings.ANALYSIS_ARTIFACT_CACHE_MAX_AGE}, immutable'
+        
+        if etag is not None and self._etag_matches(etag, request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        elif media_file.storage_type == 's3':
+            download_url = S3Storage().get_presigned_url(media_file.s3_key)
+            if not download_url:
+                return Response(
+                    {'error': '다운로드 URL 생성에 실패했습니다.'},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            # Presigned URL은 만료되므로 리다이렉트는 캐시하지 않음
+            return HttpResponseRedirect(download_url)
+        else:
+            response = FileResponse(
+                open(os.path.join(settings.MEDIA_ROOT, media_file.file_path), 'rb'),
+                content_type=media_file.mime_type
+            )
+        
+        if etag is not None:
+            response['ETag'] = etag
+        response['Cache-Control'] = cache_control
+        return response
+    
+    @staticmethod
+    def _etag_matches(etag, if_none_match):
+        """If-None-Match 목록에 같은 ETag가 있는지 (약한 비교, W/ 무시)"""
+        etags = parse_etags(if_none_match)
+        return '*' in etags or etag in (candidate.removeprefix('W/') for candidate in etags)
+
+
 class AnalysisStatisticsView(APIView):
     """분석 통계 API"""
     
     def get(self, request):
-        # 사용자의 전체 분석 통계
-        records = AnalysisRecord.objects.filter(user=request.user)
-        
-        stats = records.aggregate(
-            total=Count('record_id'),
-            safe=Count('record_id', filter=Q(analysis_result='safe')),
-            suspicious=Count('record_id', filter=Q(analysis_result='suspicious')),
-            deepfake=Count('record_id', filter=Q(analysis_result='deepfake'))
-        )
+        # ✅ 사용자의 전체 분석 통계 (기록 저장/삭제 시 갱신되는 카운터 1행)
+        stats = UserAnalysisStatistics.for_user(request.user)
         
         # 최근 5개 분석 기록
-        recent = records[:5]
+        recent = AnalysisRecord.objects.filter(user=request.user)[:5]
         
         data = {
-            'total_analyses': stats['total'],
-            'safe_count': stats['safe'],
-            'suspicious_count': stats['suspicious'],
-            'deepfake_count': stats['deepfake'],
-            'recent_analyses': AnalysisRecordListSerializer(recent, many=True).data
+            'total_analyses': stats.total_count,
+            'safe_count': stats.safe_count,
+            'suspicious_count': stats.suspicious_count,
+            'deepfake_count': stats.deepfake_count,
+            'analysis_type_counts': {
+                analysis_type: getattr(stats, field)
+                for analysis_type, field in UserAnalysisStatistics.TYPE_FIELDS.items()
+            },
+            'last_analyzed_at': stats.last_analyzed_at,
+            'recent_analyses': recent
         }
         
-        serializer = AnalysisStatisticsSerializer(data)
+        serializer = AnalysisStatisticsSerializer(data, context={'request': request})
         return Response(serializer.data)
 
 
+class AnalysisTimeSeriesView(APIView):
+    """
+    기간별 분석 통계 API (추이 차트용)
+    
+    일별 집계만 읽으므로 조회 비용은 기록 수가 아니라 기간(일 수)에 비례한다.
+    ?start=YYYY-MM-DD&end=YYYY-MM-DD&interval=day|week|month
+    """
+    
+    def get(self, request):
+        serializer = AnalysisTimeSeriesRequestSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        params = serializer.validated_data
+        return Response({
+            'start': params['start'],
+            'end': params['end'],
+            'interval': params['interval'],
+            'series': AnalysisDailyRollup.series(
+                request.user,
+                params['start'],
+                params['end'],
+                params['interval']
+            )
+        })
+
+
 class AIHealthCheckView(APIView):
     """AI 서버 상태 확인 API"""
     
+    STATUS_BY_STATE = {
+        'closed': 'healthy',
+        'half_open': 'degraded',
+        'open': 'unhealthy',
+    }
+
     def get(self, request):
         ai_service = AIModelService()
-        is_healthy = ai_service.check_health()
-        
+
+        # ✅ 직접 프로브하지 않고 서버별 공유 모니터의 캐시된 상태를 보고
+        backends = ai_service.router.snapshot()
+        statuses = {
+            self.STATUS_BY_STATE[backend['circuit_breaker']['state']]
+            for backend in backends
+        }
+
+        # 모두 정상이면 healthy, 모두 장애면 unhealthy, 그 외(일부 서버 제외 등)는 degraded
+        if len(statuses) == 1:
+            overall = statuses.pop()
+        else:
+            overall = 'degraded'
+
         return Response({
-            'status': 'healthy' if is_healthy else 'unhealthy',
-            'fastapi_url': ai_service.fastapi_url
+            'status': overall,
+            'model_version': ai_service.router.model_version,
+            'backends': backends,  # ✅ 서버별 처리 중 요청 수 / 최근 지연 시간 / 서킷 상태
+            'connection_pool': ai_service.client.get_pool_stats(),  # ✅ 커넥션 재사용 확인용
+            'result_cache': ai_service.cache.stats(),  # ✅ 분석 결과 캐시 적중률
+            'dispatch': ai_service.dispatcher.snapshot(),  # ✅ 우선순위 레인별 대기 / 처리 중 요청 수
+            'latency': ai_service.latency.snapshot()  # ✅ 라우트 / 크기 구간별 지연 시간 + 헤지 통계
         })
\ No newline at end of file
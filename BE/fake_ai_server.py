@@ -0,0 +1,296 @@
+"""
+부하/지연 테스트용 가짜 AI 서버 (FastAPI)
+실행: python fake_ai_server.py --port 8001 --image-latency lognormal:800,0.4 --error-rate 0.01
+     (Django 쪽은 FASTAPI_URL=http://127.0.0.1:8001 로 실행)
+
+GPU·네트워크 없이 한 대에서 Django 계층을 현실적인 AI 응답 시간으로 측정하기 위한 서버.
+- 실제 AI 서버와 같은 경로/응답 형식: /health, /api/analyze/image(s), /api/analyze/video, /api/protect/*
+- 판정은 파일 내용(또는 파일 식별자)의 sha256으로 정해진다 (같은 파일 → 항상 같은 판정)
+- 지연 분포, 오류율, 동시 처리 수(GPU 슬롯), 응답 크기를 옵션으로 조절
+- /stats: 경로별 요청 수, 오류 수, 최대 동시 요청 수
+
+필요 패키지: pip install fastapi uvicorn python-multipart
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+# ============================================
+# 지연 분포
+# ============================================
+class LatencyModel:
+    """
+    지연 시간 분포 (밀리초)
+
+    fixed:500          항상 500ms
+    uniform:200,800    200~800ms 균등
+    normal:500,100     평균 500ms, 표준편차 100ms
+    lognormal:800,0.4  중앙값 800ms, sigma 0.4 (긴 꼬리, 실제 추론 시간과 비슷)
+    """
+
+    KINDS = ('fixed', 'uniform', 'normal', 'lognormal')
+
+    def __init__(self, spec):
+        kind, _, params = spec.partition(':')
+        if kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {spec}")
+
+        self.spec = spec
+        self.kind = kind
+        self.params = [float(p) for p in params.split(',')] if params else [0.0]
+
+    def sample(self, rng):
+        """지연 시간 1회 샘플 (초)"""
+        if self.kind == 'fixed':
+            ms = self.params[0]
+        elif self.kind == 'uniform':
+            ms = rng.uniform(self.params[0], self.params[1])
+        elif self.kind == 'normal':
+            ms = rng.gauss(self.params[0], self.params[1])
+        else:
+            ms = self.params[0] * math.exp(rng.gauss(0, self.params[1]))
+        return max(ms, 0.0) / 1000
+
+
+# ============================================
+# 가짜 AI 서버
+# ============================================
+class FakeAIServer:
+    """실제 AI 서버 응답 형식을 흉내 내는 FastAPI 앱"""
+
+    def __init__(self, options):
+        self.options = options
+        self.latency = {
+            'image': LatencyModel(options.image_latency),
+            'video': LatencyModel(options.video_latency),
+            'protect': LatencyModel(options.protect_latency),
+        }
+        self.rng = random.Random(options.seed)  # 지연·오류 주입용 (판정은 해시로 결정)
+        self.gpu_slots = asyncio.Semaphore(options.concurrency) if options.concurrency else None
+        self.padding = 'x' * options.payload_bytes
+
+        self.requests = Counter()
+        self.errors = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started_at = time.time()
+
+        self.app = FastAPI(title='Fake AI Server')
+        self._add_routes()
+
+    # ------------------------------------------------------------------
+    # 라우트
+    # ------------------------------------------------------------------
+
+    def _add_routes(self):
+        app = self.app
+
+        @app.get('/health')
+        async def health():
+            return {'status': 'ok', 'model_version': self.options.model_version}
+
+        @app.get('/stats')
+        async def stats():
+            return {
+                'uptime_seconds': round(time.time() - self.started_at, 1),
+                'requests': dict(self.requests),
+                'errors': dict(self.errors),
+                'in_flight': self.in_flight,
+                'max_in_flight': self.max_in_flight,
+            }
+
+        @app.post('/api/analyze/image')
+        async def analyze_image(request: Request):
+            files = await self._read_files(request, 'file')
+            return await self._handle('analyze/image', 'image', 1, lambda: self._image_result(files[0]))
+
+        @app.post('/api/analyze/images')
+        async def analyze_images(request: Request):
+            files = await self._read_files(request, 'files')
+            batches = math.ceil(len(files) / self.options.batch_size) or 1
+            return await self._handle('analyze/images', 'image', batches, lambda: {
+                'model_version': self.options.model_version,
+                'results': [self._image_result(f) for f in files],
+            })
+
+        @app.post('/api/analyze/video')
+        async def analyze_video(request: Request):
+            files = await self._read_files(request, 'file')
+            return await self._handle('analyze/video', 'video', 1, lambda: self._video_result(files[0]))
+
+        @app.post('/api/protect/images')
+        async def protect_images(request: Request):
+            body = await request.json()
+            return await self._handle('protect/images', 'protect', len(body.get('files', [])) or 1, lambda: {
+                'model_version': self.options.model_version,
+                'protected_files': [self._protected_file(f) for f in body.get('files', [])],
+            })
+
+        @app.post('/api/protect/video')
+        async def protect_video(request: Request):
+            body = await request.json()
+            return await self._handle('protect/video', 'protect', 1, lambda: dict(
+                self._protected_file(body.get('file', {})),
+                model_version=self.options.model_version
+            ))
+
+    async def _handle(self, route, latency_kind, units, build_result):
+        """지연 / 오류 주입 후 결과 반환 (GPU 슬롯이 있으면 슬롯을 잡은 동안만 처리)"""
+        self.requests[route] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.gpu_slots is not None:
+                async with self.gpu_slots:
+                    await self._sleep(latency_kind, units)
+            else:
+                await self._sleep(latency_kind, units)
+
+            if self.rng.random() < self.options.error_rate:
+                self.errors[route] += 1
+                return JSONResponse(
+                    {'detail': 'injected error'},
+                    status_code=self.options.error_status
+                )
+
+            result = build_result()
+            if self.padding:
+                result['padding'] = self.padding
+            return result
+        finally:
+            self.in_flight -= 1
+
+    async def _sleep(self, latency_kind, units):
+        model = self.latency[latency_kind]
+        await asyncio.sleep(sum(model.sample(self.rng) for _ in range(units)))
+
+    # ------------------------------------------------------------------
+    # 요청 파일 → 콘텐츠 해시
+    # ------------------------------------------------------------------
+
+    async def _read_files(self, request, field_name):
+        """
+        multipart 파일 또는 JSON 파일 식별자를 해시 목록으로 변환
+
+        경로 식별자는 이 서버에서 파일을 읽을 수 있으면 내용으로, 아니면 식별자로 해시한다.
+        """
+        content_type = request.headers.get('content-type', '')
+
+        if content_type.startswith('multipart/'):
+            form = await request.form()
+            return [
+                hashlib.sha256(await upload.read()).hexdigest()
+                for upload in form.getlist(field_name)
+            ]
+
+        body = await request.json()
+        identifiers = body.get('files') if field_name == 'files' else [body.get(field_name)]
+        return [self._hash_identifier(identifier or {}) for identifier in identifiers or []]
+
+    def _hash_identifier(self, identifier):
+        path = identifier.get('path')
+        if path and os.path.isfile(path):
+            hasher = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+
+        key = {k: v for k, v in identifier.items() if k != 'file_id'}
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # 결정적 판정
+    # ------------------------------------------------------------------
+
+    def _verdict_rng(self, content_hash, salt=''):
+        return random.Random(f"{content_hash}:{salt}")
+
+    def _image_result(self, content_hash):
+        rng = self._verdict_rng(content_hash)
+        return {
+            'is_deepfake': rng.random() < self.options.deepfake_rate,
+            'confidence': round(rng.uniform(75.0, 99.9), 2),
+            'heatmap_url': None,
+            'model_version': self.options.model_version,
+        }
+
+    def _video_result(self, content_hash):
+        rng = self._verdict_rng(content_hash)
+        person_count = rng.randint(self.options.min_persons, self.options.max_persons)
+        return {
+            'model_version': self.options.model_version,
+            'detection_details': [
+                {
+                    'person_id': person_id,
+                    'is_deepfake': rng.random() < self.options.deepfake_rate,
+                    'confidence': round(rng.uniform(75.0, 99.9), 2),
+                    'detection_image_url': None,
+                    'heatmap_url': None,
+                }
+                for person_id in range(1, person_count + 1)
+            ],
+        }
+
+    def _protected_file(self, identifier):
+        content_hash = self._hash_identifier(identifier)
+        name = os.path.basename(identifier.get('path') or identifier.get('s3_key') or 'file')
+        stem, ext = os.path.splitext(name)
+        file_name = f"{stem}_protected{ext}"
+        return {
+            'original_file_id': identifier.get('file_id'),
+            's3_url': f"https://fake-ai-bucket.local/protected/{content_hash[:16]}/{file_name}",
+            'file_name': file_name,
+        }
+
+
+# ============================================
+# 실행
+# ============================================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='부하/지연 테스트용 가짜 AI 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--image-latency', default='lognormal:800,0.4', help='이미지 1장 분석 지연 분포')
+    parser.add_argument('--video-latency', default='lognormal:15000,0.5', help='영상 1개 분석 지연 분포')
+    parser.add_argument('--protect-latency', default='lognormal:3000,0.4', help='보호 처리 파일 1개 지연 분포')
+    parser.add_argument('--batch-size', type=int, default=8, help='일괄 분석 시 한 번에 추론하는 이미지 수')
+    parser.add_argument('--concurrency', type=int, default=0, help='동시 처리 수 (GPU 슬롯, 0이면 제한 없음)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 상태 코드')
+    parser.add_argument('--payload-bytes', type=int, default=0, help='응답에 덧붙일 패딩 크기 (bytes)')
+    parser.add_argument('--deepfake-rate', type=float, default=0.25, help='딥페이크 판정 비율 (0~1)')
+    parser.add_argument('--min-persons', type=int, default=1, help='영상 인물 수 최솟값')
+    parser.add_argument('--max-persons', type=int, default=3, help='영상 인물 수 최댓값')
+    parser.add_argument('--model-version', default='fake-v1')
+    parser.add_argument('--seed', type=int, default=None, help='지연·오류 주입 난수 시드')
+    return parser.parse_args(argv)
+
+
+def main():
+    import uvicorn
+
+    options = parse_args()
+    server = FakeAIServer(options)
+    print(
+        f"가짜 AI 서버: http://{options.host}:{options.port} "
+        f"(image={options.image_latency}, video={options.video_latency}, "
+        f"protect={options.protect_latency}, error_rate={options.error_rate})"
+    )
+    uvicorn.run(server.app, host=options.host, port=options.port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+gunicorn 설정 (운영)
+실행: gunicorn -c gunicorn.conf.py
+
+- ASGI(config.asgi) 앱을 uvicorn 워커로 실행
+  ASGI에서는 Django가 요청 본문 전체를 임시 파일로 먼저 받으므로 업로드가 디스크에 두 번 기록된다.
+  큰 영상 / 보호 업로드는 분할 업로드 API(/api/files/uploads/)를 쓰거나,
+  GUNICORN_APP=config.wsgi:application GUNICORN_WORKER_CLASS=gthread로 WSGI 실행
+- Prometheus 지표를 워커 프로세스 간에 합치도록 PROMETHEUS_MULTIPROC_DIR 설정
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+
+# ============================================
+# 서버
+# ============================================
+wsgi_app = os.getenv('GUNICORN_APP', 'config.asgi:application')
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', str(multiprocessing.cpu_count() * 2 + 1)))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'uvicorn.workers.UvicornWorker')
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '660'))  # 보호 처리 AI 타임아웃 상한(PROTECTION_REQUEST_TIMEOUT)보다 길게
+graceful_timeout = 30
+keepalive = 5
+
+
+# ============================================
+# Prometheus 멀티프로세스 지표
+# ============================================
+# 워커가 앱을 불러오기 전에 정해져야 하므로 설정 파일(마스터 프로세스)에서 지정
+os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR',
+    os.path.join(tempfile.gettempdir(), 'imreal_prometheus')
+)
+
+
+def on_starting(server):
+    """이전 실행의 지표 파일 정리"""
+    directory = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 livesum 게이지 파일 정리"""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    """워커 시작 시 영상 분석 큐 생성 (이전 워커가 남긴 작업 정리를 바로 시작)"""
+    from detection.jobs import get_video_analysis_queue
+    get_video_analysis_queue()
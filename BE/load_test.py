@@ -0,0 +1,409 @@
+"""
+딥페이크 감지 앱 - 부하 테스트 스크립트 (동시 가상 사용자)
+실행: python load_test.py --users 50 --duration 120 --output results.json
+     python load_test.py --users 50 --duration 120 --baseline results.json --max-regression 20
+
+test_api.py가 엔드포인트를 하나씩 순서대로 호출해 기능을 확인한다면,
+이 스크립트는 여러 가상 사용자가 동시에 실제 사용 흐름을 반복하며 처리량과 꼬리 지연을 측정한다.
+
+- 흐름: 회원가입/로그인 → 이미지 분석, 영상 분석(작업 완료까지 폴링), Zoom 세션 캡처 반복,
+        이미지 보호, 신고 접수, 목록/통계 조회 (--mix 로 비율 조절)
+- 결과: 엔드포인트별 p50/p95/p99 지연, RPS, 오류율, 상태 코드 분포
+- --output: 결과 JSON 저장, --baseline: 이전 결과와 p95 비교 (기준 초과 시 종료 코드 1)
+
+AI 서버 대신 fake_ai_server.py를 띄워 두고 실행하면 GPU 없이 한 대에서 측정할 수 있다.
+    python fake_ai_server.py --port 8001
+    FASTAPI_URL=http://127.0.0.1:8001 uvicorn config.asgi:application --port 8000
+    python load_test.py --ai-url http://127.0.0.1:8001
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime
+
+import httpx
+from PIL import Image
+
+
+# ============================================
+# 설정
+# ============================================
+DEFAULT_MIX = 'image=5,video=1,zoom=2,protection=1,report=1,browse=3'
+TEST_PASSWORD = "loadtest123!"
+VIDEO_HEADER = b'\x00\x00\x00\x18ftypmp42\x00\x00\x00\x00mp42isom'
+
+
+# ============================================
+# 측정
+# ============================================
+def percentile(sorted_values, p):
+    """정렬된 값의 p 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return None
+    k = (len(sorted_values) - 1) * p / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+class Metrics:
+    """엔드포인트별 지연 시간 / 상태 코드 수집"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = Counter()
+
+    def record(self, name, seconds, status, ok):
+        self.latencies[name].append(seconds)
+        self.statuses[name][str(status)] += 1
+        if not ok:
+            self.errors[name] += 1
+
+    def summary(self, duration):
+        endpoints = {}
+        for name in sorted(self.latencies):
+            values = sorted(self.latencies[name])
+            count = len(values)
+            endpoints[name] = {
+                'count': count,
+                'rps': round(count / duration, 2),
+                'error_rate': round(self.errors[name] / count, 4),
+                'p50_ms': round(percentile(values, 50) * 1000, 1),
+                'p95_ms': round(percentile(values, 95) * 1000, 1),
+                'p99_ms': round(percentile(values, 99) * 1000, 1),
+                'max_ms': round(values[-1] * 1000, 1),
+                'statuses': dict(self.statuses[name]),
+            }
+
+        total = sum(e['count'] for e in endpoints.values())
+        errors = sum(self.errors.values())
+        return {
+            'total_requests': total,
+            'rps': round(total / duration, 2),
+            'error_rate': round(errors / total, 4) if total else 0.0,
+            'endpoints': endpoints,
+        }
+
+
+# ============================================
+# 가상 사용자
+# ============================================
+class VirtualUser:
+    """회원가입 후 --mix 비율대로 사용 흐름을 반복하는 가상 사용자"""
+
+    def __init__(self, index, client, metrics, options, run_id):
+        self.index = index
+        self.client = client
+        self.metrics = metrics
+        self.options = options
+        self.email = f"load_{run_id}_{index}@test.com"
+        self.headers = {}
+        self.record_ids = []
+        self.rng = random.Random(f"{run_id}:{index}")
+
+        flows, weights = zip(*options.mix.items())
+        self.flows = [getattr(self, f"flow_{flow}") for flow in flows]
+        self.weights = weights
+
+    async def request(self, name, method, path, expected=(200, 201), **kwargs):
+        """요청 1회 실행 + 측정 (실패하면 None 반환)"""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, headers=self.headers, **kwargs)
+        except httpx.HTTPError as e:
+            self.metrics.record(name, time.perf_counter() - start, type(e).__name__, False)
+            return None
+
+        ok = response.status_code in expected
+        self.metrics.record(name, time.perf_counter() - start, response.status_code, ok)
+        return response if ok else None
+
+    async def run(self, deadline):
+        if not await self.sign_up():
+            return
+
+        while time.monotonic() < deadline:
+            flow = self.rng.choices(self.flows, weights=self.weights)[0]
+            await flow()
+            if self.options.think_time:
+                await asyncio.sleep(self.rng.uniform(0, 2 * self.options.think_time))
+
+    # ------------------------------------------------------------------
+    # 흐름
+    # ------------------------------------------------------------------
+
+    async def sign_up(self):
+        response = await self.request('POST /api/users/register/', 'POST', '/api/users/register/', json={
+            'email': self.email,
+            'nickname': f"load{self.index}",
+            'password': TEST_PASSWORD,
+            'password_confirm': TEST_PASSWORD,
+        })
+        if response is None:
+            return False
+
+        response = await self.request('POST /api/users/login/', 'POST', '/api/users/login/', expected=(200,), json={
+            'email': self.email,
+            'password': TEST_PASSWORD,
+        })
+        if response is None:
+            return False
+
+        self.headers = {'Authorization': f"Token {response.json()['token']}"}
+        return True
+
+    async def flow_image(self):
+        response = await self.request('POST /api/detection/image/', 'POST', '/api/detection/image/', files={
+            'image': ('image.png', self.make_image(), 'image/png'),
+        })
+        if response is not None:
+            self.record_ids.append(response.json()['record_id'])
+
+    async def flow_video(self):
+        video = VIDEO_HEADER + self.rng.randbytes(self.options.video_bytes)
+        response = await self.request('POST /api/detection/video/', 'POST', '/api/detection/video/', expected=(202,), files={
+            'video': ('video.mp4', video, 'video/mp4'),
+        })
+        if response is None:
+            return
+
+        # 작업 완료까지 폴링 (업로드부터 완료까지 전체 시간도 따로 기록)
+        job_id = response.json()['job_id']
+        start = time.perf_counter()
+        deadline = time.monotonic() + self.options.job_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.options.poll_interval)
+            job = await self.request(
+                'GET /api/detection/video/jobs/{id}/', 'GET', f"/api/detection/video/jobs/{job_id}/",
+                expected=(200,)
+            )
+            if job is None:
+                return
+
+            job_status = job.json()['job_status']
+            if job_status in ('completed', 'failed'):
+                self.metrics.record(
+                    'video job (queued → done)',
+                    time.perf_counter() - start,
+                    job_status,
+                    job_status == 'completed'
+                )
+                return
+
+        self.metrics.record('video job (queued → done)', time.perf_counter() - start, 'timeout', False)
+
+    async def flow_zoom(self):
+        response = await self.request('POST /api/zoom/sessions/start/', 'POST', '/api/zoom/sessions/start/', json={
+            'session_name': f"부하 테스트 {self.index}",
+        })
+        if response is None:
+            return
+        session_id = response.json()['session_id']
+
+        # 화면이 거의 바뀌지 않는 회의처럼 같은 프레임을 섞어서 캡처
+        frame = self.make_image()
+        for _ in range(self.options.zoom_captures):
+            if self.rng.random() < 0.3:
+                frame = self.make_image()
+            await self.request(
+                'POST /api/zoom/sessions/{id}/capture/', 'POST', f"/api/zoom/sessions/{session_id}/capture/",
+                files={'screenshot': ('capture.png', frame, 'image/png')},
+                data={'participant_count': str(self.rng.randint(2, 6))}
+            )
+            await asyncio.sleep(self.options.zoom_interval)
+
+        await self.request('POST /api/zoom/sessions/{id}/end/', 'POST', f"/api/zoom/sessions/{session_id}/end/", expected=(200,))
+        await self.request('GET /api/zoom/sessions/{id}/report/', 'GET', f"/api/zoom/sessions/{session_id}/report/", expected=(200,))
+
+    async def flow_protection(self):
+        await self.request('POST /api/protection/images/', 'POST', '/api/protection/images/', files=[
+            ('files', ('image.png', self.make_image(), 'image/png')),
+        ], data={'job_type': 'both'})
+
+    async def flow_report(self):
+        if not self.record_ids:
+            await self.flow_image()
+            if not self.record_ids:
+                return
+
+        await self.request('POST /api/reports/submit/', 'POST', '/api/reports/submit/', json={
+            'record_id': self.rng.choice(self.record_ids),
+            'report_type': 'deepfake_image',
+            'discovery_source': 'sns',
+            'damage_level': 'personal',
+            'description': '부하 테스트 신고입니다.',
+            'report_agency': 'kisa',
+        })
+
+    async def flow_browse(self):
+        await self.request('GET /api/detection/records/', 'GET', '/api/detection/records/', expected=(200,))
+        await self.request('GET /api/detection/statistics/', 'GET', '/api/detection/statistics/', expected=(200,))
+        await self.request('GET /api/reports/', 'GET', '/api/reports/', expected=(200,))
+
+    def make_image(self):
+        """분석 요청용 PNG (무늬를 바꿔 매번 다른 콘텐츠 해시)"""
+        size = self.options.image_size
+        image = Image.new('RGB', (size, size), tuple(self.rng.randrange(256) for _ in range(3)))
+        for _ in range(8):
+            x, y = self.rng.randrange(size), self.rng.randrange(size)
+            image.paste(
+                tuple(self.rng.randrange(256) for _ in range(3)),
+                (x, y, min(x + size // 4, size), min(y + size // 4, size))
+            )
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG')
+        return buffer.getvalue()
+
+
+# ============================================
+# 실행
+# ============================================
+async def run_load(options):
+    metrics = Metrics()
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=options.users * 2, max_keepalive_connections=options.users)
+
+    async with httpx.AsyncClient(base_url=options.base_url, timeout=options.timeout, limits=limits) as client:
+        ai_stats_before = await fetch_ai_stats(options.ai_url)
+
+        start = time.monotonic()
+        deadline = start + options.ramp_up + options.duration
+
+        async def start_user(index):
+            # 램프업: 사용자를 고르게 나눠 시작
+            await asyncio.sleep(options.ramp_up * index / options.users)
+            await VirtualUser(index, client, metrics, options, run_id).run(deadline)
+
+        await asyncio.gather(*(start_user(i) for i in range(options.users)))
+        elapsed = time.monotonic() - start
+
+        ai_stats_after = await fetch_ai_stats(options.ai_url)
+
+    results = metrics.summary(elapsed)
+    results['config'] = {
+        'base_url': options.base_url,
+        'users': options.users,
+        'duration': options.duration,
+        'ramp_up': options.ramp_up,
+        'mix': options.mix,
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'elapsed_seconds': round(elapsed, 1),
+    }
+    if ai_stats_after is not None:
+        results['ai_server'] = {'before': ai_stats_before, 'after': ai_stats_after}
+    return results
+
+
+async def fetch_ai_stats(ai_url):
+    """fake_ai_server.py의 /stats (지정하지 않았거나 응답이 없으면 None)"""
+    if not ai_url:
+        return None
+    try:
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.get(f"{ai_url}/stats")
+            return response.json() if response.status_code == 200 else None
+    except httpx.HTTPError:
+        return None
+
+
+def compare_with_baseline(results, baseline, max_regression):
+    """
+    기준 결과와 엔드포인트별 p95 / 오류율 비교
+
+    Returns:
+        list: 기준을 넘은 항목 설명
+    """
+    regressions = []
+    for name, current in results['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+
+        change = (current['p95_ms'] - previous['p95_ms']) / previous['p95_ms'] * 100 if previous['p95_ms'] else 0.0
+        print(f"  {name:<45} p95 {previous['p95_ms']:>9.1f} → {current['p95_ms']:>9.1f} ms ({change:+.1f}%)")
+        if change > max_regression:
+            regressions.append(f"{name}: p95 {change:+.1f}%")
+        if current['error_rate'] > previous['error_rate'] + 0.01:
+            regressions.append(f"{name}: 오류율 {previous['error_rate']:.2%} → {current['error_rate']:.2%}")
+    return regressions
+
+
+def print_results(results):
+    print()
+    print(f"{'엔드포인트':<45} {'요청':>7} {'RPS':>8} {'오류율':>7} {'p50':>9} {'p95':>9} {'p99':>9}")
+    print('-' * 100)
+    for name, e in results['endpoints'].items():
+        print(
+            f"{name:<45} {e['count']:>7} {e['rps']:>8.2f} {e['error_rate']:>7.2%} "
+            f"{e['p50_ms']:>9.1f} {e['p95_ms']:>9.1f} {e['p99_ms']:>9.1f}"
+        )
+    print('-' * 100)
+    print(f"전체 {results['total_requests']}건, {results['rps']} RPS, 오류율 {results['error_rate']:.2%}")
+
+
+def parse_mix(value):
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        if name not in ('image', 'video', 'zoom', 'protection', 'report', 'browse'):
+            raise argparse.ArgumentTypeError(f"알 수 없는 흐름입니다: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='딥페이크 감지 앱 부하 테스트')
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--users', type=int, default=20, help='동시 가상 사용자 수')
+    parser.add_argument('--duration', type=float, default=60, help='측정 시간 (초, 램프업 제외)')
+    parser.add_argument('--ramp-up', type=float, default=10, help='사용자를 모두 시작하는 데 걸리는 시간 (초)')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"흐름 비율 (기본 {DEFAULT_MIX})")
+    parser.add_argument('--think-time', type=float, default=0.5, help='흐름 사이 평균 대기 시간 (초)')
+    parser.add_argument('--timeout', type=float, default=330, help='요청 타임아웃 (초)')
+    parser.add_argument('--image-size', type=int, default=256, help='분석 이미지 한 변 크기 (px)')
+    parser.add_argument('--video-bytes', type=int, default=256 * 1024, help='분석 영상 크기 (bytes)')
+    parser.add_argument('--zoom-captures', type=int, default=5, help='Zoom 세션당 캡처 수')
+    parser.add_argument('--zoom-interval', type=float, default=1.0, help='Zoom 캡처 간격 (초)')
+    parser.add_argument('--poll-interval', type=float, default=1.0, help='영상 작업 폴링 간격 (초)')
+    parser.add_argument('--job-timeout', type=float, default=300, help='영상 작업 완료 대기 한도 (초)')
+    parser.add_argument('--ai-url', default=None, help='fake_ai_server.py 주소 (/stats 수집)')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--max-regression', type=float, default=20, help='허용 p95 증가율 (%%)')
+    return parser.parse_args(argv)
+
+
+def main():
+    options = parse_args()
+
+    print(f"부하 테스트: {options.base_url} (사용자 {options.users}명, {options.duration}초, 램프업 {options.ramp_up}초)")
+    results = asyncio.run(run_load(options))
+    print_results(results)
+
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {options.output}")
+
+    if options.baseline:
+        with open(options.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n기준 결과와 비교: {options.baseline}")
+        regressions = compare_with_baseline(results, baseline, options.max_regression)
+        if regressions:
+            print("\n기준을 넘은 항목:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
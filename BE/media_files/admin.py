@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import MediaFile, SystemLog
+from .models import MediaFile, UploadSession, SystemLog
 
 
 @admin.register(MediaFile)
@@ -38,6 +38,26 @@ class MediaFileAdmin(admin.ModelAdmin):
     file_size_display.short_description = '파일 크기'
 
 
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    """분할 업로드 세션 관리자"""
+    
+    list_display = [
+        'upload_id',
+        'user',
+        'original_name',
+        'purpose',
+        'total_parts',
+        'upload_status',
+        'expires_at',
+        'created_at'
+    ]
+    list_filter = ['purpose', 'upload_status', 'created_at']
+    search_fields = ['original_name', 'user__email']
+    readonly_fields = ['upload_id', 'created_at', 'updated_at']
+    ordering = ['-created_at']
+
+
 @admin.register(SystemLog)
 class SystemLogAdmin(admin.ModelAdmin):
     """시스템 로그 관리자"""
@@ -0,0 +1,148 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+from config.metrics import SYSTEM_LOG_DROPPED
+from .models import SystemLog
+
+logger = logging.getLogger(__name__)
+
+
+class SystemLogBuffer:
+    """
+    SystemLog 버퍼 (프로세스 내, 백그라운드 스레드에서 bulk_create)
+
+    요청 처리 중에는 메모리에 쌓기만 하고 DB에 쓰지 않는다.
+    - batch_size개가 쌓이거나 flush_interval초가 지나면 백그라운드 스레드가 한 번에 저장
+    - max_entries를 넘으면 새 항목을 버린다 (로그 때문에 요청이 느려지거나 실패하지 않도록)
+    - 프로세스 종료 시(atexit) 남은 항목 저장
+
+    created_at은 저장 시각으로 기록되므로 실제 발생 시각과 최대 flush_interval초 차이가 날 수 있다.
+    """
+
+    def __init__(self, max_entries=None, batch_size=None, flush_interval=None):
+        self.max_entries = max_entries or settings.SYSTEM_LOG_BUFFER_SIZE
+        self.batch_size = batch_size or settings.SYSTEM_LOG_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.SYSTEM_LOG_FLUSH_INTERVAL
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._entries = []
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self.pid = os.getpid()
+
+        self.written = 0
+        self.dropped = 0
+
+    def add(self, **fields):
+        """
+        로그 1건 추가 (SystemLog.objects.create와 같은 인자)
+
+        Returns:
+            bool: 버퍼에 들어갔는지 여부 (가득 차서 버렸으면 False)
+        """
+        entry = SystemLog(**fields)
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self.dropped += 1
+                SYSTEM_LOG_DROPPED.inc()
+                return False
+
+            self._entries.append(entry)
+            pending = len(self._entries)
+            self._ensure_thread()
+
+        if pending >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def flush(self):
+        """버퍼에 쌓인 로그 저장 (저장 실패한 묶음은 버림)"""
+        with self._flush_lock:
+            with self._lock:
+                entries, self._entries = self._entries, []
+
+            if not entries:
+                return 0
+
+            try:
+                SystemLog.objects.bulk_create(entries, batch_size=self.batch_size)
+            except Exception:
+                logger.exception(f"SystemLog 저장 실패: {len(entries)}건 버림")
+                with self._lock:
+                    self.dropped += len(entries)
+                SYSTEM_LOG_DROPPED.inc(len(entries))
+                return 0
+
+            with self._lock:
+                self.written += len(entries)
+            return len(entries)
+
+    def shutdown(self):
+        """백그라운드 스레드 종료 후 남은 로그 저장"""
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        self._wakeup.set()
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def _ensure_thread(self):
+        # self._lock 안에서 호출
+        if self._thread is None and not self._stopped:
+            self._thread = threading.Thread(
+                target=self._run,
+                name='system-log-flusher',
+                daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+
+            if self._entries:
+                close_old_connections()
+                try:
+                    self.flush()
+                finally:
+                    # 요청 사이클 밖의 스레드이므로 DB 연결은 직접 정리
+                    connection.close()
+
+            if self._stopped:
+                return
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_system_log_buffer():
+    """프로세스 전역 SystemLog 버퍼 반환 (fork된 자식 프로세스에서는 새로 생성)"""
+    global _buffer
+
+    if _buffer is None or _buffer.pid != os.getpid():
+        with _buffer_lock:
+            if _buffer is None or _buffer.pid != os.getpid():
+                _buffer = SystemLogBuffer()
+                atexit.register(_buffer.shutdown)
+    return _buffer
+
+
+def write_system_log(**fields):
+    """
+    SystemLog 기록 (SystemLog.objects.create 대신 사용)
+
+    DB에 쓰지 않고 버퍼에 넣기만 하므로 async 코드에서도 그대로 호출할 수 있다.
+    """
+    get_system_log_buffer().add(**fields)
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from media_files.upload_sessions import UploadSessionService
+
+
+class Command(BaseCommand):
+    """
+    만료된 분할 업로드 세션 정리 (cron 등으로 주기 실행)
+
+    예) python manage.py cleanup_upload_sessions
+    """
+
+    help = '만료된 분할 업로드 세션과 조립 중이던 파일 정리'
+
+    def handle(self, *args, **options):
+        count = UploadSessionService.cleanup_expired()
+        self.stdout.write(f"만료된 업로드 세션 {count}개를 정리했습니다.")
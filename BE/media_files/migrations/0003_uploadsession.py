@@ -0,0 +1,117 @@
+# Generated by Django 5.1 on 2026-10-17 00:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media_files", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                ("upload_id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "original_name",
+                    models.CharField(max_length=255, verbose_name="원본 파일명"),
+                ),
+                (
+                    "file_size",
+                    models.BigIntegerField(verbose_name="전체 파일 크기(bytes)"),
+                ),
+                (
+                    "file_type",
+                    models.CharField(
+                        choices=[
+                            ("image", "이미지"),
+                            ("video", "영상"),
+                            ("screenshot", "스크린샷"),
+                            ("document", "문서"),
+                        ],
+                        default="video",
+                        max_length=20,
+                        verbose_name="파일 유형",
+                    ),
+                ),
+                (
+                    "purpose",
+                    models.CharField(
+                        choices=[
+                            ("detection", "딥페이크 분석"),
+                            ("protection", "콘텐츠 보호"),
+                        ],
+                        max_length=20,
+                        verbose_name="사용 목적",
+                    ),
+                ),
+                ("chunk_size", models.IntegerField(verbose_name="조각 크기(bytes)")),
+                ("total_parts", models.IntegerField(verbose_name="전체 조각 수")),
+                (
+                    "received_parts",
+                    models.JSONField(default=list, verbose_name="받은 조각 번호"),
+                ),
+                ("temp_path", models.TextField(verbose_name="조립 중인 파일 경로")),
+                (
+                    "upload_status",
+                    models.CharField(
+                        choices=[
+                            ("uploading", "업로드 중"),
+                            ("assembling", "조립 중"),
+                            ("completed", "완료"),
+                            ("failed", "실패"),
+                            ("expired", "만료"),
+                        ],
+                        default="uploading",
+                        max_length=20,
+                        verbose_name="업로드 상태",
+                    ),
+                ),
+                (
+                    "media_file_id",
+                    models.BigIntegerField(
+                        blank=True, null=True, verbose_name="완료된 미디어 파일 ID"
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(verbose_name="만료일시")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "분할 업로드 세션",
+                "verbose_name_plural": "분할 업로드 세션 목록",
+                "db_table": "upload_sessions",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-created_at"],
+                        name="upload_sess_user_id_c6fa7e_idx",
+                    ),
+                    models.Index(
+                        fields=["upload_status", "expires_at"],
+                        name="upload_sess_upload__948757_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 class MediaFile(models.Model):
     """미디어 파일 관리"""
@@ -124,6 +125,100 @@ class MediaFile(models.Model):
     def __str__(self):
         return f"{self.original_name} ({self.get_purpose_display()})"
 
+class UploadSession(models.Model):
+    """분할(재개 가능) 업로드 세션"""
+    
+    PURPOSE_CHOICES = [
+        ('detection', '딥페이크 분석'),
+        ('protection', '콘텐츠 보호'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('uploading', '업로드 중'),
+        ('assembling', '조립 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+        ('expired', '만료'),
+    ]
+    
+    upload_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions',
+        verbose_name='사용자'
+    )
+    
+    # 파일 정보
+    original_name = models.CharField(max_length=255, verbose_name='원본 파일명')
+    file_size = models.BigIntegerField(verbose_name='전체 파일 크기(bytes)')
+    file_type = models.CharField(
+        max_length=20,
+        choices=MediaFile.FILE_TYPE_CHOICES,
+        default='video',
+        verbose_name='파일 유형'
+    )
+    purpose = models.CharField(
+        max_length=20,
+        choices=PURPOSE_CHOICES,
+        verbose_name='사용 목적'
+    )
+    
+    # 분할 정보
+    chunk_size = models.IntegerField(verbose_name='조각 크기(bytes)')
+    total_parts = models.IntegerField(verbose_name='전체 조각 수')
+    received_parts = models.JSONField(
+        default=list,
+        verbose_name='받은 조각 번호'
+    )
+    temp_path = models.TextField(verbose_name='조립 중인 파일 경로')
+    
+    upload_status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='uploading',
+        verbose_name='업로드 상태'
+    )
+    media_file_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='완료된 미디어 파일 ID'
+    )
+    
+    # 타임스탬프
+    expires_at = models.DateTimeField(verbose_name='만료일시')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+    
+    class Meta:
+        db_table = 'upload_sessions'
+        verbose_name = '분할 업로드 세션'
+        verbose_name_plural = '분할 업로드 세션 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['upload_status', 'expires_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.original_name} ({self.get_upload_status_display()})"
+    
+    @property
+    def received_bytes(self):
+        """받은 조각의 전체 바이트 수"""
+        return sum(self.get_part_size(n) for n in self.received_parts)
+    
+    @property
+    def is_expired(self):
+        return self.expires_at <= timezone.now()
+    
+    def get_part_size(self, part_number):
+        """조각 크기 (마지막 조각만 짧을 수 있음)"""
+        if part_number < self.total_parts:
+            return self.chunk_size
+        return self.file_size - self.chunk_size * (self.total_parts - 1)
+
+
 class SystemLog(models.Model):
     """시스템 로그"""
     
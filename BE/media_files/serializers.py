@@ -0,0 +1,48 @@
+from django.conf import settings
+from rest_framework import serializers
+from .models import UploadSession
+
+
+class UploadSessionStartSerializer(serializers.Serializer):
+    """분할 업로드 시작 요청 Serializer"""
+    
+    file_name = serializers.CharField(max_length=255)
+    file_size = serializers.IntegerField(min_value=1, max_value=settings.VIDEO_MAX_SIZE)
+    purpose = serializers.ChoiceField(choices=UploadSession.PURPOSE_CHOICES)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """분할 업로드 세션 Serializer"""
+    
+    upload_status_display = serializers.CharField(
+        source='get_upload_status_display',
+        read_only=True
+    )
+    received_bytes = serializers.IntegerField(read_only=True)
+    missing_parts = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = UploadSession
+        fields = [
+            'upload_id',
+            'original_name',
+            'file_size',
+            'file_type',
+            'purpose',
+            'chunk_size',
+            'total_parts',
+            'received_parts',
+            'received_bytes',
+            'missing_parts',
+            'upload_status',
+            'upload_status_display',
+            'media_file_id',
+            'expires_at',
+            'created_at'
+        ]
+        read_only_fields = fields
+    
+    def get_missing_parts(self, obj):
+        """아직 받지 못한 조각 번호 (재개할 때 이 조각만 보내면 됨)"""
+        received = set(obj.received_parts)
+        return [n for n in range(1, obj.total_parts + 1) if n not in received]
@@ -1,11 +1,15 @@
 import os
 import uuid
+import hashlib
 import mimetypes
 from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
 from django.utils import timezone
-from .models import MediaFile, SystemLog
+from .models import MediaFile
+from .log_buffer import write_system_log
 from .storage import S3Storage
+from config.metrics import record_upload
+from config.timing import timed
 
 
 
@@ -54,6 +58,115 @@ class FileService:
             MediaFile: 저장된 미디어 파일 객체
         """
         
+        # 1~4. 검증, 파일 저장, MIME 타입 결정
+        media_file = self._store_file(
+            uploaded_file,
+            file_type,
+            purpose,
+            is_temporary,
+            metadata,
+            use_s3
+        )
+        
+        # 5. DB 저장
+        media_file.save()
+        
+        # 6. 로그 기록
+        write_system_log(
+            user=self.user,
+            log_level='info',
+            log_category='system',
+            message=f'파일 업로드 성공: {uploaded_file.name}',
+            request_data={
+                'file_type': file_type,
+                'purpose': purpose,
+                'file_size': uploaded_file.size
+            }
+        )
+        
+        return media_file
+    
+    def upload_files(
+        self,
+        uploaded_files: list,
+        file_type: str,
+        purpose: str,
+        is_temporary: bool = False,
+        metadata: dict = None,
+        use_s3: bool = False
+    ) -> tuple:
+        """
+        여러 파일을 한 번에 업로드 (DB는 bulk insert 1회 + 로그 1건)
+        
+        Args:
+            uploaded_files: 업로드된 파일 객체 리스트
+            나머지는 upload_file과 동일
+        
+        Returns:
+            tuple: (media_files, errors)
+                media_files: 입력 순서대로 MediaFile (실패한 항목은 None)
+                errors: {입력 인덱스: 오류 메시지}
+        """
+        
+        media_files = [None] * len(uploaded_files)
+        errors = {}
+        
+        for index, uploaded_file in enumerate(uploaded_files):
+            try:
+                media_files[index] = self._store_file(
+                    uploaded_file,
+                    file_type,
+                    purpose,
+                    is_temporary,
+                    metadata,
+                    use_s3
+                )
+            except ValueError as e:
+                errors[index] = str(e)
+        
+        stored = [mf for mf in media_files if mf is not None]
+        if stored:
+            MediaFile.objects.bulk_create(stored)
+            
+            # MySQL은 bulk_create 후 PK를 채워주지 않으므로 저장된 파일명으로 다시 조회
+            if stored[0].pk is None:
+                file_ids = dict(
+                    MediaFile.objects.filter(
+                        user=self.user,
+                        file_name__in=[mf.file_name for mf in stored]
+                    ).values_list('file_name', 'file_id')
+                )
+                for mf in stored:
+                    mf.file_id = file_ids[mf.file_name]
+            
+            write_system_log(
+                user=self.user,
+                log_level='info',
+                log_category='system',
+                message=f'파일 일괄 업로드 성공: {len(stored)}개',
+                request_data={
+                    'file_type': file_type,
+                    'purpose': purpose,
+                    'file_count': len(stored),
+                    'total_size': sum(mf.file_size for mf in stored),
+                    'failed_count': len(errors)
+                }
+            )
+        
+        return media_files, errors
+    
+    @timed('storage')
+    def _store_file(
+        self,
+        uploaded_file: UploadedFile,
+        file_type: str,
+        purpose: str,
+        is_temporary: bool,
+        metadata: dict,
+        use_s3: bool
+    ) -> MediaFile:
+        """파일 검증 후 저장소에 저장하고 아직 DB에 저장하지 않은 MediaFile 반환"""
+        
         # 1. 파일 검증
         self._validate_file(uploaded_file, file_type)
         
@@ -61,8 +174,11 @@ class FileService:
         extension = self._get_file_extension(uploaded_file.name)
         unique_filename = self._generate_unique_filename(extension)
         
-        # 3. 파일 저장
+        # 3. 파일 저장 (✅ 저장하면서 콘텐츠 해시 계산)
+        hasher = hashlib.sha256()
+        stored_path = getattr(uploaded_file, 'stored_path', None)
         if use_s3:
+            self._hash_file(uploaded_file, hasher)
             file_path, s3_key = self._save_to_s3(
                 uploaded_file,
                 unique_filename,
@@ -70,23 +186,34 @@ class FileService:
             )
             storage_type = 's3'
             s3_bucket = settings.AWS_STORAGE_BUCKET_NAME
+        elif stored_path and stored_path.startswith(os.path.join(purpose, '')):
+            # ✅ 업로드 핸들러가 이미 최종 위치에 기록한 파일은 다시 복사하지 않음
+            file_path = stored_path
+            unique_filename = os.path.basename(stored_path)
+            hasher = None
+            s3_key = None
+            s3_bucket = None
+            storage_type = 'local'
+            uploaded_file.is_adopted = True
         else:
             file_path = self._save_to_local(
                 uploaded_file,
                 unique_filename,
-                purpose
+                purpose,
+                hasher=hasher
             )
             s3_key = None
             s3_bucket = None
             storage_type = 'local'
         
+        record_upload(purpose, file_type, uploaded_file.size)
+        
         # 4. MIME 타입 결정
         mime_type, _ = mimetypes.guess_type(uploaded_file.name)
         if not mime_type:
             mime_type = uploaded_file.content_type or 'application/octet-stream'
         
-        # 5. DB 저장
-        media_file = MediaFile.objects.create(
+        return MediaFile(
             user=self.user,
             original_name=uploaded_file.name,
             file_name=unique_filename,
@@ -100,23 +227,11 @@ class FileService:
             s3_bucket=s3_bucket,
             purpose=purpose,
             is_temporary=is_temporary,
-            metadata=metadata or {}
-        )
-        
-        # 6. 로그 기록
-        SystemLog.objects.create(
-            user=self.user,
-            log_level='info',
-            log_category='system',
-            message=f'파일 업로드 성공: {uploaded_file.name}',
-            request_data={
-                'file_type': file_type,
-                'purpose': purpose,
-                'file_size': uploaded_file.size
+            metadata={
+                **(metadata or {}),
+                'content_hash': hasher.hexdigest() if hasher else uploaded_file.content_hash
             }
         )
-        
-        return media_file
     
     def _validate_file(self, uploaded_file: UploadedFile, file_type: str):
         """파일 유효성 검사"""
@@ -139,6 +254,17 @@ class FileService:
             raise ValueError(
                 f"파일 크기는 {max_size_mb}MB 이하여야 합니다."
             )
+        
+        # 업로드 핸들러의 파일 시그니처 검사 결과
+        validation_error = getattr(uploaded_file, 'validation_error', None)
+        if validation_error:
+            raise ValueError(validation_error)
+    
+    def _hash_file(self, uploaded_file: UploadedFile, hasher):
+        """업로드 파일 해시 계산 (S3 업로드 전, 파일 포인터는 다시 처음으로)"""
+        for chunk in uploaded_file.chunks():
+            hasher.update(chunk)
+        uploaded_file.seek(0)
     
     def _get_file_extension(self, filename: str) -> str:
         """파일 확장자 추출"""
@@ -154,31 +280,33 @@ class FileService:
         self,
         uploaded_file: UploadedFile,
         filename: str,
-        purpose: str
+        purpose: str,
+        hasher=None
     ) -> str:
-        """로컬 파일 시스템에 저장"""
+        """로컬 파일 시스템에 저장 (hasher가 있으면 쓰는 동안 해시 갱신)"""
         
         # 디렉토리 경로 생성
-        purpose_dir = os.path.join(
-            settings.MEDIA_ROOT,
-            purpose,
-            f"user_{self.user.user_id}"
-        )
-        os.makedirs(purpose_dir, exist_ok=True)
+        relative_path = self._get_local_path(purpose, filename)
+        file_full_path = os.path.join(settings.MEDIA_ROOT, relative_path)
+        os.makedirs(os.path.dirname(file_full_path), exist_ok=True)
         
         # 파일 저장
-        file_full_path = os.path.join(purpose_dir, filename)
         with open(file_full_path, 'wb+') as destination:
             for chunk in uploaded_file.chunks():
                 destination.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
         
         # 상대 경로 반환
-        relative_path = os.path.join(
+        return relative_path
+    
+    def _get_local_path(self, purpose: str, filename: str) -> str:
+        """로컬 저장 상대 경로 (MEDIA_ROOT 기준: purpose/user_<id>/filename)"""
+        return os.path.join(
             purpose,
             f"user_{self.user.user_id}",
             filename
         )
-        return relative_path
     
     def _save_to_s3(
         self,
@@ -240,7 +368,7 @@ class FileService:
             media_file.save()
         
         # 로그 기록
-        SystemLog.objects.create(
+        write_system_log(
             user=self.user,
             log_level='info',
             log_category='system',
@@ -317,7 +445,7 @@ class FileService:
             media_file.save()
         
         # 로그 기록
-        SystemLog.objects.create(
+        write_system_log(
             user=self.user,
             log_level='info',
             log_category='system',
@@ -364,7 +492,7 @@ class FileService:
                 media_file.delete()
                 deleted_count += 1
             except Exception as e:
-                SystemLog.objects.create(
+                write_system_log(
                     log_level='error',
                     log_category='system',
                     message=f'임시 파일 삭제 실패: {media_file.original_name}',
@@ -373,7 +501,7 @@ class FileService:
                 )
         
         # 로그 기록
-        SystemLog.objects.create(
+        write_system_log(
             log_level='info',
             log_category='system',
             message=f'임시 파일 정리 완료: {deleted_count}개 삭제'
@@ -1,3 +1,130 @@
-from django.test import TestCase
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from users.models import User
+from .models import UploadSession
+from .upload_sessions import UploadSessionService
+
+
+VIDEO = b'\x00\x00\x00\x18ftypmp42' + bytes(range(256)) * 4  # 1036 bytes
+
+
+class UploadSessionAssemblyTests(TestCase):
+    """분할 업로드 조립"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        overrides = override_settings(MEDIA_ROOT=self.media_root, UPLOAD_CHUNK_SIZE=400)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        # SystemLog 버퍼의 백그라운드 저장 스레드가 테스트 DB에 쓰지 않도록
+        log_patch = mock.patch('media_files.services.write_system_log')
+        log_patch.start()
+        self.addCleanup(log_patch.stop)
+
+        self.user = User.objects.create_user(email='upload@test.com', password='pw12345!x', nickname='upload')
+        self.service = UploadSessionService(self.user)
+
+    def start(self, content=VIDEO, name='clip.mp4'):
+        return self.service.start(name, len(content), purpose='detection')
+
+    def send(self, session, part_number, content=VIDEO):
+        start = (part_number - 1) * session.chunk_size
+        part = content[start:start + session.chunk_size]
+        return self.service.write_part(session.upload_id, part_number, io.BytesIO(part), len(part))
+
+    def test_parts_in_any_order_assemble_into_original_file(self):
+        session = self.start()
+        self.assertEqual(session.total_parts, 3)
+
+        for part_number in (3, 1, 2, 1):  # 순서가 바뀌고 재전송된 조각
+            self.send(session, part_number)
+        media_file = self.service.complete(session.upload_id, purpose='detection')
+
+        with open(os.path.join(settings.MEDIA_ROOT, media_file.file_path), 'rb') as f:
+            self.assertEqual(f.read(), VIDEO)
+        self.assertEqual(media_file.file_size, len(VIDEO))
+        self.assertEqual(media_file.metadata['content_hash'], hashlib.sha256(VIDEO).hexdigest())
+        self.assertFalse(os.path.exists(os.path.join(settings.MEDIA_ROOT, session.temp_path)))
+
+        session.refresh_from_db()
+        self.assertEqual(session.upload_status, 'completed')
+        self.assertEqual(session.media_file_id, media_file.file_id)
+
+    def test_part_arriving_after_complete_claims_session_is_not_written(self):
+        session = self.start()
+        for part_number in (1, 2):
+            self.send(session, part_number)
+
+        class ClaimingStream(io.BytesIO):
+            # 조각을 받는 동안 다른 요청이 완료 처리를 시작한 경우
+            def read(inner, size=-1):
+                UploadSession.objects.filter(pk=session.pk).update(upload_status='assembling')
+                return super().read(size)
+
+        part = VIDEO[2 * session.chunk_size:]
+        temp_full_path = os.path.join(settings.MEDIA_ROOT, session.temp_path)
+        with open(temp_full_path, 'rb') as f:
+            before = f.read()
+
+        with self.assertRaises(ValueError):
+            self.service.write_part(session.upload_id, 3, ClaimingStream(part), len(part))
+
+        with open(temp_full_path, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        self.assertEqual(UploadSession.objects.get(pk=session.pk).received_parts, [1, 2])
+
+    def test_complete_requires_every_part(self):
+        session = self.start()
+        self.send(session, 1)
+        self.send(session, 3)
+
+        with self.assertRaisesMessage(ValueError, '[2]'):
+            self.service.complete(session.upload_id, purpose='detection')
+
+    def test_part_size_must_match(self):
+        session = self.start()
+        with self.assertRaises(ValueError):
+            self.service.write_part(session.upload_id, 1, io.BytesIO(b'short'), 5)
+        with self.assertRaises(ValueError):
+            self.service.write_part(session.upload_id, 4, io.BytesIO(b''), 0)
+
+    def test_signature_mismatch_fails_session(self):
+        content = b'not a video' + VIDEO
+        session = self.start(content)
+        for part_number in range(1, session.total_parts + 1):
+            self.send(session, part_number, content)
+
+        with self.assertRaises(ValueError):
+            self.service.complete(session.upload_id, purpose='detection')
+
+        session.refresh_from_db()
+        self.assertEqual(session.upload_status, 'failed')
+        self.assertFalse(os.path.exists(os.path.join(settings.MEDIA_ROOT, session.temp_path)))
+
+    def test_completes_only_once(self):
+        session = self.start()
+        for part_number in range(1, session.total_parts + 1):
+            self.send(session, part_number)
+        self.service.complete(session.upload_id, purpose='detection')
+
+        with self.assertRaises(ValueError):
+            self.service.complete(session.upload_id, purpose='detection')
+        self.assertEqual(UploadSession.objects.get(pk=session.pk).upload_status, 'completed')
+
+    def test_purpose_must_match(self):
+        session = self.start()
+        for part_number in range(1, session.total_parts + 1):
+            self.send(session, part_number)
+
+        with self.assertRaises(ValueError):
+            self.service.complete(session.upload_id, purpose='protection')
@@ -0,0 +1,291 @@
+import hashlib
+import math
+import os
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import UploadSession
+from .log_buffer import write_system_log
+from .services import FileService
+from .uploadhandlers import SIGNATURE_LENGTH, StoredUploadedFile, matches_signature
+
+
+class UploadSessionService:
+    """
+    분할(재개 가능) 업로드 서비스
+
+    1. start: 세션 생성 + 전체 크기의 빈 파일 준비
+    2. write_part: 조각을 자기 오프셋 위치에 기록 (같은 조각을 다시 보내도 결과 동일)
+       파일 기록은 세션 행 잠금 안에서 하므로 complete가 세션을 잡은 뒤에는 조각이 기록되지 않는다
+    3. complete: 모든 조각 확인 → 검증·해시 → 최종 위치로 이동 → MediaFile 생성
+
+    완료된 MediaFile은 기존 분석/보호 흐름에 그대로 넘긴다.
+    """
+
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, user):
+        self.user = user
+        self.file_service = FileService(user)
+
+    def start(self, original_name, file_size, purpose, file_type='video'):
+        """
+        업로드 세션 시작
+
+        Returns:
+            UploadSession: 생성된 세션
+        """
+
+        # 확장자 / 크기 검증 (FileService와 같은 기준)
+        extension = self.file_service._get_file_extension(original_name)
+        if extension not in FileService.ALLOWED_EXTENSIONS[file_type]:
+            raise ValueError(
+                f"{file_type} 타입은 {', '.join(FileService.ALLOWED_EXTENSIONS[file_type])} "
+                f"확장자만 허용됩니다."
+            )
+        if file_size > FileService.MAX_FILE_SIZES[file_type]:
+            max_size_mb = FileService.MAX_FILE_SIZES[file_type] / (1024 * 1024)
+            raise ValueError(f"파일 크기는 {max_size_mb}MB 이하여야 합니다.")
+
+        chunk_size = settings.UPLOAD_CHUNK_SIZE
+        temp_path = os.path.join(
+            'uploads',
+            f"user_{self.user.user_id}",
+            f"{uuid.uuid4().hex}.part"
+        )
+
+        # 전체 크기의 빈 파일을 만들어 두고 조각은 오프셋 위치에 기록
+        full_path = os.path.join(settings.MEDIA_ROOT, temp_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as f:
+            f.truncate(file_size)
+
+        return UploadSession.objects.create(
+            user=self.user,
+            original_name=original_name,
+            file_size=file_size,
+            file_type=file_type,
+            purpose=purpose,
+            chunk_size=chunk_size,
+            total_parts=max(1, math.ceil(file_size / chunk_size)),
+            temp_path=temp_path,
+            expires_at=timezone.now() + timedelta(seconds=settings.UPLOAD_SESSION_TTL)
+        )
+
+    def get_session(self, upload_id):
+        """세션 조회 (만료된 세션은 정리 후 오류)"""
+        try:
+            session = UploadSession.objects.get(upload_id=upload_id, user=self.user)
+        except UploadSession.DoesNotExist:
+            raise ValueError("업로드 세션을 찾을 수 없습니다.")
+
+        if session.upload_status == 'uploading' and session.is_expired:
+            self.expire(session)
+            raise ValueError("업로드 세션이 만료되었습니다. 처음부터 다시 업로드해주세요.")
+
+        return session
+
+    def write_part(self, upload_id, part_number, stream, content_length):
+        """
+        조각 기록
+
+        Args:
+            upload_id: 세션 ID
+            part_number: 조각 번호 (1부터 시작)
+            stream: 요청 본문 스트림
+            content_length: 요청 본문 크기
+
+        Returns:
+            UploadSession: 갱신된 세션
+        """
+
+        session = self.get_session(upload_id)
+        if session.upload_status != 'uploading':
+            raise ValueError("이미 완료되었거나 사용할 수 없는 업로드 세션입니다.")
+
+        if not 1 <= part_number <= session.total_parts:
+            raise ValueError(f"조각 번호는 1부터 {session.total_parts}까지입니다.")
+
+        expected = session.get_part_size(part_number)
+        if content_length != expected:
+            raise ValueError(f"{part_number}번 조각의 크기는 {expected} bytes여야 합니다.")
+
+        # 조각 내용을 먼저 받아 둠 (최대 UPLOAD_CHUNK_SIZE, 느린 전송 동안 세션을 잠그지 않도록)
+        data = bytearray()
+        while len(data) < expected:
+            chunk = stream.read(min(self.READ_SIZE, expected - len(data)))
+            if not chunk:
+                break
+            data += chunk
+
+        if len(data) != expected:
+            raise ValueError(f"{part_number}번 조각이 끝까지 전송되지 않았습니다. 다시 보내주세요.")
+
+        # ✅ 세션 행 잠금 안에서 상태를 다시 확인하고 자기 오프셋 위치에 기록 (재전송해도 같은 위치를 덮어씀)
+        # complete는 같은 행을 갱신해 조립을 시작하므로 기록 중인 조각이 끝날 때까지 기다리고,
+        # 조립이 시작된 뒤 도착한 조각은 기록하지 않는다 (받은 조각 목록도 잃지 않음)
+        with transaction.atomic():
+            session = UploadSession.objects.select_for_update().get(upload_id=upload_id)
+            if session.upload_status != 'uploading':
+                raise ValueError("이미 완료되었거나 사용할 수 없는 업로드 세션입니다.")
+
+            full_path = os.path.join(settings.MEDIA_ROOT, session.temp_path)
+            with open(full_path, 'r+b') as f:
+                f.seek((part_number - 1) * session.chunk_size)
+                f.write(data)
+
+            if part_number not in session.received_parts:
+                session.received_parts = sorted(session.received_parts + [part_number])
+            session.expires_at = timezone.now() + timedelta(seconds=settings.UPLOAD_SESSION_TTL)
+            session.save(update_fields=['received_parts', 'expires_at', 'updated_at'])
+
+        return session
+
+    def complete(self, upload_id, purpose, is_temporary=False, use_s3=False):
+        """
+        업로드 완료 처리
+
+        Args:
+            upload_id: 세션 ID
+            purpose: 완료를 요청한 흐름의 사용 목적 (세션과 같아야 함)
+            is_temporary, use_s3: FileService.upload_file과 동일
+
+        Returns:
+            MediaFile: 저장된 미디어 파일
+        """
+
+        session = self.get_session(upload_id)
+        if session.purpose != purpose:
+            raise ValueError("업로드 세션의 사용 목적이 다릅니다.")
+
+        missing = sorted(set(range(1, session.total_parts + 1)) - set(session.received_parts))
+        if missing:
+            raise ValueError(f"아직 받지 못한 조각이 있습니다: {missing[:20]}")
+
+        # 동시에 완료 요청이 와도 한 번만 처리
+        # (같은 행을 갱신하므로 잠금을 잡고 기록 중인 조각이 끝날 때까지 기다림)
+        claimed = UploadSession.objects.filter(
+            upload_id=session.upload_id,
+            upload_status='uploading'
+        ).update(upload_status='assembling', updated_at=timezone.now())
+        if not claimed:
+            raise ValueError("이미 완료되었거나 처리 중인 업로드 세션입니다.")
+
+        try:
+            media_file = self._assemble(session, is_temporary, use_s3)
+        except Exception:
+            # 검증 실패는 _assemble에서 세션을 실패 처리하고,
+            # 저장 단계의 일시적인 오류(S3 등)는 다시 완료 요청할 수 있도록 되돌림
+            UploadSession.objects.filter(
+                upload_id=session.upload_id,
+                upload_status='assembling'
+            ).update(upload_status='uploading')
+            raise
+
+        session.upload_status = 'completed'
+        session.media_file_id = media_file.file_id
+        session.save(update_fields=['upload_status', 'media_file_id', 'updated_at'])
+        return media_file
+
+    def _assemble(self, session, is_temporary, use_s3):
+        """조립된 파일 검증·해시 후 최종 위치로 옮겨 MediaFile 생성 (복사 없음)"""
+
+        temp_full_path = os.path.join(settings.MEDIA_ROOT, session.temp_path)
+        extension = self.file_service._get_file_extension(session.original_name)
+
+        hasher = hashlib.sha256()
+        with open(temp_full_path, 'rb') as f:
+            header = f.read(SIGNATURE_LENGTH)
+            hasher.update(header)
+            for chunk in iter(lambda: f.read(self.READ_SIZE), b''):
+                hasher.update(chunk)
+
+        if not matches_signature(extension, header):
+            self._fail(session)
+            raise ValueError("파일 내용이 확장자와 일치하지 않습니다.")
+
+        filename = self.file_service._generate_unique_filename(extension)
+        stored_path = self.file_service._get_local_path(session.purpose, filename)
+        stored_full_path = os.path.join(settings.MEDIA_ROOT, stored_path)
+        os.makedirs(os.path.dirname(stored_full_path), exist_ok=True)
+        os.replace(temp_full_path, stored_full_path)
+
+        uploaded_file = StoredUploadedFile(
+            file=open(stored_full_path, 'rb'),
+            name=session.original_name,
+            content_type=None,
+            size=session.file_size,
+            charset=None,
+            content_type_extra=None,
+            stored_path=stored_path,
+            content_hash=hasher.hexdigest()
+        )
+
+        try:
+            return self.file_service.upload_file(
+                uploaded_file=uploaded_file,
+                file_type=session.file_type,
+                purpose=session.purpose,
+                is_temporary=is_temporary,
+                metadata={'upload_id': session.upload_id},
+                use_s3=use_s3
+            )
+        except Exception:
+            # 조립된 파일을 제자리로 되돌려 다시 완료 요청할 수 있게 함
+            uploaded_file.close()
+            os.replace(stored_full_path, temp_full_path)
+            uploaded_file.stored_path = None
+            raise
+        finally:
+            # S3에 올려 등록되지 않은 로컬 파일 정리
+            uploaded_file.discard()
+
+    def _fail(self, session):
+        """검증 실패 세션 정리"""
+        self._remove_temp_file(session)
+        UploadSession.objects.filter(upload_id=session.upload_id).update(
+            upload_status='failed',
+            updated_at=timezone.now()
+        )
+
+    def expire(self, session):
+        """만료 세션 정리 (조립 중인 파일 삭제)"""
+        self._remove_temp_file(session)
+        session.upload_status = 'expired'
+        session.save(update_fields=['upload_status', 'updated_at'])
+
+    def _remove_temp_file(self, session):
+        full_path = os.path.join(settings.MEDIA_ROOT, session.temp_path)
+        if os.path.exists(full_path):
+            os.remove(full_path)
+
+    @classmethod
+    def cleanup_expired(cls):
+        """
+        만료된 업로드 세션 일괄 정리
+
+        Returns:
+            int: 정리한 세션 수
+        """
+        # 조립 중 프로세스가 죽어 남은 세션도 함께 정리
+        expired = UploadSession.objects.filter(
+            upload_status__in=['uploading', 'assembling'],
+            expires_at__lte=timezone.now()
+        ).select_related('user')
+
+        count = 0
+        for session in expired:
+            cls(session.user).expire(session)
+            count += 1
+
+        if count:
+            write_system_log(
+                log_level='info',
+                log_category='system',
+                message=f'만료된 업로드 세션 정리: {count}개'
+            )
+        return count
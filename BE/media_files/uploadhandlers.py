@@ -0,0 +1,245 @@
+import hashlib
+import io
+import os
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+
+from .services import FileService
+
+
+# 확장자별 파일 시그니처 (오프셋, 허용 바이트열 목록)
+FILE_SIGNATURES = {
+    'jpg': [(0, [b'\xff\xd8\xff'])],
+    'jpeg': [(0, [b'\xff\xd8\xff'])],
+    'png': [(0, [b'\x89PNG\r\n\x1a\n'])],
+    'webp': [(0, [b'RIFF']), (8, [b'WEBP'])],
+    'mp4': [(4, [b'ftyp'])],
+    'mov': [(4, [b'ftyp', b'moov', b'mdat', b'wide', b'free', b'skip'])],
+    'avi': [(0, [b'RIFF']), (8, [b'AVI '])],
+}
+SIGNATURE_LENGTH = 12
+
+
+def matches_signature(extension, header):
+    """파일 앞부분이 확장자의 시그니처와 일치하는지 확인 (시그니처가 없는 확장자는 통과)"""
+    for offset, candidates in FILE_SIGNATURES.get(extension, []):
+        if not any(header[offset:offset + len(c)] == c for c in candidates):
+            return False
+    return True
+
+
+class StreamedUploadedFile(UploadedFile):
+    """
+    스트리밍 업로드 핸들러가 처리한 파일
+
+    크기 제한을 넘어 기록을 중단한 파일은 stored_path가 None이고 내용이 비어 있다.
+    """
+
+    def __init__(self, file, name, content_type, size, charset, content_type_extra,
+                 stored_path, content_hash, validation_error=None):
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.stored_path = stored_path  # MEDIA_ROOT 기준 상대 경로 (거부된 파일은 None)
+        self.content_hash = content_hash
+        self.validation_error = validation_error
+        self.is_adopted = False  # FileService가 MediaFile로 등록했는지 여부
+
+    def discard(self):
+        """등록되지 않은 파일 삭제"""
+        self.close()
+        if self.stored_path and not self.is_adopted:
+            full_path = os.path.join(settings.MEDIA_ROOT, self.stored_path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+            self.stored_path = None
+
+
+class StoredUploadedFile(StreamedUploadedFile):
+    """
+    업로드 중 최종 저장 위치에 바로 기록된 파일
+
+    FileService는 stored_path가 있으면 다시 복사하지 않고 이 파일을 그대로 사용한다.
+    """
+
+    def temporary_file_path(self):
+        """Pillow 등이 메모리로 읽지 않고 경로로 열 수 있도록 저장 경로 반환"""
+        return os.path.join(settings.MEDIA_ROOT, self.stored_path)
+
+
+class StreamingMediaUploadHandler(FileUploadHandler):
+    """
+    업로드 스트림을 한 번만 읽으면서 검증·해시·저장을 처리하는 핸들러
+
+    - 확장자 / 파일 시그니처(magic bytes) 검증
+    - sha256 콘텐츠 해시 계산
+    - MEDIA_ROOT/<purpose>/user_<id>/ 최종 위치에 바로 기록
+
+    FileService의 두 번째 전체 복사가 없어지고, WSGI에서는 임시 파일(/tmp) 스풀링도 없어진다.
+    ASGI에서는 Django(ASGIHandler)가 요청 본문 전체를 먼저 SpooledTemporaryFile
+    (FILE_UPLOAD_MAX_MEMORY_SIZE 초과분은 FILE_UPLOAD_TEMP_DIR)로 받은 뒤 이 핸들러가 실행되므로
+    디스크 기록이 한 번 더 생긴다. 큰 영상은 분할 업로드(/api/files/uploads/)로 받는다.
+    field_types에 없는 필드나 허용되지 않은 확장자는 기본 핸들러에 넘겨
+    FileService가 기존과 같은 오류를 내도록 한다.
+    """
+
+    def __init__(self, request, user, field_types, purpose):
+        super().__init__(request)
+        self.file_service = FileService(user)
+        self.field_types = field_types  # 필드명 -> 파일 유형
+        self.purpose = purpose
+        self.stored_files = []
+        self._reset()
+
+    def _reset(self):
+        self.active = False
+        self.destination = None
+        self.relative_path = None
+        self.extension = None
+        self.hasher = None
+        self.header = b''
+        self.received = 0
+        self.max_size = None
+        self.validation_error = None
+
+    def new_file(self, field_name, file_name, content_type, content_length,
+                 charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length,
+                         charset, content_type_extra)
+        self._reset()
+
+        file_type = self.field_types.get(field_name)
+        if file_type is None:
+            return
+
+        extension = self.file_service._get_file_extension(file_name)
+        if extension not in FileService.ALLOWED_EXTENSIONS[file_type]:
+            return
+
+        filename = self.file_service._generate_unique_filename(extension)
+        self.relative_path = self.file_service._get_local_path(self.purpose, filename)
+        full_path = os.path.join(settings.MEDIA_ROOT, self.relative_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        self.destination = open(full_path, 'wb')
+        self.hasher = hashlib.sha256()
+        self.extension = extension
+        self.max_size = FileService.MAX_FILE_SIZES[file_type]
+        self.active = True
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.active:
+            return raw_data
+
+        self.received += len(raw_data)
+
+        # 기록을 중단한 파일은 크기만 세고 버린다
+        if self.destination is None:
+            return None
+
+        if len(self.header) < SIGNATURE_LENGTH:
+            self.header += raw_data[:SIGNATURE_LENGTH - len(self.header)]
+
+        # 크기 제한을 넘으면 더 쓰지 않음 (FileService가 크기 오류 반환)
+        if self.received > self.max_size:
+            self._abort()
+            return None
+
+        self.destination.write(raw_data)
+        self.hasher.update(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if not self.active:
+            return None
+
+        # 시그니처가 맞지 않는 파일도 요청 처리 중에는 남겨 두고
+        # (FileService가 오류 반환, 요청이 끝나면 삭제) 다른 검증은 그대로 진행
+        if not matches_signature(self.extension, self.header):
+            self.validation_error = "파일 내용이 확장자와 일치하지 않습니다."
+
+        if self.destination is not None:
+            self.destination.close()
+            file_class = StoredUploadedFile
+            file = open(os.path.join(settings.MEDIA_ROOT, self.relative_path), 'rb')
+        else:
+            file_class = StreamedUploadedFile
+            file = io.BytesIO()
+
+        uploaded_file = file_class(
+            file=file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+            stored_path=self.relative_path if self.destination is not None else None,
+            content_hash=self.hasher.hexdigest(),
+            validation_error=self.validation_error
+        )
+        self.stored_files.append(uploaded_file)
+        self._reset()
+        return uploaded_file
+
+    def upload_interrupted(self):
+        """업로드가 중단되면 기록 중이던 파일 삭제"""
+        if self.active:
+            self._abort()
+        self.discard_unadopted()
+
+    def discard_unadopted(self):
+        """요청 처리 후 MediaFile로 등록되지 않은 파일 정리"""
+        for uploaded_file in self.stored_files:
+            uploaded_file.discard()
+
+    def _abort(self):
+        """기록 중인 파일 삭제 (이후 청크는 버림)"""
+        if self.destination is not None:
+            self.destination.close()
+            full_path = os.path.join(settings.MEDIA_ROOT, self.relative_path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+            self.destination = None
+
+
+class StreamingUploadMixin:
+    """
+    APIView에 스트리밍 업로드 핸들러를 붙이는 Mixin
+
+    upload_field_types: 요청 필드명 -> 파일 유형 (FileService 기준)
+    upload_purpose: 저장 목적 디렉토리 (detection, protection, zoom ...)
+    """
+
+    upload_field_types = {}
+    upload_purpose = None
+
+    def use_streaming_upload(self, request):
+        """스트리밍 업로드 사용 여부 (S3 저장 등 로컬 저장이 아니면 False로 재정의)"""
+        return settings.STREAMING_UPLOAD_ENABLED and request.method == 'POST'
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        # 인증이 끝난 뒤, 본문 파싱 전에 핸들러 등록 (request.data 접근 시 파싱)
+        self.upload_handler = None
+        if self.use_streaming_upload(request) and request.user.is_authenticated:
+            self.upload_handler = StreamingMediaUploadHandler(
+                request,
+                request.user,
+                self.upload_field_types,
+                self.upload_purpose
+            )
+            request.upload_handlers.insert(0, self.upload_handler)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # 검증 실패 등으로 등록되지 않은 파일은 디스크에 남기지 않음
+        if getattr(self, 'upload_handler', None) is not None:
+            self.upload_handler.discard_unadopted()
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def cancel_request(self, request):
+        # AsyncAPIView 요청이 취소된 경우 (finalize_response가 실행되지 않음)
+        if getattr(self, 'upload_handler', None) is not None:
+            self.upload_handler.discard_unadopted()
+        super().cancel_request(request)
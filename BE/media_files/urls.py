@@ -1,8 +1,18 @@
 from django.urls import path
-from .views import MediaFileDownloadView
+from .views import (
+    MediaFileDownloadView,
+    UploadSessionStartView,
+    UploadSessionDetailView,
+    UploadPartView
+)
 
 app_name = 'media_files'
 
 urlpatterns = [
     path('<int:file_id>/download/', MediaFileDownloadView.as_view(), name='download'),
+    
+    # 분할 업로드 (완료는 각 기능의 complete API에서 처리)
+    path('uploads/', UploadSessionStartView.as_view(), name='upload_start'),
+    path('uploads/<int:upload_id>/', UploadSessionDetailView.as_view(), name='upload_detail'),
+    path('uploads/<int:upload_id>/parts/<int:part_number>/', UploadPartView.as_view(), name='upload_part'),
 ]
\ No newline at end of file
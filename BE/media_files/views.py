@@ -2,7 +2,9 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from .models import MediaFile
+from .serializers import UploadSessionStartSerializer, UploadSessionSerializer
 from .storage import S3Storage
+from .upload_sessions import UploadSessionService
 
 
 class MediaFileDownloadView(APIView):
@@ -40,4 +42,85 @@ class MediaFileDownloadView(APIView):
             'file_name': media_file.original_name,
             'download_url': download_url,
             'expires_in': 3600  # 1시간
-        })
\ No newline at end of file
+        })
+
+
+class UploadSessionStartView(APIView):
+    """분할 업로드 시작 API (대용량 영상)"""
+    
+    def post(self, request):
+        serializer = UploadSessionStartSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            session = UploadSessionService(request.user).start(
+                original_name=serializer.validated_data['file_name'],
+                file_size=serializer.validated_data['file_size'],
+                purpose=serializer.validated_data['purpose']
+            )
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(
+            UploadSessionSerializer(session).data,
+            status=status.HTTP_201_CREATED
+        )
+
+
+class UploadSessionDetailView(APIView):
+    """분할 업로드 상태 조회 API (재개할 때 받지 못한 조각 확인)"""
+    
+    def get(self, request, upload_id):
+        try:
+            session = UploadSessionService(request.user).get_session(upload_id)
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(UploadSessionSerializer(session).data)
+
+
+class UploadPartView(APIView):
+    """
+    분할 업로드 조각 전송 API
+    
+    요청 본문은 조각의 바이트 그대로 (Content-Type: application/octet-stream).
+    같은 조각을 다시 보내도 같은 위치를 덮어쓰므로 실패한 조각만 재전송하면 된다.
+    """
+    
+    def put(self, request, upload_id, part_number):
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        
+        try:
+            session = UploadSessionService(request.user).write_part(
+                upload_id,
+                part_number,
+                request.stream,
+                content_length
+            )
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response({
+            'upload_id': session.upload_id,
+            'part_number': part_number,
+            'received_parts': len(session.received_parts),
+            'total_parts': session.total_parts,
+            'received_bytes': session.received_bytes
+        })
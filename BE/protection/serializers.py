@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from config.projection import SparseFieldsetMixin
 from .models import ProtectionJob
 
 
@@ -95,7 +96,17 @@ class VideoProtectionRequestSerializer(serializers.Serializer):
         return value
 
 
-class ProtectionJobListSerializer(serializers.ModelSerializer):
+class VideoUploadProtectionRequestSerializer(serializers.Serializer):
+    """분할 업로드 영상 보호 요청 Serializer"""
+    
+    job_type = serializers.ChoiceField(
+        choices=['adversarial_noise', 'watermark', 'both'],
+        default='both',
+        help_text="보호 방식"
+    )
+
+
+class ProtectionJobListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """보호 작업 목록 Serializer (간단한 정보만)"""
     
     job_type_display = serializers.CharField(
@@ -120,4 +131,6 @@ class ProtectionJobListSerializer(serializers.ModelSerializer):
             'progress_percentage',
             'created_at',
         ]
-        read_only_fields = fields
\ No newline at end of file
+        read_only_fields = fields
+        # 컬럼이 아닌 필드가 읽는 컬럼 (목록 조회 컬럼 최소화용)
+        projection_dependencies = {'file_count': ['original_files']}
\ No newline at end of file
@@ -1,23 +1,34 @@
+import httpx
 import requests
 import time
 from django.conf import settings
-from media_files.models import SystemLog
+from media_files.log_buffer import write_system_log
+from detection.ai_client import build_async_timeout, get_ai_client, get_async_ai_client
+from detection.router import get_ai_router
+from detection.dispatch import get_ai_dispatcher
+from detection.latency import get_latency_tracker
+from config.metrics import record_mock_fallback
 
 
 class ProtectionService:
     """콘텐츠 보호 서비스 (FastAPI 연동)"""
     
-    def __init__(self):
-        self.fastapi_url = settings.FASTAPI_URL
-        self.timeout = 600  # 10분
+    def __init__(self, lane='bulk'):
+        self.client = get_ai_client()
+        self.router = get_ai_router()
+        self.dispatcher = get_ai_dispatcher()
+        self.lane = lane
+        self.latency = get_latency_tracker()
+        self.timeout = settings.PROTECTION_REQUEST_TIMEOUT  # 적응형 타임아웃 상한
     
-    def protect_images(self, file_identifiers, job_type='both'):
+    def protect_images(self, file_identifiers, job_type='both', payload_size=None):
         """
         이미지 보호 처리
         
         Args:
             file_identifiers: 파일 식별자 리스트 (S3 키 또는 로컬 경로)
             job_type: 보호 방식
+            payload_size: 파일 크기 합 (bytes, 적응형 타임아웃 구간 선택용)
         
         Returns:
             dict: {
@@ -35,60 +46,70 @@ class ProtectionService:
         
         start_time = time.time()
         
-        # 🔧 AI 서버 연결 확인
-        if not self.check_health():
-            print("⚠️ AI 서버 없음 - Mock 데이터 반환")
-            return self._get_mock_protection_response(
-                file_identifiers,
-                start_time,
-                'image'
-            )
-        
-        # 실제 AI 서버 호출
-        try:
-            # ✅ S3 정보 또는 로컬 경로를 JSON으로 전달
-            response = requests.post(
-                f"{self.fastapi_url}/api/protect/images",
-                json={
-                    'files': file_identifiers,
-                    'job_type': job_type
-                },
-                timeout=self.timeout
-            )
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        with self.dispatcher.slot(self.lane):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('protect')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_protection_response(
+                    file_identifiers,
+                    start_time,
+                    'image'
+                )
             
-            response.raise_for_status()
-            result = response.json()
-            
-            processing_time = int((time.time() - start_time) * 1000)
-            
-            return {
-                'success': True,
-                'protected_files': result.get('protected_files', []),
-                # protected_files: [{'original_file_id': 1, 's3_url': 'https://...', 'file_name': '...'}, ...]
-                'processing_time': processing_time
-            }
-        
-        except requests.exceptions.RequestException as e:
-            SystemLog.objects.create(
-                log_level='error',
-                log_category='protection',
-                message=f'이미지 보호 처리 실패: {str(e)}',
-                error_code='PROTECTION_API_ERROR'
-            )
+            # 실제 AI 서버 호출
+            try:
+                # ✅ S3 정보 또는 로컬 경로를 JSON으로 전달
+                route = '/api/protect/images'
+                read_timeout = self.latency.timeout_for(route, payload_size, self.timeout)
+                request_start = time.perf_counter()
+                with backend.lease('protection', route) as call:
+                    response = self.client.post(
+                        f"{backend.url}{route}",
+                        json={
+                            'files': file_identifiers,
+                            'job_type': job_type
+                        },
+                        timeout=(settings.AI_CONNECT_TIMEOUT, read_timeout)
+                    )
+                    
+                    response.raise_for_status()
+                    result = response.json()
+                    call.model_version = result.get('model_version')
+                self.latency.record(route, payload_size, time.perf_counter() - request_start)
+                
+                processing_time = int((time.time() - start_time) * 1000)
+                
+                return {
+                    'success': True,
+                    'protected_files': result.get('protected_files', []),
+                    # protected_files: [{'original_file_id': 1, 's3_url': 'https://...', 'file_name': '...'}, ...]
+                    'processing_time': processing_time
+                }
             
-            return {
-                'success': False,
-                'error': '보호 처리 중 오류가 발생했습니다.',
-                'processing_time': int((time.time() - start_time) * 1000)
-            }
+            except requests.exceptions.RequestException as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='protection',
+                    message=f'이미지 보호 처리 실패: {str(e)}',
+                    error_code='PROTECTION_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': '보호 처리 중 오류가 발생했습니다.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
     
-    def protect_video(self, file_identifier, job_type='both'):
+    def protect_video(self, file_identifier, job_type='both', payload_size=None):
         """
         영상 보호 처리
         
         Args:
             file_identifier: 파일 식별자 (S3 키 또는 로컬 경로)
             job_type: 보호 방식
+            payload_size: 파일 크기 (bytes, 적응형 타임아웃 구간 선택용)
         
         Returns:
             dict: {
@@ -101,52 +122,174 @@ class ProtectionService:
         
         start_time = time.time()
         
-        # 🔧 AI 서버 연결 확인
-        if not self.check_health():
-            print("⚠️ AI 서버 없음 - Mock 데이터 반환")
-            return self._get_mock_protection_response(
-                [file_identifier],
-                start_time,
-                'video'
-            )
-        
-        # 실제 AI 서버 호출
-        try:
-            # ✅ S3 정보 또는 로컬 경로를 JSON으로 전달
-            response = requests.post(
-                f"{self.fastapi_url}/api/protect/video",
-                json={
-                    'file': file_identifier,
-                    'job_type': job_type
-                },
-                timeout=self.timeout
-            )
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        with self.dispatcher.slot(self.lane):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('protect')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_protection_response(
+                    [file_identifier],
+                    start_time,
+                    'video'
+                )
             
-            response.raise_for_status()
-            result = response.json()
+            # 실제 AI 서버 호출
+            try:
+                # ✅ S3 정보 또는 로컬 경로를 JSON으로 전달
+                route = '/api/protect/video'
+                read_timeout = self.latency.timeout_for(route, payload_size, self.timeout)
+                request_start = time.perf_counter()
+                with backend.lease('protection', route) as call:
+                    response = self.client.post(
+                        f"{backend.url}{route}",
+                        json={
+                            'file': file_identifier,
+                            'job_type': job_type
+                        },
+                        timeout=(settings.AI_CONNECT_TIMEOUT, read_timeout)
+                    )
+                    
+                    response.raise_for_status()
+                    result = response.json()
+                    call.model_version = result.get('model_version')
+                self.latency.record(route, payload_size, time.perf_counter() - request_start)
+                
+                processing_time = int((time.time() - start_time) * 1000)
+                
+                return {
+                    'success': True,
+                    's3_url': result.get('s3_url'),
+                    'file_name': result.get('file_name'),
+                    'processing_time': processing_time
+                }
             
-            processing_time = int((time.time() - start_time) * 1000)
+            except requests.exceptions.RequestException as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='protection',
+                    message=f'영상 보호 처리 실패: {str(e)}',
+                    error_code='PROTECTION_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': '보호 처리 중 오류가 발생했습니다.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+    
+    async def aprotect_images(self, file_identifiers, job_type='both', payload_size=None):
+        """이미지 보호 처리 (async 뷰용, protect_images와 같은 결과)"""
+        
+        start_time = time.time()
+        
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        async with self.dispatcher.aslot(self.lane):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('protect')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_protection_response(
+                    file_identifiers,
+                    start_time,
+                    'image'
+                )
             
-            return {
-                'success': True,
-                's3_url': result.get('s3_url'),
-                'file_name': result.get('file_name'),
-                'processing_time': processing_time
-            }
+            try:
+                route = '/api/protect/images'
+                read_timeout = self.latency.timeout_for(route, payload_size, self.timeout)
+                request_start = time.perf_counter()
+                with backend.lease('protection', route) as call:
+                    response = await get_async_ai_client().post(
+                        f"{backend.url}{route}",
+                        json={
+                            'files': file_identifiers,
+                            'job_type': job_type
+                        },
+                        timeout=build_async_timeout(read_timeout)
+                    )
+                    
+                    response.raise_for_status()
+                    result = response.json()
+                    call.model_version = result.get('model_version')
+                self.latency.record(route, payload_size, time.perf_counter() - request_start)
+                
+                return {
+                    'success': True,
+                    'protected_files': result.get('protected_files', []),
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+            
+            except httpx.HTTPError as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='protection',
+                    message=f'이미지 보호 처리 실패: {str(e)}',
+                    error_code='PROTECTION_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': '보호 처리 중 오류가 발생했습니다.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+    
+    async def aprotect_video(self, file_identifier, job_type='both', payload_size=None):
+        """영상 보호 처리 (async 뷰용, protect_video와 같은 결과)"""
         
-        except requests.exceptions.RequestException as e:
-            SystemLog.objects.create(
-                log_level='error',
-                log_category='protection',
-                message=f'영상 보호 처리 실패: {str(e)}',
-                error_code='PROTECTION_API_ERROR'
-            )
+        start_time = time.time()
+        
+        # ✅ 우선순위 레인에서 AI 호출 차례를 기다린 뒤 서버 선택
+        async with self.dispatcher.aslot(self.lane):
+            # 🔧 AI 서버 선택 (사용 가능한 서버가 없으면 Mock)
+            backend = self.router.choose('protect')
+            if backend is None:
+                print("⚠️ AI 서버 없음 - Mock 데이터 반환")
+                return self._get_mock_protection_response(
+                    [file_identifier],
+                    start_time,
+                    'video'
+                )
             
-            return {
-                'success': False,
-                'error': '보호 처리 중 오류가 발생했습니다.',
-                'processing_time': int((time.time() - start_time) * 1000)
-            }
+            try:
+                route = '/api/protect/video'
+                read_timeout = self.latency.timeout_for(route, payload_size, self.timeout)
+                request_start = time.perf_counter()
+                with backend.lease('protection', route) as call:
+                    response = await get_async_ai_client().post(
+                        f"{backend.url}{route}",
+                        json={
+                            'file': file_identifier,
+                            'job_type': job_type
+                        },
+                        timeout=build_async_timeout(read_timeout)
+                    )
+                    
+                    response.raise_for_status()
+                    result = response.json()
+                    call.model_version = result.get('model_version')
+                self.latency.record(route, payload_size, time.perf_counter() - request_start)
+                
+                return {
+                    'success': True,
+                    's3_url': result.get('s3_url'),
+                    'file_name': result.get('file_name'),
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
+            
+            except httpx.HTTPError as e:
+                write_system_log(
+                    log_level='error',
+                    log_category='protection',
+                    message=f'영상 보호 처리 실패: {str(e)}',
+                    error_code='PROTECTION_API_ERROR'
+                )
+                
+                return {
+                    'success': False,
+                    'error': '보호 처리 중 오류가 발생했습니다.',
+                    'processing_time': int((time.time() - start_time) * 1000)
+                }
     
     def _get_mock_protection_response(self, file_identifiers, start_time, file_type):
         """
@@ -154,6 +297,8 @@ class ProtectionService:
         """
         from datetime import datetime
         
+        record_mock_fallback('protection', file_type)
+        
         processing_time = int((time.time() - start_time) * 1000)
         
         if file_type == 'image':
@@ -211,12 +356,5 @@ class ProtectionService:
             }
     
     def check_health(self):
-        """FastAPI 서버 상태 확인"""
-        try:
-            response = requests.get(
-                f"{self.fastapi_url}/health",
-                timeout=2
-            )
-            return response.status_code == 200
-        except:
-            return False
\ No newline at end of file
+        """보호 처리를 지원하는 AI 서버 중 사용 가능한 서버가 있는지 (캐시된 상태 + 서킷 브레이커)"""
+        return self.router.choose('protect') is not None
@@ -2,6 +2,7 @@ from django.urls import path
 from .views import (
     ImageProtectionView,
     VideoProtectionView,
+    VideoUploadProtectionView,
     ProtectionJobListView,
     ProtectionJobDetailView
 )
@@ -12,6 +13,7 @@ urlpatterns = [
     # 보호 처리
     path('images/', ImageProtectionView.as_view(), name='image_protection'),
     path('videos/', VideoProtectionView.as_view(), name='video_protection'),
+    path('videos/uploads/<int:upload_id>/complete/', VideoUploadProtectionView.as_view(), name='video_upload_protection'),
     
     # 작업 조회
     path('jobs/', ProtectionJobListView.as_view(), name='job_list'),
@@ -1,27 +1,93 @@
 from rest_framework import status, generics
 from rest_framework.response import Response
-from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
 from django.conf import settings
-import os
 
 from .models import ProtectionJob
 from .serializers import (
     ProtectionJobSerializer,
     ProtectionJobListSerializer,
     ImageProtectionRequestSerializer,
-    VideoProtectionRequestSerializer
+    VideoProtectionRequestSerializer,
+    VideoUploadProtectionRequestSerializer
 )
 from .services import ProtectionService
+from detection.services import build_file_identifier
 from media_files.services import FileService
+from media_files.upload_sessions import UploadSessionService
+from media_files.uploadhandlers import StreamingUploadMixin
+from config.admission import AdmissionControlMixin
+from config.async_views import AsyncAPIView
+from config.pagination import KeysetPagination
+from config.projection import ProjectedListMixin
 
 
-class ImageProtectionView(APIView):
-    """이미지 보호 API - S3 URL만 반환"""
+class ProtectionUploadMixin(AdmissionControlMixin, StreamingUploadMixin):
+    """
+    보호 요청 공통 (승인 제어 + 업로드 + 보호 작업 상태 저장)
     
-    def post(self, request):
-        serializer = ImageProtectionRequestSerializer(data=request.data)
+    S3에 저장하는 경우 로컬 스트리밍 저장은 사용하지 않는다.
+    """
+    
+    upload_purpose = 'protection'
+    admission_scope = 'protection'
+    admission_lane = 'bulk'
+    
+    def use_streaming_upload(self, request):
+        return (
+            super().use_streaming_upload(request)
+            and not settings.USE_S3_FOR_PROTECTION
+        )
+    
+    def create_job(self, user, media_files, job_type):
+        """보호 작업 생성 (대기 상태)"""
+        original_files_data = [
+            {
+                'file_id': mf.file_id,
+                'file_name': mf.original_name,
+                'file_size': mf.file_size,
+                'file_path': mf.file_path,
+                'mime_type': mf.mime_type,
+                'storage_type': mf.storage_type
+            }
+            for mf in media_files
+        ]
         
-        if not serializer.is_valid():
+        return ProtectionJob.objects.create(
+            user=user,
+            job_type=job_type,
+            original_files=original_files_data,
+            job_status='pending',
+            progress_percentage=0.0
+        )
+    
+    def fail_job(self, job, error):
+        job.job_status = 'failed'
+        job.error_message = error or '알 수 없는 오류'
+        job.save()
+    
+    def complete_job(self, job, protected_files):
+        job.protected_files = protected_files
+        job.job_status = 'completed'
+        job.progress_percentage = 100.0
+        job.save()
+
+
+class ImageProtectionView(ProtectionUploadMixin, AsyncAPIView):
+    """
+    이미지 보호 API - S3 URL만 반환
+    
+    async 뷰: AI 서버의 보호 처리(최대 10분)를 기다리는 동안 워커 스레드를 점유하지 않는다.
+    """
+    
+    upload_field_types = {'files': 'image'}
+    
+    async def post(self, request):
+        serializer = ImageProtectionRequestSerializer(
+            data=await self.get_request_data(request)
+        )
+        
+        if not await sync_to_async(serializer.is_valid)():
             return Response(
                 serializer.errors,
                 status=status.HTTP_400_BAD_REQUEST
@@ -30,108 +96,84 @@ class ImageProtectionView(APIView):
         uploaded_files = serializer.validated_data['files']
         job_type = serializer.validated_data['job_type']
         
-        file_service = FileService(request.user)
-        
-        media_files = []
-        file_identifiers = []
-        
         try:
-            for file in uploaded_files:
-                media_file = file_service.upload_file(
-                    uploaded_file=file,
-                    file_type='image',
-                    purpose='protection',
-                    is_temporary=False,
-                    use_s3=settings.USE_S3_FOR_PROTECTION  # ✅ 환경 변수로 제어
-                )
-                media_files.append(media_file)
-                
-                # ✅ S3 키 또는 로컬 경로 전달
-                if media_file.storage_type == 's3':
-                    # AI 서버에 S3 키 전달
-                    file_identifiers.append({
-                        'type': 's3',
-                        'file_id': media_file.file_id,
-                        's3_bucket': media_file.s3_bucket,
-                        's3_key': media_file.s3_key
-                    })
-                else:
-                    # 로컬 경로 전달
-                    file_identifiers.append({
-                        'type': 'local',
-                        'file_id': media_file.file_id,
-                        'path': os.path.join(settings.MEDIA_ROOT, media_file.file_path)
-                    })
-            
-            original_files_data = [
-                {
-                    'file_id': mf.file_id,
-                    'file_name': mf.original_name,
-                    'file_size': mf.file_size,
-                    'file_path': mf.file_path,
-                    'mime_type': mf.mime_type,
-                    'storage_type': mf.storage_type
-                }
-                for mf in media_files
-            ]
-            
-            job = ProtectionJob.objects.create(
-                user=request.user,
-                job_type=job_type,
-                original_files=original_files_data,
-                job_status='pending',
-                progress_percentage=0.0
+            job, file_identifiers = await sync_to_async(self.prepare_job)(
+                request.user, uploaded_files, job_type
             )
-            
-            # ✅ AI 서버에 파일 정보 전달
-            protection_service = ProtectionService()
-            result = protection_service.protect_images(file_identifiers, job_type)
-            
-            if not result['success']:
-                job.job_status = 'failed'
-                job.error_message = result.get('error', '알 수 없는 오류')
-                job.save()
-                
-                return Response(
-                    {'error': result['error']},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-            
-            # ✅ S3 URL 리스트만 저장
-            protected_files_data = []
-            for protected_info in result['protected_files']:
-                protected_files_data.append({
-                    'original_file_id': protected_info['original_file_id'],
-                    's3_url': protected_info['s3_url'],  # ✅ S3 URL만!
-                    'file_name': protected_info['file_name']
-                })
-            
-            job.protected_files = protected_files_data
-            job.job_status = 'completed'
-            job.progress_percentage = 100.0
-            job.save()
-            
-            # ✅ S3 URL만 반환
-            return Response({
-                'job_id': job.job_id,
-                'status': 'completed',
-                'protected_files': protected_files_data  # [{'original_file_id': 1, 's3_url': '...', 'file_name': '...'}]
-            }, status=status.HTTP_201_CREATED)
-        
         except ValueError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # ✅ AI 서버에 파일 정보 전달
+        protection_service = ProtectionService()
+        result = await protection_service.aprotect_images(
+            file_identifiers,
+            job_type,
+            payload_size=sum(f['file_size'] for f in job.original_files)
+        )
+        
+        if not result['success']:
+            await sync_to_async(self.fail_job)(job, result.get('error'))
+            
+            return Response(
+                {'error': result['error']},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        # ✅ S3 URL 리스트만 저장
+        protected_files_data = []
+        for protected_info in result['protected_files']:
+            protected_files_data.append({
+                'original_file_id': protected_info['original_file_id'],
+                's3_url': protected_info['s3_url'],  # ✅ S3 URL만!
+                'file_name': protected_info['file_name']
+            })
+        
+        await sync_to_async(self.complete_job)(job, protected_files_data)
+        
+        # ✅ S3 URL만 반환
+        return Response({
+            'job_id': job.job_id,
+            'status': 'completed',
+            'protected_files': protected_files_data  # [{'original_file_id': 1, 's3_url': '...', 'file_name': '...'}]
+        }, status=status.HTTP_201_CREATED)
+    
+    def prepare_job(self, user, uploaded_files, job_type):
+        """파일 저장 + 보호 작업 생성"""
+        file_service = FileService(user)
+        
+        media_files = [
+            file_service.upload_file(
+                uploaded_file=file,
+                file_type='image',
+                purpose='protection',
+                is_temporary=False,
+                use_s3=settings.USE_S3_FOR_PROTECTION  # ✅ 환경 변수로 제어
+            )
+            for file in uploaded_files
+        ]
+        
+        job = self.create_job(user, media_files, job_type)
+        return job, [build_file_identifier(mf) for mf in media_files]
 
 
-class VideoProtectionView(APIView):
-    """영상 보호 API - S3 URL만 반환"""
+class VideoProtectionView(ProtectionUploadMixin, AsyncAPIView):
+    """
+    영상 보호 API - S3 URL만 반환
+    
+    async 뷰: AI 서버의 보호 처리(최대 10분)를 기다리는 동안 워커 스레드를 점유하지 않는다.
+    """
     
-    def post(self, request):
-        serializer = VideoProtectionRequestSerializer(data=request.data)
+    upload_field_types = {'file': 'video'}
+    
+    async def post(self, request):
+        serializer = VideoProtectionRequestSerializer(
+            data=await self.get_request_data(request)
+        )
         
-        if not serializer.is_valid():
+        if not await sync_to_async(serializer.is_valid)():
             return Response(
                 serializer.errors,
                 status=status.HTTP_400_BAD_REQUEST
@@ -143,89 +185,100 @@ class VideoProtectionView(APIView):
         file_service = FileService(request.user)
         
         try:
-            media_file = file_service.upload_file(
+            media_file = await sync_to_async(file_service.upload_file)(
                 uploaded_file=video,
                 file_type='video',
                 purpose='protection',
                 is_temporary=False,
                 use_s3=settings.USE_S3_FOR_PROTECTION  # ✅ S3에 저장
             )
-            
-            # ✅ S3 키 또는 로컬 경로 전달
-            if media_file.storage_type == 's3':
-                file_identifier = {
-                    'type': 's3',
-                    'file_id': media_file.file_id,
-                    's3_bucket': media_file.s3_bucket,
-                    's3_key': media_file.s3_key
-                }
-            else:
-                file_identifier = {
-                    'type': 'local',
-                    'file_id': media_file.file_id,
-                    'path': os.path.join(settings.MEDIA_ROOT, media_file.file_path)
-                }
-            
-            original_files_data = [{
-                'file_id': media_file.file_id,
-                'file_name': media_file.original_name,
-                'file_size': media_file.file_size,
-                'file_path': media_file.file_path,
-                'mime_type': media_file.mime_type,
-                'storage_type': media_file.storage_type
-            }]
-            
-            job = ProtectionJob.objects.create(
-                user=request.user,
-                job_type=job_type,
-                original_files=original_files_data,
-                job_status='pending',
-                progress_percentage=0.0
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        
+        return await self.protect_media_file(request, media_file, job_type)
+    
+    async def protect_media_file(self, request, media_file, job_type):
+        """저장된 영상 보호 처리 (분할 업로드 완료 API와 공유)"""
+        
+        job = await sync_to_async(self.create_job)(request.user, [media_file], job_type)
+        
+        protection_service = ProtectionService()
+        result = await protection_service.aprotect_video(
+            build_file_identifier(media_file),
+            job_type,
+            payload_size=media_file.file_size
+        )
+        
+        if not result['success']:
+            await sync_to_async(self.fail_job)(job, result.get('error'))
             
-            protection_service = ProtectionService()
-            result = protection_service.protect_video(file_identifier, job_type)
-            
-            if not result['success']:
-                job.job_status = 'failed'
-                job.error_message = result.get('error', '알 수 없는 오류')
-                job.save()
-                
-                return Response(
-                    {'error': result['error']},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-            
-            # ✅ S3 URL만 저장
-            protected_file_data = {
-                's3_url': result['s3_url'],  # ✅ S3 URL만!
-                'file_name': result['file_name']
-            }
-            
-            job.protected_files = [protected_file_data]
-            job.job_status = 'completed'
-            job.progress_percentage = 100.0
-            job.save()
-            
-            # ✅ S3 URL만 반환
-            return Response({
-                'job_id': job.job_id,
-                'status': 'completed',
-                's3_url': protected_file_data['s3_url'],  # ✅ 다운로드 URL
-                'file_name': protected_file_data['file_name']
-            }, status=status.HTTP_201_CREATED)
+            return Response(
+                {'error': result['error']},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        # ✅ S3 URL만 저장
+        protected_file_data = {
+            's3_url': result['s3_url'],  # ✅ S3 URL만!
+            'file_name': result['file_name']
+        }
+        
+        await sync_to_async(self.complete_job)(job, [protected_file_data])
+        
+        # ✅ S3 URL만 반환
+        return Response({
+            'job_id': job.job_id,
+            'status': 'completed',
+            's3_url': protected_file_data['s3_url'],  # ✅ 다운로드 URL
+            'file_name': protected_file_data['file_name']
+        }, status=status.HTTP_201_CREATED)
+
+
+class VideoUploadProtectionView(VideoProtectionView):
+    """분할 업로드 완료 후 영상 보호 API"""
+    
+    def use_streaming_upload(self, request):
+        return False  # 파일은 분할 업로드로 이미 받음
+    
+    async def post(self, request, upload_id):
+        serializer = VideoUploadProtectionRequestSerializer(
+            data=await self.get_request_data(request)
+        )
         
+        if not await sync_to_async(serializer.is_valid)():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            media_file = await sync_to_async(UploadSessionService(request.user).complete)(
+                upload_id,
+                purpose='protection',
+                is_temporary=False,
+                use_s3=settings.USE_S3_FOR_PROTECTION  # ✅ S3에 저장
+            )
         except ValueError as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        return await self.protect_media_file(
+            request,
+            media_file,
+            serializer.validated_data['job_type']
+        )
 
 
-class ProtectionJobListView(generics.ListAPIView):
+class ProtectionJobListView(ProjectedListMixin, generics.ListAPIView):
     """보호 작업 목록 조회 API"""
     
     serializer_class = ProtectionJobListSerializer
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         return ProtectionJob.objects.filter(user=self.request.user)
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from config.projection import SparseFieldsetMixin
 from .models import Report
 
 
@@ -92,7 +93,7 @@ class ReportSubmitSerializer(serializers.Serializer):
     )
     
 
-class ReportListSerializer(serializers.ModelSerializer):
+class ReportListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """신고 목록 Serializer (간단한 정보만)"""
     
     report_type_display = serializers.CharField(
@@ -12,6 +12,8 @@ from .serializers import (
 )
 from detection.models import AnalysisRecord
 from media_files.services import FileService
+from config.pagination import KeysetPagination
+from config.projection import ProjectedListMixin
 
 
 class ReportSubmitView(APIView):
@@ -108,10 +110,11 @@ class ReportSubmitView(APIView):
             )
 
 
-class ReportListView(generics.ListAPIView):
+class ReportListView(ProjectedListMixin, generics.ListAPIView):
     """신고 목록 조회 API"""
     
     serializer_class = ReportListSerializer
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         queryset = Report.objects.filter(user=self.request.user)
@@ -0,0 +1,22 @@
+# Generated by Django 5.1 on 2026-10-17 00:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zoom", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zoomcapture",
+            name="is_deduplicated",
+            field=models.BooleanField(
+                default=False,
+                help_text="직전 캡처와 거의 같아 이전 분석 결과를 재사용한 경우",
+                verbose_name="중복 프레임 여부",
+            ),
+        ),
+    ]
@@ -1,6 +1,8 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 
+from detection.models import AnalysisDailyRollup
+
 
 class ZoomSession(models.Model):
     """Zoom 세션"""
@@ -70,6 +72,11 @@ class ZoomCapture(models.Model):
     participant_count = models.IntegerField(verbose_name='참가자 수')
     capture_timestamp = models.DateTimeField(auto_now_add=True, verbose_name='캡처 시간')
     alert_triggered = models.BooleanField(default=False, verbose_name='경고 발생 여부')
+    is_deduplicated = models.BooleanField(
+        default=False,
+        verbose_name='중복 프레임 여부',
+        help_text='직전 캡처와 거의 같아 이전 분석 결과를 재사용한 경우'
+    )
     
     class Meta:
         db_table = 'zoom_captures'
@@ -82,4 +89,12 @@ class ZoomCapture(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.session.session_name} - {self.capture_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
\ No newline at end of file
+        return f"{self.session.session_name} - {self.capture_timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+    
+    def save(self, *args, **kwargs):
+        # ✅ 새 경고 캡처면 같은 트랜잭션에서 일별 집계 갱신
+        is_new = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_new:
+                AnalysisDailyRollup.increment_zoom_alerts([self])
\ No newline at end of file
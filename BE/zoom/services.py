@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import OrderedDict, deque
+
+from PIL import Image, UnidentifiedImageError
+from django.conf import settings
+
+
+def compute_dhash(image_file, hash_size=8):
+    """
+    이미지 difference hash(dHash) 계산
+
+    회색조로 (hash_size + 1) x hash_size 크기로 줄인 뒤 가로로 인접한 픽셀의
+    밝기 비교 결과를 비트로 만든다. 화면이 거의 같으면 해시도 거의 같다.
+
+    Args:
+        image_file: 이미지 파일 객체 (Django UploadedFile 등)
+        hash_size: 해시 한 변의 크기 (8이면 64비트)
+
+    Returns:
+        int | None: hash_size * hash_size 비트 해시 (읽을 수 없는 이미지면 None)
+    """
+    image_file.seek(0)
+    try:
+        with Image.open(image_file) as image:
+            image = image.convert('L').resize(
+                (hash_size + 1, hash_size),
+                Image.Resampling.LANCZOS
+            )
+            pixels = list(image.getdata())
+    except (UnidentifiedImageError, OSError):
+        # 깨졌거나 잘린 이미지 - 중복 확인 없이 일반 분석으로 넘김
+        return None
+    finally:
+        image_file.seek(0)
+
+    frame_hash = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            frame_hash <<= 1
+            if pixels[offset + col] > pixels[offset + col + 1]:
+                frame_hash |= 1
+    return frame_hash
+
+
+def hamming_distance(hash_a, hash_b):
+    """두 해시의 다른 비트 수"""
+    return (hash_a ^ hash_b).bit_count()
+
+
+class FrameHashIndex:
+    """
+    Zoom 세션별 최근 분석 프레임 인덱스 (프로세스 메모리)
+
+    세션마다 최근 분석한 프레임의 dHash와 판정 결과를 보관하고,
+    새 캡처가 해밍 거리 임계치 안에 있으면 이전 판정을 재사용한다.
+    """
+
+    def __init__(self, max_distance=None, window=None, max_age=None, max_sessions=None):
+        self.max_distance = settings.ZOOM_DEDUP_MAX_DISTANCE if max_distance is None else max_distance
+        self.window = window or settings.ZOOM_DEDUP_WINDOW
+        self.max_age = max_age or settings.ZOOM_DEDUP_MAX_AGE
+        self.max_sessions = max_sessions or settings.ZOOM_DEDUP_MAX_SESSIONS
+
+        self._lock = threading.Lock()
+        self._sessions = OrderedDict()  # session_id -> deque[(기록 시각, 해시, 판정)]
+
+    def find_similar(self, session_id, frame_hash):
+        """
+        비슷한 최근 프레임의 판정 조회
+
+        Returns:
+            dict: 이전 판정 ({'record_id', 'analysis_result', 'confidence_score'}),
+                  없으면 None
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            frames = self._sessions.get(session_id)
+            if not frames:
+                return None
+
+            self._sessions.move_to_end(session_id)
+
+            best = None
+            best_distance = None
+            for recorded_at, known_hash, verdict in reversed(frames):
+                if now - recorded_at > self.max_age:
+                    continue
+                distance = hamming_distance(frame_hash, known_hash)
+                if distance <= self.max_distance and (
+                    best_distance is None or distance < best_distance
+                ):
+                    best, best_distance = verdict, distance
+
+            return dict(best, distance=best_distance) if best else None
+
+    def add(self, session_id, frame_hash, verdict):
+        """분석한 프레임 등록"""
+        with self._lock:
+            frames = self._sessions.get(session_id)
+            if frames is None:
+                frames = deque(maxlen=self.window)
+                self._sessions[session_id] = frames
+
+            frames.append((time.monotonic(), frame_hash, verdict))
+            self._sessions.move_to_end(session_id)
+
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def forget(self, session_id, record_id=None):
+        """세션 인덱스 삭제 (record_id를 주면 해당 판정만 삭제)"""
+        with self._lock:
+            if record_id is None:
+                self._sessions.pop(session_id, None)
+                return
+
+            frames = self._sessions.get(session_id)
+            if frames:
+                kept = [f for f in frames if f[2]['record_id'] != record_id]
+                frames.clear()
+                frames.extend(kept)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_frame_index():
+    """프로세스 전역 프레임 인덱스 반환"""
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = FrameHashIndex()
+    return _index
@@ -1,3 +1,82 @@
-from django.test import TestCase
+import io
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+from PIL import Image, ImageDraw
+
+from .services import FrameHashIndex, compute_dhash, hamming_distance
+
+
+def make_frame(shift=0, noise=0):
+    """왼쪽에서 오른쪽으로 밝아지는 화면 + 사각형 (shift만큼 이동, noise만큼 점 추가)"""
+    image = Image.new('L', (320, 240))
+    draw = ImageDraw.Draw(image)
+    for x in range(320):
+        draw.line([(x, 0), (x, 239)], fill=x * 255 // 320)
+    draw.rectangle([100 + shift, 60, 180 + shift, 160], fill=0)
+    for i in range(noise):
+        draw.point((i * 7 % 320, i * 13 % 240), fill=255)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    buffer.seek(0)
+    return buffer
+
+
+class DHashTests(SimpleTestCase):
+    """프레임 dHash"""
+
+    def test_same_frame_has_same_hash(self):
+        self.assertEqual(compute_dhash(make_frame()), compute_dhash(make_frame()))
+
+    def test_small_change_is_near_and_different_scene_is_far(self):
+        base = compute_dhash(make_frame())
+        noisy = compute_dhash(make_frame(noise=20))
+        moved = compute_dhash(make_frame(shift=120))
+
+        self.assertLessEqual(hamming_distance(base, noisy), 5)
+        self.assertGreater(hamming_distance(base, moved), 5)
+
+    def test_rewinds_file(self):
+        frame = make_frame()
+        compute_dhash(frame)
+        self.assertEqual(frame.tell(), 0)
+
+    def test_undecodable_or_truncated_image_has_no_hash(self):
+        truncated = io.BytesIO(make_frame().getvalue()[:200])
+
+        for frame in (io.BytesIO(b'not an image'), truncated):
+            self.assertIsNone(compute_dhash(frame))
+            self.assertEqual(frame.tell(), 0)
+
+
+@override_settings(ZOOM_DEDUP_WINDOW=5, ZOOM_DEDUP_MAX_AGE=60, ZOOM_DEDUP_MAX_SESSIONS=10)
+class FrameHashIndexTests(SimpleTestCase):
+    """중복 프레임 임계치"""
+
+    def setUp(self):
+        self.index = FrameHashIndex(max_distance=5)
+        self.verdict = {'record_id': 1, 'analysis_result': 'safe', 'confidence_score': 90.0}
+
+    def test_match_within_threshold(self):
+        self.index.add(1, 0b0, self.verdict)
+
+        self.assertEqual(self.index.find_similar(1, 0b11111)['distance'], 5)
+        self.assertIsNone(self.index.find_similar(1, 0b111111))
+
+    def test_sessions_are_separate(self):
+        self.index.add(1, 0b0, self.verdict)
+        self.assertIsNone(self.index.find_similar(2, 0b0))
+
+    def test_closest_verdict_wins(self):
+        self.index.add(1, 0b1111, self.verdict)
+        self.index.add(1, 0b1, dict(self.verdict, record_id=2))
+        self.assertEqual(self.index.find_similar(1, 0b0)['record_id'], 2)
+
+    def test_expired_and_forgotten_frames_are_ignored(self):
+        self.index.add(1, 0b0, self.verdict)
+        self.index.forget(1, record_id=1)
+        self.assertIsNone(self.index.find_similar(1, 0b0))
+
+        self.index.add(1, 0b0, self.verdict)
+        self.index.max_age = -1
+        self.assertIsNone(self.index.find_similar(1, 0b0))
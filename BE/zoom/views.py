@@ -1,9 +1,9 @@
 from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.utils import timezone
-import os
 
 from .models import ZoomSession, ZoomCapture
 from .serializers import (
@@ -15,6 +15,11 @@ from .serializers import (
 from detection.models import AnalysisRecord
 from detection.services import AIModelService
 from media_files.services import FileService
+from media_files.uploadhandlers import StreamingUploadMixin
+from config.admission import AdmissionControlMixin
+from config.async_views import AsyncAPIView
+from config.pagination import KeysetPagination
+from .services import compute_dhash, get_frame_index
 
 
 class ZoomSessionStartView(APIView):
@@ -45,13 +50,25 @@ class ZoomSessionStartView(APIView):
         )
 
 
-class ZoomCaptureView(APIView):
-    """Zoom 캡처 분석 API"""
+class ZoomCaptureView(AdmissionControlMixin, StreamingUploadMixin, AsyncAPIView):
+    """
+    Zoom 캡처 분석 API
     
-    def post(self, request, session_id):
-        serializer = ZoomCaptureRequestSerializer(data=request.data)
+    async 뷰: AI 서버 응답을 기다리는 동안 워커 스레드를 점유하지 않는다.
+    ORM·파일 작업은 스레드에서 실행한다.
+    """
+    
+    upload_field_types = {'screenshot': 'screenshot'}
+    upload_purpose = 'zoom'
+    admission_scope = 'zoom'
+    admission_lane = 'zoom'
+    
+    async def post(self, request, session_id):
+        serializer = ZoomCaptureRequestSerializer(
+            data=await self.get_request_data(request)
+        )
         
-        if not serializer.is_valid():
+        if not await sync_to_async(serializer.is_valid)():
             return Response(
                 serializer.errors,
                 status=status.HTTP_400_BAD_REQUEST
@@ -62,7 +79,7 @@ class ZoomCaptureView(APIView):
         
         # 세션 확인
         try:
-            session = ZoomSession.objects.get(
+            session = await ZoomSession.objects.aget(
                 session_id=session_id,
                 user=request.user,
                 session_status='active'
@@ -73,12 +90,25 @@ class ZoomCaptureView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
+        # ✅ 직전 캡처와 거의 같은 화면이면 이전 판정 재사용 (AI 호출 생략)
+        frame_index = get_frame_index()
+        frame_hash = None
+        if settings.ZOOM_DEDUP_ENABLED:
+            frame_hash = await sync_to_async(compute_dhash)(screenshot)
+            similar = frame_index.find_similar(session.session_id, frame_hash) if frame_hash is not None else None
+            if similar:
+                response = await sync_to_async(self._reuse_verdict)(
+                    request, session, similar, participant_count
+                )
+                if response:
+                    return response
+        
         # ✅ FileService 사용
         file_service = FileService(request.user)
         
         try:
             # ✅ 통합 파일 업로드
-            media_file = file_service.upload_file(
+            media_file = await sync_to_async(file_service.upload_file)(
                 uploaded_file=screenshot,
                 file_type='screenshot',
                 purpose='zoom',
@@ -87,10 +117,9 @@ class ZoomCaptureView(APIView):
                 use_s3=False
             )
             
-            # AI 분석
-            ai_service = AIModelService()
-            full_path = os.path.join(settings.MEDIA_ROOT, media_file.file_path)
-            result = ai_service.analyze_image(full_path)
+            # AI 분석 (실시간 캡처는 zoom 레인으로 영상/보호 작업보다 먼저 처리)
+            ai_service = AIModelService(lane='zoom')
+            result = await ai_service.aanalyze_image(media_file)
             
             if not result['success']:
                 return Response(
@@ -98,50 +127,26 @@ class ZoomCaptureView(APIView):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
             
-            # 분석 기록 저장
-            record = AnalysisRecord.objects.create(
-                user=request.user,
-                analysis_type='zoom',
-                file_name=media_file.original_name,
-                file_size=media_file.file_size,
-                file_format=media_file.file_format,
-                original_path=media_file.file_path,
-                analysis_result=result['analysis_result'],
-                confidence_score=result['confidence_score'],
-                processing_time=result['processing_time'],
-                ai_model_version=result['ai_model_version']
+            record, capture = await sync_to_async(self.save_capture)(
+                request.user, session, media_file, participant_count, result
             )
+            is_deepfake = capture.alert_triggered
             
-            # ✅ 관계 연결
-            media_file.related_model = 'AnalysisRecord'
-            media_file.related_record_id = record.record_id
-            media_file.save()
-            
-            # Zoom 캡처 기록
-            is_deepfake = result['analysis_result'] in ['suspicious', 'deepfake']
-            
-            capture = ZoomCapture.objects.create(
-                session=session,
-                record=record,
-                participant_count=participant_count,
-                alert_triggered=is_deepfake
-            )
-            
-            # 세션 통계 업데이트
-            session.total_captures += 1
-            if is_deepfake:
-                session.suspicious_detections += 1
-            session.save()
-            
-            # ✅ 임시 파일 즉시 삭제
-            file_service.delete_file(media_file.file_id, hard_delete=True)
+            # ✅ 이후 비슷한 프레임이 판정을 재사용할 수 있도록 등록
+            if frame_hash is not None:
+                frame_index.add(session.session_id, frame_hash, {
+                    'record_id': record.record_id,
+                    'analysis_result': result['analysis_result'],
+                    'confidence_score': float(result['confidence_score'])
+                })
             
             return Response({
                 'capture_id': capture.capture_id,
                 'is_deepfake': is_deepfake,
                 'confidence_score': float(result['confidence_score']),
                 'analysis_result': result['analysis_result'],
-                'alert_triggered': is_deepfake
+                'alert_triggered': is_deepfake,
+                'is_deduplicated': False
             }, status=status.HTTP_201_CREATED)
         
         except ValueError as e:
@@ -149,6 +154,90 @@ class ZoomCaptureView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
+    
+    def save_capture(self, user, session, media_file, participant_count, result):
+        """분석 기록·캡처 저장, 세션 통계 갱신, 임시 파일 삭제"""
+        
+        file_service = FileService(user)
+        
+        # 분석 기록 저장
+        record = AnalysisRecord.objects.create(
+            user=user,
+            analysis_type='zoom',
+            file_name=media_file.original_name,
+            file_size=media_file.file_size,
+            file_format=media_file.file_format,
+            original_path=media_file.file_path,
+            analysis_result=result['analysis_result'],
+            confidence_score=result['confidence_score'],
+            processing_time=result['processing_time'],
+            ai_model_version=result['ai_model_version']
+        )
+        
+        # ✅ 관계 연결
+        media_file.related_model = 'AnalysisRecord'
+        media_file.related_record_id = record.record_id
+        media_file.save()
+        
+        # Zoom 캡처 기록
+        is_deepfake = result['analysis_result'] in ['suspicious', 'deepfake']
+        
+        capture = ZoomCapture.objects.create(
+            session=session,
+            record=record,
+            participant_count=participant_count,
+            alert_triggered=is_deepfake
+        )
+        
+        # 세션 통계 업데이트
+        session.total_captures += 1
+        if is_deepfake:
+            session.suspicious_detections += 1
+        session.save()
+        
+        # ✅ 임시 파일 즉시 삭제
+        file_service.delete_file(media_file.file_id, hard_delete=True)
+        
+        return record, capture
+    
+    def _reuse_verdict(self, request, session, verdict, participant_count):
+        """
+        중복 프레임 처리: 이전 분석 기록을 가리키는 캡처만 기록
+        
+        이전 분석 기록이 삭제됐으면 None을 반환해 새로 분석하도록 한다.
+        """
+        record_id = verdict['record_id']
+        if not AnalysisRecord.objects.filter(
+            record_id=record_id,
+            user=request.user
+        ).exists():
+            get_frame_index().forget(session.session_id, record_id)
+            return None
+        
+        is_deepfake = verdict['analysis_result'] in ['suspicious', 'deepfake']
+        
+        capture = ZoomCapture.objects.create(
+            session=session,
+            record_id=record_id,
+            participant_count=participant_count,
+            alert_triggered=is_deepfake,
+            is_deduplicated=True
+        )
+        
+        # 세션 통계 업데이트
+        session.total_captures += 1
+        if is_deepfake:
+            session.suspicious_detections += 1
+        session.save()
+        
+        return Response({
+            'capture_id': capture.capture_id,
+            'is_deepfake': is_deepfake,
+            'confidence_score': verdict['confidence_score'],
+            'analysis_result': verdict['analysis_result'],
+            'alert_triggered': is_deepfake,
+            'is_deduplicated': True
+        }, status=status.HTTP_201_CREATED)
 
 
 class ZoomSessionEndView(APIView):
@@ -172,6 +261,9 @@ class ZoomSessionEndView(APIView):
         session.session_status = 'completed'
         session.save()
         
+        # ✅ 세션 프레임 인덱스 정리
+        get_frame_index().forget(session.session_id)
+        
         return Response(
             ZoomSessionSerializer(session).data,
             status=status.HTTP_200_OK
@@ -182,6 +274,7 @@ class ZoomSessionListView(generics.ListAPIView):
     """Zoom 세션 목록 조회 API"""
     
     serializer_class = ZoomSessionSerializer
+    pagination_class = KeysetPagination
     
     def get_queryset(self):
         queryset = ZoomSession.objects.filter(user=self.request.user)
@@ -221,6 +314,9 @@ class ZoomSessionReportView(APIView):
         # 캡처 목록
         captures = ZoomCapture.objects.filter(session=session).select_related('record')
         
+        # ✅ 중복 프레임으로 AI 분석을 건너뛴 캡처 수
+        deduplicated = sum(1 for c in captures if c.is_deduplicated)
+        
         # 요약 정보
         summary = {
             'total_captures': session.total_captures,
@@ -229,6 +325,11 @@ class ZoomSessionReportView(APIView):
                 (session.suspicious_detections / session.total_captures * 100)
                 if session.total_captures > 0 else 0, 2
             ),
+            'deduplicated_captures': deduplicated,
+            'skip_rate': round(
+                (deduplicated / len(captures) * 100)
+                if len(captures) > 0 else 0, 2
+            ),
             'duration_seconds': session.duration,
             'average_participants': round(
                 sum([c.participant_count for c in captures]) / len(captures)